@@ -8,9 +8,51 @@
 #  * Export fix: zero-origin mapper (no CTM needed)
 # --------------------------------------------------------------
 
-import ui, math, os, datetime, console, time, weakref
-from collections.abc import Sequence
-from objc_util import ObjCClass, on_main_thread
+import math, os, io, time, copy, struct, zlib, itertools
+from bisect import bisect_left
+from array import array
+from collections import OrderedDict, Counter
+from contextlib import contextmanager
+from functools import lru_cache
+try:  # Pythonista; headless boxes render through RasterBackend / SVGBackend
+    import ui
+except ImportError:
+    ui = None
+np = None  # NumPy once _numpy() has looked for it
+
+_NUMPY_LOOKED_UP = False
+
+def _numpy():
+    """NumPy (optional: vectorized sampling, raster blends) on first use, else None.
+
+    Importing it costs more than the rest of startup together and the
+    on-screen path never needs it, so it is only looked up here.
+    """
+    global np, _NUMPY_LOOKED_UP
+    if not _NUMPY_LOOKED_UP:
+        _NUMPY_LOOKED_UP = True
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    return np
+
+def _console():
+    import console  # Pythonista only; imported on first use
+    return console
+
+def _objc_util():
+    import objc_util  # Pythonista only; imported on first use
+    return objc_util
+
+def _dialogs():
+    import dialogs  # Pythonista only; imported on first use
+    return dialogs
+
+def _timestamp():
+    """``YYYYmmdd_HHMMSS`` for export file names."""
+    import datetime  # only exports need it; imported on first use
+    return datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
 
 # ===== Appearance =====
 MARGIN = 18
@@ -19,232 +61,3427 @@ FONT_TITLE   = ('<System-Bold>', 24)
 FONT_LABEL   = ('<System>', 20)
 FONT_SERIES  = ('<System-Bold>', 20)
 SPIRAL_WIDTH_PT = 4.0
+SPIRAL_USE_ARCS = True   # one native arc per quarter instead of sampled polylines
+
+SHOW_GRID = True
+SHOW_TINY_1x1_LABELS = True
+
+# Level of detail: below these sizes a feature is illegible, so it is skipped
+GRID_MIN_SPACING_PX = 2.0   # grid cell size in device pixels
+LABEL_MIN_SQUARE_PT = 6.0   # square size in points that still gets a label
+
+PALETTES = [
+    {
+        'name': 'Sunrise Fields',
+        'background': (0.98, 0.98, 1.0),
+        'spiral': (1.00, 0.45, 0.10),
+        'label': (1.00, 0.45, 0.10),
+        'title': (0.05, 0.20, 0.45),
+        'border': (0.14, 0.18, 0.45),
+        'tints': {
+            1:  (0.98, 0.90, 0.60, 0.75),
+            2:  (0.95, 0.70, 0.50, 0.75),
+            3:  (0.70, 0.85, 0.98, 0.75),
+            5:  (0.80, 0.95, 0.80, 0.75),
+            8:  (0.95, 0.85, 0.95, 0.75),
+            13: (0.90, 0.95, 0.99, 0.75),
+            21: (0.99, 0.98, 0.80, 0.70),
+        }
+    },
+    {
+        'name': 'Ocean Shell',
+        'background': (0.95, 0.98, 1.0),
+        'spiral': (0.00, 0.46, 0.54),
+        'label': (0.00, 0.46, 0.54),
+        'title': (0.02, 0.24, 0.34),
+        'border': (0.08, 0.18, 0.36),
+        'tints': {
+            1:  (0.88, 0.96, 0.99, 0.78),
+            2:  (0.76, 0.90, 0.95, 0.78),
+            3:  (0.70, 0.84, 0.92, 0.78),
+            5:  (0.82, 0.93, 0.95, 0.78),
+            8:  (0.94, 0.98, 0.99, 0.78),
+            13: (0.80, 0.92, 0.92, 0.78),
+            21: (0.90, 0.97, 0.97, 0.78),
+        }
+    },
+    {
+        'name': 'Forest Canopy',
+        'background': (0.97, 0.99, 0.96),
+        'spiral': (0.25, 0.55, 0.18),
+        'label': (0.25, 0.45, 0.15),
+        'title': (0.10, 0.30, 0.12),
+        'border': (0.20, 0.42, 0.24),
+        'tints': {
+            1:  (0.90, 0.98, 0.87, 0.75),
+            2:  (0.84, 0.95, 0.82, 0.75),
+            3:  (0.80, 0.93, 0.76, 0.75),
+            5:  (0.86, 0.96, 0.85, 0.75),
+            8:  (0.92, 0.98, 0.90, 0.75),
+            13: (0.88, 0.96, 0.86, 0.75),
+            21: (0.94, 0.98, 0.92, 0.75),
+        }
+    },
+]
+
+# ===== Fibonacci numbers =====
+FIB_CACHE_SIZE = 4096     # memoized (F(n), F(n+1)) pairs and formatted labels
+LABEL_MAX_DIGITS = 7      # longer terms are labelled in scientific notation
+FOOTER_TERMS = 10         # terms the footer spells out before eliding
+
+@lru_cache(maxsize=FIB_CACHE_SIZE)
+def fib_pair(n):
+    """``(F(n), F(n+1))`` by fast doubling: O(log n) big-int multiplies."""
+    if n == 0:
+        return 0, 1
+    a, b = fib_pair(n >> 1)
+    c = a * (2 * b - a)   # F(2k)
+    d = a * a + b * b     # F(2k + 1)
+    return (d, c + d) if n & 1 else (c, d)
+
+def fib(n):
+    """F(n) as an exact int (F(0) = 0, F(1) = F(2) = 1)."""
+    return fib_pair(n)[0]
+
+def _log10(v):
+    """log10 of a positive int of any size (no decimal conversion)."""
+    shift = max(0, v.bit_length() - 64)
+    return math.log10(v >> shift) + shift * math.log10(2)
+
+@lru_cache(maxsize=FIB_CACHE_SIZE)
+def fib_label(n, style='auto', max_digits=LABEL_MAX_DIGITS):
+    """F(n) formatted for display.
+
+    ``auto`` spells out terms up to ``max_digits`` digits and switches to
+    three significant figures (``1.49e7``) beyond; ``sci`` always uses the
+    short form and ``digits`` gives the digit count (``209 digits``).  Huge
+    terms never go through ``str()``, which is quadratic and capped by
+    ``sys.set_int_max_str_digits``.
+    """
+    v = fib(n)
+    if v < 10 ** max_digits and style == 'auto':
+        return str(v)
+    if v < 10:
+        return str(v) if style != 'digits' else '1 digit'
+    lg = _log10(v)
+    exp = int(lg)
+    if style == 'digits':
+        return f'{exp + 1} digits'
+    mant = round(10 ** (lg - exp), 2)
+    if mant >= 10:
+        mant, exp = mant / 10, exp + 1
+    return f'{mant:.2f}e{exp}'
+
+def fib_series(last, shown=FOOTER_TERMS):
+    """Footer text for F(0)..F(last): all of it when short, else the head and tail."""
+    if last < shown:
+        terms = [fib_label(i) for i in range(last + 1)]
+    else:
+        terms = [fib_label(i) for i in range(shown - 4)] + ['…'] + \
+                [fib_label(i) for i in (last - 1, last)]
+    return ', '.join(terms) + '...'
+
+# ===== Precomputed geometry =====
+GEOMETRY_CACHE_FILE = 'fibonacci_geometry.cache'
+GEOMETRY_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), GEOMETRY_CACHE_FILE)
+GEOMETRY_CACHE_VERSION = 1   # bump whenever the tiling or the file layout changes
+UNIT_ARC_SAMPLES = 256       # cos/sin samples per quarter turn
+
+_GEOMETRY_MAGIC = b'FIBG'
+_GEOMETRY_HEADER = struct.Struct('<4sHHHH16s')  # magic, version, terms, samples, columns, text backend
+_GEOMETRY_COLUMN = struct.Struct('<12scxxxII')  # name, array typecode, byte offset, item count
+
+class GeometryCache:
+    """Default-board geometry memory-mapped from a file written by an earlier launch.
+
+    The file is a header, a column directory and raw 8-byte aligned columns:
+    the tiling's squares, arcs and prefix lengths (:meth:`FibTiling.columns`),
+    the unit quarter-turn table behind :func:`unit_arc_point`, and the text
+    sizes one backend measured for the first frame.  Columns are read in
+    place through ``memoryview`` casts, so loading is an ``mmap`` and a few
+    struct unpacks and nothing is recomputed.
+    """
+    def __init__(self, buf):
+        magic, version, terms, samples, count, backend = _GEOMETRY_HEADER.unpack_from(buf)
+        if magic != _GEOMETRY_MAGIC or version != GEOMETRY_CACHE_VERSION or samples != UNIT_ARC_SAMPLES:
+            raise ValueError('stale or foreign geometry cache')
+        self.terms = terms
+        self.backend = backend.rstrip(b'\0').decode('ascii')  # class that measured the text
+        self._buf = buf
+        view = memoryview(buf)
+        self.columns = {}
+        for i in range(count):
+            name, code, offset, n = _GEOMETRY_COLUMN.unpack_from(
+                buf, _GEOMETRY_HEADER.size + i * _GEOMETRY_COLUMN.size)
+            code = code.decode('ascii')
+            size = array(code).itemsize
+            self.columns[name.rstrip(b'\0').decode('ascii')] = view[offset:offset + n * size].cast(code)
+
+    def tiling(self):
+        return FibTiling.from_columns(self.columns)
+
+    @property
+    def unit_arc(self):
+        return self.columns['unit_arc']
+
+    def text_sizes(self):
+        """``{(text, font): (w, h)}`` as measured by :attr:`backend`."""
+        raw, wh = bytes(self.columns['text']).decode('utf-8'), self.columns['text_wh']
+        sizes = {}
+        for i, record in enumerate(raw.split('\x1f') if raw else ()):
+            face, pt, text = record.split('\x1e', 2)
+            font = (face, int(pt) if pt.isdigit() else float(pt))
+            sizes[(text, font)] = (wh[2 * i], wh[2 * i + 1])
+        return sizes
+
+def load_geometry_cache(path=None):
+    """Map the geometry cache at ``path``; None when it is missing, stale or unreadable."""
+    import mmap
+    try:
+        with open(path or GEOMETRY_CACHE_PATH, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return GeometryCache(buf)
+    except (OSError, ValueError, struct.error):
+        return None
+
+def write_geometry_cache(path, tiling, text_sizes=None, backend=''):
+    """Write ``tiling``, the unit arc table and ``text_sizes`` for :class:`GeometryCache`.
+
+    ``text_sizes`` maps ``(text, font)`` to ``(w, h)`` as measured by the
+    ``backend`` class named.  The file is written beside ``path`` and moved
+    into place, so a launch never maps a half-written one.
+    """
+    keys = list(text_sizes or ())
+    columns = dict(tiling.columns())
+    columns['unit_arc'] = array('d', unit_arc())
+    columns['text'] = array('B', '\x1f'.join(f'{font[0]}\x1e{font[1]}\x1e{text}'
+                                             for text, font in keys).encode('utf-8'))
+    columns['text_wh'] = array('d', [v for key in keys for v in text_sizes[key]])
+    out = bytearray(_GEOMETRY_HEADER.pack(_GEOMETRY_MAGIC, GEOMETRY_CACHE_VERSION, tiling.terms,
+                                          UNIT_ARC_SAMPLES, len(columns), backend.encode('ascii')))
+    out += bytes(len(columns) * _GEOMETRY_COLUMN.size)
+    for i, (name, col) in enumerate(columns.items()):
+        out += bytes(-len(out) % 8)
+        _GEOMETRY_COLUMN.pack_into(out, _GEOMETRY_HEADER.size + i * _GEOMETRY_COLUMN.size,
+                                   name.encode('ascii'), col.typecode.encode('ascii'), len(out), len(col))
+        out += col.tobytes()
+    folder, name = os.path.split(os.path.abspath(path))
+    tmp = os.path.join(folder, '.' + name)
+    with open(tmp, 'wb') as f:
+        f.write(out)
+    os.replace(tmp, path)
+    return path
+
+_GEOMETRY = False  # not looked up yet
+
+def geometry_cache():
+    """This launch's :class:`GeometryCache`, mapped on first use (None without one)."""
+    global _GEOMETRY
+    if _GEOMETRY is False:
+        _GEOMETRY = load_geometry_cache()
+    return _GEOMETRY
+
+_UNIT_ARC = None
+
+def unit_arc():
+    """Interleaved cos/sin of ``j / UNIT_ARC_SAMPLES`` of a quarter turn, ``j = 0..N``."""
+    global _UNIT_ARC
+    if _UNIT_ARC is None:
+        cache = geometry_cache()
+        if cache is not None:
+            _UNIT_ARC = cache.unit_arc
+        else:
+            table = array('d')
+            for j in range(UNIT_ARC_SAMPLES + 1):
+                t = math.pi / 2 * j / UNIT_ARC_SAMPLES
+                table.extend((math.cos(t), math.sin(t)))
+            _UNIT_ARC = table
+    return _UNIT_ARC
+
+def unit_arc_point(t):
+    """``(cos t, sin t)`` from the quarter-turn table, without trigonometry.
+
+    Quarter turns map onto the table by symmetry and samples are joined by
+    chords, so the point is at most 1 − cos(π / 4N) ≈ 5e-6 inside the unit
+    circle (exact at multiples of 90°).
+    """
+    table, n = unit_arc(), UNIT_ARC_SAMPLES
+    u = t / (math.pi / 2)
+    q = math.floor(u)
+    f = (u - q) * n
+    j = min(int(f), n - 1)
+    f -= j
+    c0, s0, c1, s1 = table[2 * j], table[2 * j + 1], table[2 * j + 2], table[2 * j + 3]
+    c, s = c0 + (c1 - c0) * f, s0 + (s1 - s0) * f
+    q %= 4
+    if q == 0:
+        return c, s
+    if q == 1:
+        return -s, c
+    if q == 2:
+        return -c, -s
+    return s, -c
+
+# ===== Fibonacci tiling engine (y-up grid) =====
+BOARD_TERMS = 8          # 1, 1, 2, 3, 5, 8, 13, 21 → the classic 34×21 poster
+MAX_TILING_TERMS = 90    # coordinates are int64; F(91) is the widest board that fits
+
+# Placement cycle for square i: the side of the current bounding box it is
+# added on, and which of its corners is the quarter-arc center.  The first
+# square counts as "south" so the spiral starts at 180° and turns +90° CCW.
+_SIDE_S, _SIDE_E, _SIDE_N, _SIDE_W = range(4)
+
+class FibTiling:
+    """Squares and spiral arcs for the first ``terms`` Fibonacci numbers.
+
+    Generation is a single linear pass that grows a bounding box by one
+    square per term, then shifts everything so the board's lower-left corner
+    is (0, 0).  Per-square data lives in parallel ``array('q')`` columns
+    (smallest square first) so 40+ term posters stay compact and the draw
+    loops can ``zip`` plain ints.
+    """
+    __slots__ = ('terms', 'width', 'height', 'size', 'x', 'y',
+                 'cx', 'cy', 'sx', 'sy', 'divider', 'arc_params', 'arc_cum')
+
+    def __init__(self, terms=BOARD_TERMS):
+        if not 1 <= terms <= MAX_TILING_TERMS:
+            raise ValueError(f'terms must be between 1 and {MAX_TILING_TERMS}')
+        self.terms = terms
+        size, xs, ys = array('q'), array('q'), array('q')
+        cxs, cys, sxs, sys_ = array('q'), array('q'), array('q'), array('q')
+        a, b = 1, 1
+        x0 = y0 = x1 = y1 = 0
+        for i in range(terms):
+            s, side = a, i % 4
+            if i == 0:
+                x, y = 0, 0
+            elif side == _SIDE_E:
+                x, y = x1, y0
+            elif side == _SIDE_N:
+                x, y = x0, y1
+            elif side == _SIDE_W:
+                x, y = x0 - s, y0
+            else:
+                x, y = x0, y0 - s
+            x0, y0 = min(x0, x), min(y0, y)
+            x1, y1 = max(x1, x + s), max(y1, y + s)
+            if side == _SIDE_S:
+                cx, cy, sx, sy = x + s, y + s, x, y + s
+            elif side == _SIDE_E:
+                cx, cy, sx, sy = x, y + s, x, y
+            elif side == _SIDE_N:
+                cx, cy, sx, sy = x, y, x + s, y
+            else:
+                cx, cy, sx, sy = x + s, y, x + s, y + s
+            size.append(s)
+            xs.append(x)
+            ys.append(y)
+            cxs.append(cx)
+            cys.append(cy)
+            sxs.append(sx)
+            sys_.append(sy)
+            a, b = b, a + b
+        for col, off in ((xs, x0), (cxs, x0), (sxs, x0), (ys, y0), (cys, y0), (sys_, y0)):
+            for i in range(terms):
+                col[i] -= off
+        self.size, self.x, self.y = size, xs, ys
+        self.cx, self.cy, self.sx, self.sy = cxs, cys, sxs, sys_
+        self.width, self.height = x1 - x0, y1 - y0
+
+        # The largest square is split off from the rest by one divider line.
+        s, x, y, side = size[-1], xs[-1], ys[-1], (terms - 1) % 4
+        if terms == 1:
+            self.divider = None
+        elif side in (_SIDE_E, _SIDE_W):
+            dx = x if side == _SIDE_E else x + s
+            self.divider = ((dx, 0), (dx, self.height))
+        else:
+            dy = y if side == _SIDE_N else y + s
+            self.divider = ((0, dy), (self.width, dy))
+
+        # Closed-form arcs: (cx, cy, r, a0, sweep) plus an arc-length prefix.
+        self.arc_params = [(cxs[i], cys[i], float(size[i]),
+                            math.radians(180 + 90 * (i % 4)), math.pi / 2)
+                           for i in range(terms)]
+        cum = [0.0]
+        for i in range(terms):
+            cum.append(cum[-1] + size[i] * math.pi / 2)
+        self.arc_cum = cum
+
+    def columns(self):
+        """Everything :meth:`from_columns` needs, as flat typed ``array`` columns."""
+        div = self.divider
+        board = [self.width, self.height, div is not None] + (list(div[0] + div[1]) if div else [0] * 4)
+        return {'size': self.size, 'x': self.x, 'y': self.y, 'cx': self.cx, 'cy': self.cy,
+                'sx': self.sx, 'sy': self.sy, 'board': array('q', board),
+                'arcs': array('d', [v for arc in self.arc_params for v in arc[2:]]),  # r, a0, sweep
+                'arc_cum': array('d', self.arc_cum)}
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Rebuild a tiling from :meth:`columns` (e.g. the geometry cache) without regenerating it."""
+        t = cls.__new__(cls)
+        for name in ('size', 'x', 'y', 'cx', 'cy', 'sx', 'sy'):
+            setattr(t, name, array('q', columns[name]))
+        t.terms = len(t.size)
+        t.width, t.height, has_divider, x0, y0, x1, y1 = columns['board']
+        t.divider = ((x0, y0), (x1, y1)) if has_divider else None
+        arcs = columns['arcs']
+        t.arc_params = [(cx, cy) + tuple(arcs[3 * i:3 * i + 3])
+                        for i, (cx, cy) in enumerate(zip(t.cx, t.cy))]
+        t.arc_cum = list(columns['arc_cum'])
+        return t
+
+    @property
+    def spiral_length(self):
+        """Total spiral length in grid units (uniform scale keeps ratios on screen)."""
+        return self.arc_cum[-1]
+
+    def squares(self):
+        """Legacy ``(name, size, x, y)`` tuples, largest first; twin 1s are '1a'/'1b'."""
+        out = []
+        for i in reversed(range(self.terms)):
+            s = self.size[i]
+            name = str(s) if s != 1 or self.terms == 1 else ('1a', '1b')[min(i, 1)]
+            out.append((name, s, self.x[i], self.y[i]))
+        return out
+
+    def spiral_arcs(self):
+        """Legacy ``(center, start, sweep_deg)`` tuples, innermost first."""
+        return [((self.cx[i], self.cy[i]), (self.sx[i], self.sy[i]), +90)
+                for i in range(self.terms)]
+
+    def arc_cut(self, progress):
+        """Return ``(i, frac)``: arcs before ``i`` are whole, arc ``i`` is drawn to ``frac``."""
+        cum = self.arc_cum
+        target = cum[-1] * max(0.0, min(1.0, progress))
+        i = min(max(1, bisect_left(cum, target)) - 1, self.terms - 1)
+        length = cum[i + 1] - cum[i]
+        return i, ((target - cum[i]) / length if length else 1.0)
+
+_TILINGS = {}
+
+def get_tiling(terms=BOARD_TERMS):
+    """Return the shared (immutable by convention) tiling for ``terms``."""
+    tiling = _TILINGS.get(terms)
+    if tiling is None:
+        cache = geometry_cache() if terms == BOARD_TERMS else None
+        if cache is not None and cache.terms == terms:
+            tiling = _TILINGS[terms] = cache.tiling()
+        else:
+            tiling = _TILINGS[terms] = FibTiling(terms)
+    return tiling
+
+DEFAULT_TILING = get_tiling(BOARD_TERMS)
+SQUARES = DEFAULT_TILING.squares()
+W, H = DEFAULT_TILING.width, DEFAULT_TILING.height  # default board size in grid units
+
+def bench_tiling(term_counts=(8, 16, 24, 32, 48, 64, 90), repeat=200):
+    """Print generation time per term count to show the engine scales linearly."""
+    print(f'{"terms":>6} {"board":>24} {"µs/board":>10} {"ns/term":>9}')
+    for n in term_counts:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            tiling = FibTiling(n)
+        us = (time.perf_counter() - t0) / repeat * 1e6
+        board = f'{tiling.width}×{tiling.height}'
+        print(f'{n:>6} {board:>24} {us:>10.1f} {us * 1000 / n:>9.0f}')
+
+class SquareIndex:
+    """Point hit-tests over a tiling's squares in O(log terms).
+
+    Squares grow by whole sides of the bounding box, so the boxes around
+    squares ``0..i`` are nested rectangles and each one is the previous box
+    plus square ``i``.  The square under a point is therefore the first box
+    that contains it, found by bisection over the prefix boxes.  (A quadtree
+    or grid buys nothing here: sizes are geometric, so either needs one
+    level per term.)
+    """
+    def __init__(self, tiling):
+        self.tiling = tiling
+        bx0, by0, bx1, by1 = array('q'), array('q'), array('q'), array('q')
+        x0 = y0 = x1 = y1 = None
+        for s, x, y in zip(tiling.size, tiling.x, tiling.y):
+            if x0 is None:
+                x0, y0, x1, y1 = x, y, x + s, y + s
+            else:
+                x0, y0, x1, y1 = min(x0, x), min(y0, y), max(x1, x + s), max(y1, y + s)
+            bx0.append(x0)
+            by0.append(y0)
+            bx1.append(x1)
+            by1.append(y1)
+        self._boxes = bx0, by0, bx1, by1
+
+    def at(self, gx, gy):
+        """Index of the square containing grid point ``(gx, gy)``, or None off the board."""
+        bx0, by0, bx1, by1 = self._boxes
+        lo, hi = 0, len(bx0) - 1
+        if not (bx0[hi] <= gx <= bx1[hi] and by0[hi] <= gy <= by1[hi]):
+            return None
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bx0[mid] <= gx <= bx1[mid] and by0[mid] <= gy <= by1[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+_SQUARE_INDEXES = {}
+
+def square_index(tiling):
+    """Shared :class:`SquareIndex` for ``tiling``, built on first use."""
+    index = _SQUARE_INDEXES.get(tiling.terms)
+    if index is None:
+        index = _SQUARE_INDEXES[tiling.terms] = SquareIndex(tiling)
+    return index
+
+def square_tint(palette, size, index):
+    """Tint for a square: the palette's entry for its size, else cycle the tints."""
+    tints = palette['tints']
+    tint = tints.get(size)
+    if tint is None:
+        cycle = list(tints.values())
+        tint = cycle[index % len(cycle)] if cycle else (0.85, 0.85, 0.85, 0.65)
+    return tint
+
+# ===== Safe-area =====
+def _ios_safe_insets():
+    """Return (top, left, bottom, right) safe-area in points (zeros off-device)."""
+    try:
+        objc_util = _objc_util()
+    except ImportError:
+        return 0.0, 0.0, 0.0, 0.0
+
+    @objc_util.on_main_thread
+    def read():
+        try:
+            UIApplication = objc_util.ObjCClass('UIApplication')
+            app = UIApplication.sharedApplication()
+            win = app.keyWindow() or (app.windows() and app.windows()[0])
+            if win:
+                ins = win.safeAreaInsets()
+                return float(ins.top), float(ins.left), float(ins.bottom), float(ins.right)
+        except Exception:
+            pass
+        return 0.0, 0.0, 0.0, 0.0
+    return read()
+
+def _screen_scale():
+    """Device pixels per point of the main screen (2.0 off-device)."""
+    try:
+        return float(_objc_util().ObjCClass('UIScreen').mainScreen().scale())
+    except Exception:
+        return 2.0
+
+def _fallback_insets(w, h):
+    return (44.0, 0.0, 34.0, 0.0) if h > w else (20.0, 0.0, 20.0, 0.0)
+
+class PlatformMetrics:
+    """Screen scale and safe-area insets, read once per layout.
+
+    Each read crosses the Objective-C bridge (insets also hop to the main
+    thread), so values are cached until :meth:`invalidate`, which
+    ``FibPoster.layout()`` calls on every size, rotation or screen change.
+    ``bridge_calls`` counts the reads per metric, which stay flat while
+    drawing, plus the per-frame calls that can't be cached: ``clip_rect``
+    (one per ``draw()``) and ``needs_display`` (one per dirty-rect
+    invalidation, i.e. per animation tick or touch move).
+    """
+    def __init__(self):
+        self.bridge_calls = Counter()
+        self._scale = self._insets = None
+
+    def invalidate(self):
+        self._scale = self._insets = None
+
+    @property
+    def scale(self):
+        if self._scale is None:
+            self.bridge_calls['scale'] += 1
+            self._scale = _screen_scale()
+        return self._scale
+
+    @property
+    def insets(self):
+        """(top, left, bottom, right) in points; zeros off-device."""
+        if self._insets is None:
+            self.bridge_calls['insets'] += 1
+            self._insets = _ios_safe_insets()
+        return self._insets
+
+PLATFORM = PlatformMetrics()  # shared by every view and Map
+
+def _set_needs_display_in_rect(view, rect):
+    """Invalidate only ``rect`` (x, y, w, h) of a ``ui.View``; whole view off-device."""
+    try:
+        objc_util = _objc_util()
+        PLATFORM.bridge_calls['needs_display'] += 1
+        objc_util.ObjCInstance(view).setNeedsDisplayInRect_(objc_util.CGRect(
+            objc_util.CGPoint(rect[0], rect[1]), objc_util.CGSize(rect[2], rect[3])))
+    except Exception:
+        view.set_needs_display()
+
+def _set_context_alpha(alpha):
+    """Set the current CoreGraphics context's global alpha inside ``draw()``; False off-device."""
+    try:
+        objc_util = _objc_util()
+        c = objc_util.c
+        c.UIGraphicsGetCurrentContext.restype = objc_util.c_void_p
+        c.UIGraphicsGetCurrentContext.argtypes = []
+        ctx = c.UIGraphicsGetCurrentContext()
+        if not ctx:
+            return False
+        c.CGContextSetAlpha.restype = None
+        c.CGContextSetAlpha.argtypes = [objc_util.c_void_p, objc_util.CGFloat]
+        c.CGContextSetAlpha(ctx, alpha)
+        return True
+    except Exception:
+        return False
+
+def _current_clip_rect():
+    """Clip box (x, y, w, h) of the current CoreGraphics context inside ``draw()``, or None."""
+    try:
+        objc_util = _objc_util()
+        c = objc_util.c
+        c.UIGraphicsGetCurrentContext.restype = objc_util.c_void_p
+        c.UIGraphicsGetCurrentContext.argtypes = []
+        PLATFORM.bridge_calls['clip_rect'] += 1
+        ctx = c.UIGraphicsGetCurrentContext()
+        if not ctx:
+            return None
+        c.CGContextGetClipBoundingBox.restype = objc_util.CGRect
+        c.CGContextGetClipBoundingBox.argtypes = [objc_util.c_void_p]
+        r = c.CGContextGetClipBoundingBox(ctx)
+        return r.origin.x, r.origin.y, r.size.width, r.size.height
+    except Exception:
+        return None
+
+# ===== Grid→screen mapper =====
+# Max distance (device pixels) between a sampled spiral chord and the true arc;
+# headless backends also flatten native arcs to it
+ARC_TOLERANCE_PX = {'screen': 0.25, 'export': 0.1}
+
+class Map:
+    """Maps grid coords (x right, y up) to iOS view coords (y down)."""
+    def __init__(self, frame, safe_top=0.0, safe_bottom=0.0, tiling=None, scale=None):
+        self.tiling = tiling = tiling or DEFAULT_TILING
+        self.W, self.H = W, H = tiling.width, tiling.height
+        vw, vh = frame.width, frame.height
+        top_pad = MARGIN + safe_top + 12
+        bottom_pad = MARGIN + safe_bottom + 6
+        avail_w = vw - 2 * MARGIN
+        avail_h = vh - top_pad - bottom_pad
+        self.clip = None  # visible view rect (x, y, w, h); None draws everything
+        self.k = min(avail_w / W, avail_h / H)  # uniform scale
+        self.ox = MARGIN + (avail_w - W * self.k) * 0.5
+        self.oy = top_pad + (avail_h - H * self.k) * 0.5
+        self.scale = PLATFORM.scale if scale is None else scale
+        self.tolerance = ARC_TOLERANCE_PX['screen']
+
+    @classmethod
+    def for_board(cls, tiling, k, scale, ox=0.0, oy=0.0):
+        """Mapper with an explicit scale and origin (exports, headless rendering)."""
+        m = cls.__new__(cls)
+        m.tiling, m.W, m.H = tiling, tiling.width, tiling.height
+        m.k, m.ox, m.oy, m.scale, m.clip = k, ox, oy, scale, None
+        m.tolerance = ARC_TOLERANCE_PX['export']
+        return m
+
+    def rect_ll(self, x, y, s):
+        """Return rect in points for square at (x,y) size s (lower-left origin in grid)."""
+        return (self.ox + x * self.k,
+                self.oy + (self.H - (y + s)) * self.k,
+                s * self.k, s * self.k)
+
+    def pt(self, gx, gy):
+        """Map a grid point (gx, gy) to view coords (px, py)."""
+        return self.ox + gx * self.k, self.oy + (self.H - gy) * self.k
+
+    def pts_np(self, gx, gy):
+        """Map grid coordinate arrays to an ``(n, 2)`` array of view coords."""
+        return np.column_stack((self.ox + self.k * gx, self.oy + self.k * (self.H - gy)))
+
+    def to_grid(self, px, py):
+        """Inverse of :meth:`pt`: view coords back to grid coords."""
+        return (px - self.ox) / self.k, self.H - (py - self.oy) / self.k
+
+    def square_at(self, px, py):
+        """Index of the tiling square under view point ``(px, py)``, or None."""
+        return square_index(self.tiling).at(*self.to_grid(px, py))
+
+    def visible_grid_rect(self, pad_pt=0.0):
+        """Return ``(gx0, gy0, gx1, gy1)`` of ``clip`` grown by ``pad_pt``, or ``None``."""
+        if self.clip is None:
+            return None
+        x, y, w, h = self.clip
+        gx0, gy1 = self.to_grid(x - pad_pt, y - pad_pt)
+        gx1, gy0 = self.to_grid(x + w + pad_pt, y + h + pad_pt)
+        return gx0, gy0, gx1, gy1
+
+    def with_origin(self, ox, oy, clip=None):
+        """Return a copy of this mapper drawing the board at ``(ox, oy)``."""
+        m = copy.copy(self)
+        m.ox, m.oy, m.clip = ox, oy, clip
+        return m
+
+    def zoomed(self, zoom, pan_x=0.0, pan_y=0.0, clip=None):
+        """Copy zoomed by ``zoom`` about the board centre and panned, origin on whole pixels."""
+        m = copy.copy(self)
+        cx, cy = self.ox + self.W * self.k * 0.5, self.oy + self.H * self.k * 0.5
+        m.k = self.k * zoom
+        m.ox = cx - m.W * m.k * 0.5 + pan_x
+        m.oy = cy - m.H * m.k * 0.5 + pan_y
+        # Whole device pixels, so the cached board layer blits without resampling
+        m.ox = round(m.ox * m.scale) / m.scale
+        m.oy = round(m.oy * m.scale) / m.scale
+        m.clip = clip
+        return m
+
+    def transform_to(self, other):
+        """``(tx, ty, s)`` taking this mapper's view coords to ``other``'s (same tiling)."""
+        s = other.k / self.k
+        return other.ox - self.ox * s, other.oy - self.oy * s, s
+
+    def x_to_px(self, gx): return self.ox + gx * self.k
+    def y_to_py(self, gy): return self.oy + (self.H - gy) * self.k
+
+    def crisp(self, v, line_width_pt=1.0):
+        """Snap a coordinate to pixel centers for sharp strokes."""
+        px = v * self.scale
+        px = round(px) + (0.5 if (line_width_pt * self.scale) % 2 else 0.0)
+        return px / self.scale
+
+ZOOM_MIN, ZOOM_MAX = 0.5, 32.0
+ZOOM_LOD_STEP = 2.0  # reference geometry is rebuilt when zoom crosses a power of this
+
+def lod_zoom(zoom):
+    """Reference zoom for ``zoom``: the next LOD level up, so drawing only ever downscales."""
+    return ZOOM_LOD_STEP ** math.ceil(math.log(max(zoom, 1e-6), ZOOM_LOD_STEP) - 1e-9)
+
+# ===== Point helpers =====
+def _xy_attrs(pt):
+    return float(pt.x), float(pt.y)
+
+def _xy_items(pt):
+    return float(pt[0]), float(pt[1])
+
+_POINT_STRATEGIES = (_xy_attrs, _xy_items)
+_POINT_CONVERTERS = {}  # concrete point type -> working strategy, or None (reflective only)
+
+def fast_point(point, fallback, view=None):
+    """``(x, y)`` for a touch location, caching per type which cheap strategy works.
+
+    The first point of a new type tries ``.x/.y`` then indexing; the winner
+    is remembered, so later events cost one dict lookup and two ``float``
+    calls.  Types neither handles (callables, proxies), or a cached strategy
+    that stops working, go through ``fallback(point, view)``.
+    """
+    cls = type(point)
+    try:
+        conv = _POINT_CONVERTERS[cls]
+    except KeyError:
+        conv = None
+        for strategy in _POINT_STRATEGIES:
+            try:
+                strategy(point)
+            except (TypeError, ValueError, AttributeError, IndexError, KeyError):
+                continue
+            conv = strategy
+            break
+        _POINT_CONVERTERS[cls] = conv
+    if conv is not None:
+        try:
+            return conv(point)
+        except (TypeError, ValueError, AttributeError, IndexError, KeyError):
+            pass
+    return fallback(point, view)
+
+# ===== Golden spiral geometry (y-up) =====
+SPIRAL_ARCS = DEFAULT_TILING.spiral_arcs()
+
+def arc_segments(r_px, sweep_rad, tolerance_px):
+    """Fewest chords for an arc of radius ``r_px`` that stray at most ``tolerance_px``.
+
+    A chord spanning Δθ sits r·(1 − cos(Δθ/2)) inside the arc at its middle,
+    so Δθ = 2·acos(1 − ε/r) is the widest step within ε.
+    """
+    if r_px <= tolerance_px:
+        return 1
+    step = 2.0 * math.acos(1.0 - tolerance_px / r_px)
+    return max(1, int(math.ceil(abs(sweep_rad) / step)))
+
+def _arc_segments(mapper, r, sweep_rad, tolerance=None):
+    """Chord count for a grid-unit arc at ``mapper``'s zoom and output tolerance."""
+    return arc_segments(abs(r) * mapper.k * mapper.scale, sweep_rad,
+                        mapper.tolerance if tolerance is None else tolerance)
+
+def arc_poly(mapper, center, start, sweep_deg, tolerance=None):
+    """Sample a circular arc as a polyline within ``tolerance`` device pixels of it."""
+    cx, cy = center
+    sx, sy = start
+    r = math.hypot(sx - cx, sy - cy)
+    if r == 0 or sweep_deg == 0:
+        return []
+    a0 = math.atan2(sy - cy, sx - cx)
+    sweep = math.radians(sweep_deg)
+    segs = _arc_segments(mapper, r, sweep, tolerance)
+    if _numpy() is not None:
+        t = a0 + sweep * (np.arange(segs + 1) / segs)
+        return mapper.pts_np(cx + r * np.cos(t), cy + r * np.sin(t)).tolist()
+    k, ox, oy = mapper.k, mapper.ox, mapper.oy + mapper.H * mapper.k
+    pts = []
+    for i in range(segs + 1):
+        t = a0 + sweep * (i / segs)
+        pts.append((ox + k * (cx + r * math.cos(t)), oy - k * (cy + r * math.sin(t))))
+    return pts
+
+def build_spiral_points(mapper):
+    """Sample the whole spiral as one polyline (shared endpoints are not repeated)."""
+    if _numpy() is not None:
+        return spiral_points_np(mapper).tolist()
+    pts = []
+    for center, start, sweep in mapper.tiling.spiral_arcs():
+        seg = arc_poly(mapper, center, start, sweep)
+        if not seg:
+            continue
+        if not pts:
+            pts.extend(seg)
+        else:
+            pts.extend(seg[1:])
+    return pts
+
+# ===== Closed-form spiral arcs =====
+def _add_arc_bezier(path, cx, cy, r, a0, a1, first):
+    """Append an arc (screen angles) as cubic Béziers of at most 90° each."""
+    n = max(1, int(math.ceil(abs(a1 - a0) / (math.pi / 2) - 1e-9)))
+    step = (a1 - a0) / n
+    kappa = 4.0 / 3.0 * math.tan(step / 4.0)
+    x0, y0 = cx + r * math.cos(a0), cy + r * math.sin(a0)
+    if first:
+        path.move_to(x0, y0)
+    else:
+        path.line_to(x0, y0)
+    for j in range(n):
+        t0 = a0 + step * j
+        t1 = t0 + step
+        x1, y1 = cx + r * math.cos(t1), cy + r * math.sin(t1)
+        path.add_curve(x1, y1,
+                       x0 - kappa * r * math.sin(t0), y0 + kappa * r * math.cos(t0),
+                       x1 + kappa * r * math.sin(t1), y1 - kappa * r * math.cos(t1))
+        x0, y0 = x1, y1
+
+def arc_visible_spans(cx, cy, r, t0, t1, rect):
+    """Return the sub-intervals of angles ``[t0, t1]`` whose arc points lie in ``rect``.
+
+    ``rect`` is ``(x0, y0, x1, y1)`` in grid units.  The circle crosses the
+    rect's edges at closed-form angles; those split the sweep into pieces that
+    are each entirely inside or outside, decided by testing their midpoints.
+    """
+    x0, y0, x1, y1 = rect
+    if t1 < t0:
+        t0, t1 = t1, t0
+    if cx + r < x0 or cx - r > x1 or cy + r < y0 or cy - r > y1:
+        return []
+    cuts = [t0, t1]
+    for edge, c, trig in ((x0, cx, math.acos), (x1, cx, math.acos),
+                          (y0, cy, math.asin), (y1, cy, math.asin)):
+        u = (edge - c) / r
+        if -1.0 < u < 1.0:
+            base = trig(u)
+            other = -base if trig is math.acos else math.pi - base
+            for a in (base, other):
+                a += 2 * math.pi * math.ceil((t0 - a) / (2 * math.pi))
+                while a < t1:
+                    cuts.append(a)
+                    a += 2 * math.pi
+    cuts.sort()
+    spans = []
+    for a, b in zip(cuts, cuts[1:]):
+        if b - a <= 1e-12:
+            continue
+        m = (a + b) * 0.5
+        if x0 <= cx + r * math.cos(m) <= x1 and y0 <= cy + r * math.sin(m) <= y1:
+            if spans and abs(spans[-1][1] - a) <= 1e-12:
+                spans[-1] = (spans[-1][0], b)
+            else:
+                spans.append((a, b))
+    return spans
+
+def add_spiral_arcs(path, mapper, progress=1.0, rect=None, start=0.0):
+    """Append the spiral to ``path`` as one true arc per quarter turn.
+
+    The partial last arc for ``progress`` is computed in closed form, so the
+    path takes one call per tiling term at any zoom level; mapped centres,
+    radii and start corners come from the mapper's cached
+    :class:`SpiralGeometry`.  Arcs outside the grid ``rect`` are culled (the
+    next visible one starts a new subpath).
+    ``start`` drops the part before that progress, for incremental drawing.
+    Grid angles flip sign on screen because the view's y axis points down.
+    """
+    tiling = mapper.tiling
+    arcs = spiral_geometry(mapper).arcs
+    last, frac = tiling.arc_cut(progress)
+    first, skip = tiling.arc_cut(start) if start > 0 else (0, 0.0)
+    native = hasattr(path, 'add_arc')
+    connected = False
+    for i in range(first, last + 1):
+        cx, cy, r, a0, sweep, px, py, rk, sx, sy = arcs[i]
+        end = frac if i == last else 1.0
+        begin = skip if i == first else 0.0
+        a0, sweep = a0 + sweep * begin, sweep * (end - begin)
+        if rect is not None and not arc_visible_spans(cx, cy, r, a0, a0 + sweep, rect):
+            connected = False
+            continue
+        if native:
+            if not connected:
+                # A whole arc starts on its square's corner; only a cut one needs the table
+                if begin:
+                    ux, uy = unit_arc_point(a0)
+                    path.move_to(*mapper.pt(cx + r * ux, cy + r * uy))
+                else:
+                    path.move_to(sx, sy)
+            path.add_arc(px, py, rk, -a0, -(a0 + sweep), sweep < 0)
+        else:
+            _add_arc_bezier(path, px, py, rk, -a0, -(a0 + sweep), not connected)
+        connected = True
+
+def add_spiral_polyline(path, mapper, progress=1.0, rect=None, tolerance=None, start=0.0):
+    """Append the spiral as sampled polylines covering only the visible spans.
+
+    Chords stay within the output's tolerance of each span, so at deep zoom
+    the point count tracks what is visible rather than the whole board.
+    """
+    params = mapper.tiling.arc_params
+    last, frac = mapper.tiling.arc_cut(progress)
+    first, skip = mapper.tiling.arc_cut(start) if start > 0 else (0, 0.0)
+    k, ox, oy = mapper.k, mapper.ox, mapper.oy + mapper.H * mapper.k
+    for i in range(first, last + 1):
+        cx, cy, r, a0, sweep = params[i]
+        end = frac if i == last else 1.0
+        begin = skip if i == first else 0.0
+        a0, sweep = a0 + sweep * begin, sweep * (end - begin)
+        spans = [(a0, a0 + sweep)] if rect is None else arc_visible_spans(cx, cy, r, a0, a0 + sweep, rect)
+        for t0, t1 in spans:
+            span = t1 - t0
+            segs = _arc_segments(mapper, r, span, tolerance)
+            path.move_to(ox + k * (cx + r * math.cos(t0)), oy - k * (cy + r * math.sin(t0)))
+            for j in range(1, segs + 1):
+                t = t0 + span * (j / segs)
+                path.line_to(ox + k * (cx + r * math.cos(t)), oy - k * (cy + r * math.sin(t)))
+
+def spiral_section_bounds(mapper, start, end):
+    """View-space ``(x0, y0, x1, y1)`` around the spiral between two progresses, or ``None``.
+
+    Each arc piece contributes its end points plus any axis extremes its
+    sweep passes, so the box is exact (before the stroke width) to within
+    the unit arc table's 5e-6 of the radius.
+    """
+    if end <= start:
+        return None
+    params = mapper.tiling.arc_params
+    last, frac = mapper.tiling.arc_cut(end)
+    first, skip = mapper.tiling.arc_cut(start)
+    xs, ys = [], []
+    for i in range(first, last + 1):
+        cx, cy, r, a0, sweep = params[i]
+        t0 = a0 + sweep * (skip if i == first else 0.0)
+        t1 = a0 + sweep * (frac if i == last else 1.0)
+        lo, hi = min(t0, t1), max(t0, t1)
+        angles = [t0, t1]
+        q = math.ceil(lo / (math.pi / 2))
+        while q * (math.pi / 2) < hi:
+            angles.append(q * (math.pi / 2))
+            q += 1
+        for t in angles:
+            ux, uy = unit_arc_point(t)
+            x, y = mapper.pt(cx + r * ux, cy + r * uy)
+            xs.append(x)
+            ys.append(y)
+    return min(xs), min(ys), max(xs), max(ys)
+
+# ===== Vectorized sampling (NumPy) =====
+def spiral_points_np(mapper, tolerance=None):
+    """Sample every spiral arc in one NumPy pass; returns an ``(n, 2)`` view-coord array.
+
+    Angles for all arcs are laid out in a single array (arc index repeated
+    per sample), so the trigonometry and the grid→screen affine run once over
+    the whole spiral instead of once per point.
+    """
+    params = np.array(mapper.tiling.arc_params, dtype=float)
+    if not len(params):
+        return np.empty((0, 2))
+    cx, cy, r, a0, sweep = params.T
+    eps = mapper.tolerance if tolerance is None else tolerance
+    r_px = r * mapper.k * mapper.scale
+    step = 2.0 * np.arccos(np.clip(1.0 - eps / np.maximum(r_px, 1e-12), -1.0, 1.0))
+    segs = np.maximum(1, np.ceil(np.abs(sweep) / step)).astype(int)
+    counts = segs.copy()
+    counts[0] += 1                       # later arcs skip their shared start point
+    arc = np.repeat(np.arange(len(segs)), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    step = np.arange(counts.sum()) - first
+    step[counts[0]:] += 1
+    t = a0[arc] + sweep[arc] * (step / segs[arc])
+    return mapper.pts_np(cx[arc] + r[arc] * np.cos(t), cy[arc] + r[arc] * np.sin(t))
+
+# ===== Spiral geometry cache =====
+SPIRAL_CACHE_SIZE = 4  # mappers kept (on-screen, zoomed, export…)
+
+class SpiralGeometry:
+    """One mapper's spiral in view space, each form built on first use.
+
+    ``arcs`` serves the native-arc path (the default, ``SPIRAL_USE_ARCS``):
+    per quarter arc, its grid ``(cx, cy, r, a0, sweep)`` plus the mapped
+    centre, radius and start corner ``(px, py, rk, sx, sy)``; cuts come from
+    the tiling's arc-length prefix (:meth:`FibTiling.arc_cut`).  ``points``,
+    ``cum`` and ``total`` are the sampled polyline and its arc-length prefix
+    for the polyline fallback.
+    """
+    __slots__ = ('mapper', '_arcs', '_points', 'cum', 'total')
+
+    def __init__(self, mapper):
+        self.mapper = mapper
+        self._arcs = self._points = None
+
+    @property
+    def arcs(self):
+        if self._arcs is None:
+            m, t = self.mapper, self.mapper.tiling
+            self._arcs = [(cx, cy, r, a0, sweep) + m.pt(cx, cy) + (r * m.k,) + m.pt(sx, sy)
+                          for (cx, cy, r, a0, sweep), sx, sy in zip(t.arc_params, t.sx, t.sy)]
+        return self._arcs
+
+    @property
+    def points(self):
+        if self._points is None:
+            self._sample()
+        return self._points
+
+    def _sample(self):
+        points = self._points = build_spiral_points(self.mapper)
+        if _numpy() is not None and len(points) > 1:
+            d = np.diff(np.asarray(points, dtype=float), axis=0)
+            cum = np.concatenate(([0.0], np.cumsum(np.hypot(d[:, 0], d[:, 1]))))
+            self.cum = cum.tolist()
+            self.total = self.cum[-1]
+            return
+        cum = [0.0] * len(points)
+        acc = 0.0
+        for i in range(1, len(points)):
+            (x0, y0), (x1, y1) = points[i - 1], points[i]
+            acc += math.hypot(x1 - x0, y1 - y0)
+            cum[i] = acc
+        self.cum = cum
+        self.total = acc
+
+    def cut(self, progress):
+        """Return ``(n, (x, y))``: draw ``points[:n]`` then a line to ``(x, y)``.
+
+        The cut point is found by binary search over the prefix table, so the
+        per-frame cost is O(log n) plus path emission.
+        """
+        pts = self.points  # samples on first use
+        target = self.total * max(0.0, min(1.0, progress))
+        i = bisect_left(self.cum, target)
+        if i == 0:
+            return 1, pts[0]
+        c0 = self.cum[i - 1]
+        t = (target - c0) / (self.cum[i] - c0)
+        (x0, y0), (x1, y1) = pts[i - 1], pts[i]
+        return i, (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
+
+_SPIRAL_CACHE = OrderedDict()
+
+def spiral_geometry(mapper):
+    """Return the cached :class:`SpiralGeometry` for ``mapper``'s tiling and (k, ox, oy, scale)."""
+    key = (mapper.tiling.terms, mapper.k, mapper.ox, mapper.oy, mapper.scale, mapper.tolerance)
+    geo = _SPIRAL_CACHE.get(key)
+    if geo is not None:
+        _SPIRAL_CACHE.move_to_end(key)
+        return geo
+    geo = SpiralGeometry(copy.copy(mapper))  # callers may re-clip their mapper
+    _SPIRAL_CACHE[key] = geo
+    if len(_SPIRAL_CACHE) > SPIRAL_CACHE_SIZE:
+        _SPIRAL_CACHE.popitem(last=False)
+    return geo
+
+# ===== Drawing backends =====
+ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT = 0, 1, 2   # same values as ui.ALIGN_*
+LINE_CAP_ROUND = LINE_JOIN_ROUND = 1
+
+class DrawBackend:
+    """Drawing primitives the board renderer targets.
+
+    ``UIBackend`` forwards to Pythonista's ``ui``; ``RasterBackend``,
+    ``SVGBackend`` and ``PDFBackend`` render without it (Linux render boxes, benchmarks).  Paths
+    returned by :meth:`path` behave like ``ui.Path``: ``move_to``,
+    ``line_to``, ``add_arc``, ``add_curve``, ``line_width`` and
+    ``stroke()``/``fill()``.  Coordinates are points, y down.
+    """
+    file_ext = 'png'
+
+    def set_color(self, color):
+        raise NotImplementedError
+
+    def fill_rect(self, x, y, w, h):
+        raise NotImplementedError
+
+    def stroke_rect(self, x, y, w, h, line_width=1.0):
+        raise NotImplementedError
+
+    def path(self):
+        raise NotImplementedError
+
+    def measure_string(self, text, font):
+        raise NotImplementedError
+
+    def draw_string(self, text, rect, font, color, alignment=ALIGN_LEFT):
+        raise NotImplementedError
+
+    def image_context(self, width, height, scale):
+        """Context manager redirecting drawing into a new image; ``ctx.get_image()``."""
+        raise NotImplementedError
+
+    def draw_image(self, image, x, y, w, h, alpha=1.0):
+        """Draw an ``image_context`` image into ``(x, y, w, h)``, faded to ``alpha``."""
+        raise NotImplementedError
+
+    def paste_image(self, image, x, y, w, h):
+        """Draw ``image`` into ``(x, y, w, h)`` replacing, not blending over, what is there (raster backends)."""
+        raise NotImplementedError
+
+    def transformed(self, tx, ty, scale):
+        """Context manager: draw with points mapped to ``(tx + scale·x, ty + scale·y)``."""
+        raise NotImplementedError
+
+    def encode(self, image):
+        """Return file bytes for ``image`` (PNG, SVG text or a PDF document)."""
+        raise NotImplementedError
+
+    def image_rows(self, image, y0=0, y1=None):
+        """Yield ``image``'s pixel rows ``[y0, y1)`` as straight-alpha RGBA8 bytes (raster backends)."""
+        raise NotImplementedError
+
+class UIBackend(DrawBackend):
+    """Pythonista ``ui`` drawing: the on-screen path and on-device exports."""
+    def __init__(self, ui_module=None):
+        self.ui = ui_module or ui
+
+    def set_color(self, color):
+        self.ui.set_color(color)
+
+    def fill_rect(self, x, y, w, h):
+        self.ui.Path.rect(x, y, w, h).fill()
+
+    def stroke_rect(self, x, y, w, h, line_width=1.0):
+        p = self.ui.Path.rect(x, y, w, h)
+        p.line_width = line_width
+        p.stroke()
+
+    def path(self):
+        return self.ui.Path()
+
+    def measure_string(self, text, font):
+        return self.ui.measure_string(text, font=font)
+
+    def draw_string(self, text, rect, font, color, alignment=ALIGN_LEFT):
+        self.ui.draw_string(text, rect, font=font, color=color, alignment=alignment)
+
+    def image_context(self, width, height, scale=0):
+        return self.ui.ImageContext(width, height, scale)
+
+    def draw_image(self, image, x, y, w, h, alpha=1.0):
+        if alpha >= 1.0:
+            image.draw(x, y, w, h)
+            return
+        with self.ui.GState():
+            # ui.Image.draw has no opacity; without the context alpha the
+            # image snaps in half way instead
+            if _set_context_alpha(alpha) or alpha >= 0.5:
+                image.draw(x, y, w, h)
+
+    def paste_image(self, image, x, y, w, h):
+        try:
+            objc_util = _objc_util()
+            objc_util.ObjCInstance(image).drawInRect_blendMode_alpha_(objc_util.CGRect(
+                objc_util.CGPoint(x, y), objc_util.CGSize(w, h)), 17, 1.0)  # kCGBlendModeCopy
+        except Exception:
+            image.draw(x, y, w, h)
+
+    @contextmanager
+    def transformed(self, tx, ty, scale):
+        with self.ui.GState():
+            self.ui.concat_ctm(self.ui.Transform.scale(scale, scale).concat(
+                self.ui.Transform.translation(tx, ty)))
+            yield
+
+    def encode(self, image):
+        return image.to_png()
+
+    def image_rows(self, image, y0=0, y1=None):
+        # Round-trips the whole image through PNG: main thread, one-off reads only
+        from PIL import Image  # bundled with Pythonista
+        pil = Image.open(io.BytesIO(image.to_png())).convert('RGBA')
+        data, stride = pil.tobytes(), pil.width * 4
+        for y in range(max(0, y0), pil.height if y1 is None else min(y1, pil.height)):
+            yield data[y * stride:(y + 1) * stride]
+
+class RecordedPath:
+    """``ui.Path`` stand-in that records segments for the headless backends.
+
+    ``tolerance`` is how far (device pixels) flattened arcs and curves may
+    stray; the renderer sets it from the mapper's output tolerance.
+    """
+    tolerance = ARC_TOLERANCE_PX['screen']
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.ops = []
+        self.line_width = 1.0
+        self.line_cap_style = self.line_join_style = 0
+
+    def move_to(self, x, y):
+        self.ops.append(('M', x, y))
+
+    def line_to(self, x, y):
+        self.ops.append(('L', x, y))
+
+    def add_arc(self, cx, cy, r, a0, a1, clockwise=True):
+        self.ops.append(('A', cx, cy, r, a0, a1, clockwise))
+
+    def add_curve(self, x, y, c1x, c1y, c2x, c2y):
+        self.ops.append(('C', x, y, c1x, c1y, c2x, c2y))
+
+    def close(self):
+        self.ops.append(('Z',))
+
+    def stroke(self):
+        self._backend._stroke(self)
+
+    def fill(self):
+        self._backend._fill(self)
+
+    @staticmethod
+    def arc_angles(a0, a1, clockwise):
+        """Resolve ``ui.Path.add_arc`` direction into a signed end angle."""
+        if clockwise and a1 < a0:
+            a1 += 2 * math.pi * math.ceil((a0 - a1) / (2 * math.pi))
+        elif not clockwise and a1 > a0:
+            a1 -= 2 * math.pi * math.ceil((a1 - a0) / (2 * math.pi))
+        return a0, a1
+
+    def subpaths(self, tolerance=0.25):
+        """Flatten into lists of ``(x, y)``; arcs and curves deviate ≤ ``tolerance``."""
+        out, cur = [], None
+        for op in self.ops:
+            kind = op[0]
+            if kind == 'M':
+                cur = [(op[1], op[2])]
+                out.append(cur)
+            elif kind == 'L':
+                if cur is None:
+                    cur = []
+                    out.append(cur)
+                cur.append((op[1], op[2]))
+            elif kind == 'A':
+                _, cx, cy, r, a0, a1, cw = op
+                a0, a1 = self.arc_angles(a0, a1, cw)
+                step = 2 * math.acos(max(-1.0, 1.0 - tolerance / r)) if r > tolerance else math.pi / 2
+                n = max(1, int(math.ceil(abs(a1 - a0) / max(step, 1e-6))))
+                if cur is None:
+                    cur = []
+                    out.append(cur)
+                for j in range(n + 1):
+                    t = a0 + (a1 - a0) * j / n
+                    cur.append((cx + r * math.cos(t), cy + r * math.sin(t)))
+            elif kind == 'C':
+                _, x, y, c1x, c1y, c2x, c2y = op
+                x0, y0 = cur[-1] if cur else (x, y)
+                span = (math.hypot(c1x - x0, c1y - y0) + math.hypot(c2x - c1x, c2y - c1y)
+                        + math.hypot(x - c2x, y - c2y))
+                n = max(2, int(math.ceil(math.sqrt(span / max(tolerance, 1e-6)))))
+                if cur is None:
+                    cur = [(x0, y0)]
+                    out.append(cur)
+                for j in range(1, n + 1):
+                    t = j / n
+                    u = 1 - t
+                    cur.append((u*u*u*x0 + 3*u*u*t*c1x + 3*u*t*t*c2x + t*t*t*x,
+                                u*u*u*y0 + 3*u*u*t*c1y + 3*u*t*t*c2y + t*t*t*y))
+            elif kind == 'Z' and cur:
+                cur.append(cur[0])
+                cur = None
+        return out
+
+# 3×5 bitmap glyphs (rows top→bottom) so the raster backend can label boards
+# without a font engine; lowercase renders as uppercase.
+_GLYPHS = {
+    '0': '111101101101111', '1': '010110010010111', '2': '111001111100111',
+    '3': '111001111001111', '4': '101101111001001', '5': '111100111001111',
+    '6': '111100111101111', '7': '111001001001001', '8': '111101111101111',
+    '9': '111101111001111', 'A': '010101111101101', 'B': '110101110101110',
+    'C': '011100100100011', 'D': '110101101101110', 'E': '111100110100111',
+    'F': '111100110100100', 'G': '011100101101011', 'H': '101101111101101',
+    'I': '111010010010111', 'J': '001001001101010', 'K': '101101110101101',
+    'L': '100100100100111', 'M': '101111111101101', 'N': '110101101101101',
+    'O': '010101101101010', 'P': '110101110100100', 'Q': '010101101110011',
+    'R': '110101110101101', 'S': '011100010001110', 'T': '111010010010010',
+    'U': '101101101101111', 'V': '101101101101010', 'W': '101101111111101',
+    'X': '101101010101101', 'Y': '101101010010010', 'Z': '111001010100111',
+    ',': '000000000010100', '.': '000000000000010', '-': '000000111000000',
+    '×': '000101010101000', '(': '010100100100010', ')': '010001001001010',
+    '=': '000111000111000', ':': '000010000010000', '/': '001001010100100',
+    '+': '000010111010000', '%': '101001010100101', ' ': '000000000000000',
+}
+
+class RasterImage:
+    """RGBA canvas of premultiplied floats: a NumPy array, or a flat ``array('f')``."""
+    def __init__(self, width_px, height_px, scale=1.0):
+        self.width_px, self.height_px, self.scale = width_px, height_px, scale
+        if _numpy() is not None:
+            self.px = np.zeros((height_px, width_px, 4), dtype=np.float32)
+        else:
+            self.px = array('f', bytes(16 * width_px * height_px))
+
+    @property
+    def size(self):
+        return self.width_px / self.scale, self.height_px / self.scale
+
+    def blend_rect(self, x0, y0, x1, y1, rgba):
+        """Composite premultiplied ``rgba`` over pixels ``[x0, x1) × [y0, y1)``."""
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width_px, x1), min(self.height_px, y1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if _numpy() is not None:
+            region = self.px[y0:y1, x0:x1]
+            region *= 1.0 - rgba[3]
+            region += np.asarray(rgba, dtype=np.float32)
+            return
+        px, w, ia = self.px, self.width_px, 1.0 - rgba[3]
+        for y in range(y0, y1):
+            for j in range((y * w + x0) * 4, (y * w + x1) * 4, 4):
+                for c in range(4):
+                    px[j + c] = rgba[c] + px[j + c] * ia
+
+    def composite(self, other, dx, dy, alpha=1.0):
+        """Draw ``other`` (same scale) over this canvas with its origin at pixel ``(dx, dy)``.
+
+        ``alpha`` fades the whole of ``other`` (premultiplied, so every channel scales).
+        """
+        x0, y0 = max(0, dx), max(0, dy)
+        x1 = min(self.width_px, dx + other.width_px)
+        y1 = min(self.height_px, dy + other.height_px)
+        if x0 >= x1 or y0 >= y1 or alpha <= 0.0:
+            return
+        if _numpy() is not None:
+            src = other.px[y0 - dy:y1 - dy, x0 - dx:x1 - dx]
+            if alpha < 1.0:
+                src = src * np.float32(alpha)
+            dst = self.px[y0:y1, x0:x1]
+            dst *= 1.0 - src[..., 3:4]
+            dst += src
+            return
+        sp, dp, sw, dw = other.px, self.px, other.width_px, self.width_px
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                s = ((y - dy) * sw + (x - dx)) * 4
+                d = (y * dw + x) * 4
+                ia = 1.0 - sp[s + 3] * alpha
+                for c in range(4):
+                    dp[d + c] = sp[s + c] * alpha + dp[d + c] * ia
+
+    def paste(self, other, dx, dy):
+        """Copy ``other``'s pixels over this canvas with its origin at pixel ``(dx, dy)``."""
+        x0, y0 = max(0, dx), max(0, dy)
+        x1 = min(self.width_px, dx + other.width_px)
+        y1 = min(self.height_px, dy + other.height_px)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if _numpy() is not None:
+            self.px[y0:y1, x0:x1] = other.px[y0 - dy:y1 - dy, x0 - dx:x1 - dx]
+            return
+        sw, dw = other.width_px, self.width_px
+        for y in range(y0, y1):
+            s, d = ((y - dy) * sw + x0 - dx) * 4, (y * dw + x0) * 4
+            self.px[d:d + (x1 - x0) * 4] = other.px[s:s + (x1 - x0) * 4]
+
+    def resized(self, width_px, height_px):
+        """Nearest-neighbour copy at another pixel size (layer blits at a new zoom)."""
+        out = RasterImage(width_px, height_px, self.scale * width_px / max(1, self.width_px))
+        if _numpy() is not None:
+            ys = (np.arange(height_px) * self.height_px // max(1, height_px)).clip(0, self.height_px - 1)
+            xs = (np.arange(width_px) * self.width_px // max(1, width_px)).clip(0, self.width_px - 1)
+            out.px[...] = self.px[ys][:, xs]
+            return out
+        for y in range(height_px):
+            sy = min(self.height_px - 1, y * self.height_px // height_px)
+            for x in range(width_px):
+                sx = min(self.width_px - 1, x * self.width_px // width_px)
+                s, d = (sy * self.width_px + sx) * 4, (y * width_px + x) * 4
+                out.px[d:d + 4] = self.px[s:s + 4]
+        return out
+
+    def rows(self, y0=0, y1=None):
+        """Yield pixel rows ``[y0, y1)`` as straight-alpha RGBA8 bytes (PNG scanline order)."""
+        y0, y1 = max(0, y0), self.height_px if y1 is None else min(y1, self.height_px)
+        if _numpy() is not None:
+            step = max(1, 65536 // max(1, self.width_px))  # convert ~64k pixels at a time
+            for y in range(y0, y1, step):
+                block = self.px[y:min(y1, y + step)]
+                a = block[..., 3:4]
+                rgb = np.divide(block[..., :3], a, out=np.zeros_like(block[..., :3]), where=a > 0)
+                out = (np.clip(np.concatenate((rgb, a), axis=2), 0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+                for row in out:
+                    yield row.tobytes()
+            return
+        px, w = self.px, self.width_px
+        for y in range(y0, y1):
+            row = bytearray(4 * w)
+            for x in range(w):
+                j = (y * w + x) * 4
+                a = px[j + 3]
+                inv = 1.0 / a if a > 0 else 0.0
+                for c in range(3):
+                    row[4 * x + c] = int(min(1.0, px[j + c] * inv) * 255 + 0.5)
+                row[4 * x + 3] = int(min(1.0, a) * 255 + 0.5)
+            yield bytes(row)
+
+def _png_chunk(tag, data):
+    return (struct.pack('>I', len(data)) + tag + data
+            + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+class PNGStreamWriter:
+    """Incremental RGBA8 PNG encoder.
+
+    Scanlines go through one ``zlib`` stream and are written out as IDAT
+    chunks whenever ``chunk_size`` compressed bytes are pending, so memory
+    stays bounded by the caller's band size rather than the image size.
+    """
+    def __init__(self, f, width, height, level=6, chunk_size=1 << 16):
+        self.f, self.width, self.height = f, width, height
+        self.rows_written = 0
+        self.chunk_size = chunk_size
+        self._comp = zlib.compressobj(level)
+        self._pending = []
+        self._pending_len = 0
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+
+    def write_rows(self, rows):
+        for row in rows:
+            if self.rows_written >= self.height:
+                break
+            data = self._comp.compress(b'\x00' + row)
+            self.rows_written += 1
+            if data:
+                self._pending.append(data)
+                self._pending_len += len(data)
+                if self._pending_len >= self.chunk_size:
+                    self._flush_idat()
+
+    def _flush_idat(self):
+        if self._pending:
+            self.f.write(_png_chunk(b'IDAT', b''.join(self._pending)))
+            self._pending, self._pending_len = [], 0
+
+    def close(self):
+        if self.rows_written != self.height:
+            raise ValueError(f'PNG expects {self.height} rows, got {self.rows_written}')
+        self._pending.append(self._comp.flush())
+        self._flush_idat()
+        self.f.write(_png_chunk(b'IEND', b''))
+
+def encode_png(width, height, rows, level=6):
+    """Encode RGBA8 scanlines (an iterable of bytes) as a PNG file."""
+    buf = io.BytesIO()
+    writer = PNGStreamWriter(buf, width, height, level)
+    writer.write_rows(rows)
+    writer.close()
+    return buf.getvalue()
+
+def pixel_extent(pt, scale):
+    """Whole device pixels covering ``pt`` points (ignoring float fuzz)."""
+    return max(1, int(math.ceil(pt * scale - 1e-6)))
+
+class _ImageContext:
+    """Shared ``with backend.image_context(...)`` helper for the headless backends."""
+    def __init__(self, backend, image):
+        self._backend, self._image = backend, image
+
+    def __enter__(self):
+        self._backend._targets.append(self._image)
+        self._backend._xforms.append((0.0, 0.0, 1.0))  # each image starts untransformed
+        return self
+
+    def __exit__(self, *exc):
+        self._backend._targets.pop()
+        self._backend._xforms.pop()
+
+    def get_image(self):
+        return self._image
+
+class RasterBackend(DrawBackend):
+    """Pure-Python/NumPy rasterizer: hard-edged fills, round-capped strokes, bitmap text."""
+    def __init__(self):
+        self._targets = []
+        self._xforms = []  # per target: (tx, ty, scale) in points
+        self._color = (0.0, 0.0, 0.0, 1.0)
+
+    @property
+    def _canvas(self):
+        if not self._targets:
+            raise RuntimeError('RasterBackend draws inside image_context() only')
+        return self._targets[-1]
+
+    def _device(self):
+        """``(canvas, ox, oy, s)``: a point ``(x, y)`` lands on device pixel ``(ox + s·x, oy + s·y)``."""
+        cv = self._canvas
+        tx, ty, k = self._xforms[-1]
+        return cv, tx * cv.scale, ty * cv.scale, k * cv.scale
+
+    @contextmanager
+    def transformed(self, tx, ty, scale):
+        saved = self._xforms[-1]
+        ox, oy, k = saved
+        self._xforms[-1] = (ox + k * tx, oy + k * ty, k * scale)
+        try:
+            yield
+        finally:
+            self._xforms[-1] = saved
+
+    def set_color(self, color):
+        r, g, b = color[:3]
+        a = color[3] if len(color) > 3 else 1.0
+        self._color = (r * a, g * a, b * a, a)
+
+    def fill_rect(self, x, y, w, h):
+        cv, ox, oy, s = self._device()
+        cv.blend_rect(int(round(ox + x * s)), int(round(oy + y * s)),
+                      int(round(ox + (x + w) * s)), int(round(oy + (y + h) * s)), self._color)
+
+    def stroke_rect(self, x, y, w, h, line_width=1.0):
+        p = self.path()
+        p.line_width = line_width
+        p.move_to(x, y)
+        for px, py in ((x + w, y), (x + w, y + h), (x, y + h)):
+            p.line_to(px, py)
+        p.close()
+        p.stroke()
+
+    def path(self):
+        return RecordedPath(self)
+
+    def measure_string(self, text, font):
+        unit = font[1] / 7.0
+        return (max(0.0, len(text) * 4 * unit - unit), font[1])
+
+    def draw_string(self, text, rect, font, color, alignment=ALIGN_LEFT):
+        x, y, w, _ = rect
+        tw, _ = self.measure_string(text, font)
+        if alignment == ALIGN_CENTER:
+            x += (w - tw) / 2.0
+        elif alignment == ALIGN_RIGHT:
+            x += w - tw
+        saved = self._color
+        self.set_color(color)
+        cv, ox, oy, s = self._device()
+        unit = font[1] / 7.0
+        for n, ch in enumerate(text):
+            bits = _GLYPHS.get(ch.upper())
+            if not bits:
+                continue
+            gx = x + n * 4 * unit
+            for j, bit in enumerate(bits):
+                if bit == '1':
+                    cx, cy = gx + (j % 3) * unit, y + (1 + j // 3) * unit
+                    cv.blend_rect(int(round(ox + cx * s)), int(round(oy + cy * s)),
+                                  int(round(ox + (cx + unit) * s)), int(round(oy + (cy + unit) * s)),
+                                  self._color)
+        self._color = saved
+
+    def image_context(self, width, height, scale=1.0):
+        scale = scale or 1.0
+        return _ImageContext(self, RasterImage(pixel_extent(width, scale),
+                                               pixel_extent(height, scale), scale))
+
+    def draw_image(self, image, x, y, w, h, alpha=1.0):
+        cv, ox, oy, s = self._device()
+        wp, hp = int(round(w * s)), int(round(h * s))
+        if (wp, hp) != (image.width_px, image.height_px):
+            image = image.resized(wp, hp)
+        cv.composite(image, int(round(ox + x * s)), int(round(oy + y * s)), alpha)
+
+    def paste_image(self, image, x, y, w, h):
+        cv, ox, oy, s = self._device()
+        wp, hp = int(round(w * s)), int(round(h * s))
+        if (wp, hp) != (image.width_px, image.height_px):
+            image = image.resized(wp, hp)
+        cv.paste(image, int(round(ox + x * s)), int(round(oy + y * s)))
+
+    def encode(self, image):
+        return encode_png(image.width_px, image.height_px, image.rows())
+
+    def image_rows(self, image, y0=0, y1=None):
+        return image.rows(y0, y1)
+
+    # ----- path rasterization -----
+    def _stroke(self, path):
+        cv, ox, oy, s = self._device()
+        radius = max(0.5, path.line_width * s / 2.0)
+        spans = {}
+        for pts in path.subpaths(tolerance=path.tolerance / s):
+            pts = [(ox + x * s, oy + y * s) for x, y in pts]
+            if len(pts) == 1:
+                pts = pts * 2
+            for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
+                self._capsule_spans(spans, x0, y0, x1, y1, radius)
+        self._blend_spans(cv, spans)
+
+    def _fill(self, path):
+        """Even-odd scanline fill of the flattened subpaths."""
+        cv, ox, oy, s = self._device()
+        edges = []
+        for pts in path.subpaths(tolerance=path.tolerance / s):
+            pts = [(ox + x * s, oy + y * s) for x, y in pts]
+            edges.extend(zip(pts, pts[1:] + pts[:1]))
+        if not edges:
+            return
+        ys = [p[1] for e in edges for p in e]
+        spans = {}
+        for y in range(max(0, int(min(ys))), min(cv.height_px, int(math.ceil(max(ys))))):
+            yc = y + 0.5
+            xs = sorted(x0 + (yc - y0) * (x1 - x0) / (y1 - y0)
+                        for (x0, y0), (x1, y1) in edges if (y0 <= yc) != (y1 <= yc))
+            spans[y] = [(int(math.ceil(a - 0.5)), int(math.floor(b - 0.5)) + 1)
+                        for a, b in zip(xs[::2], xs[1::2])]
+        self._blend_spans(cv, spans, merged=True)
+
+    @staticmethod
+    def _capsule_spans(spans, x0, y0, x1, y1, r):
+        """Add per-row x-intervals covered by the round-capped segment to ``spans``."""
+        dx, dy = x1 - x0, y1 - y0
+        length = math.hypot(dx, dy)
+        nx, ny = (-dy / length * r, dx / length * r) if length else (0.0, 0.0)
+        quad = ((x0 + nx, y0 + ny), (x1 + nx, y1 + ny), (x1 - nx, y1 - ny), (x0 - nx, y0 - ny))
+        for y in range(int(math.floor(min(y0, y1) - r)), int(math.ceil(max(y0, y1) + r)) + 1):
+            yc = y + 0.5
+            lo, hi = math.inf, -math.inf
+            for ex, ey in ((x0, y0), (x1, y1)):
+                d = r * r - (yc - ey) ** 2
+                if d >= 0:
+                    h = math.sqrt(d)
+                    lo, hi = min(lo, ex - h), max(hi, ex + h)
+            if length:
+                for (ax, ay), (bx, by) in zip(quad, quad[1:] + quad[:1]):
+                    if (ay - yc) * (by - yc) <= 0 and ay != by:
+                        xc = ax + (yc - ay) * (bx - ax) / (by - ay)
+                        lo, hi = min(lo, xc), max(hi, xc)
+            if lo <= hi:
+                a, b = int(math.ceil(lo - 0.5)), int(math.floor(hi - 0.5)) + 1
+                if a < b:
+                    spans.setdefault(y, []).append((a, b))
+
+    def _blend_spans(self, cv, spans, merged=False):
+        """Blend each row's union of intervals once, so overlaps don't double the alpha."""
+        if _numpy() is not None and spans:
+            top = max(0, min(spans))
+            bottom = min(cv.height_px, max(spans) + 1)
+            if top >= bottom:
+                return
+            mask = np.zeros((bottom - top, cv.width_px), dtype=bool)
+            for y, ivs in spans.items():
+                if top <= y < bottom:
+                    row = mask[y - top]
+                    for a, b in ivs:
+                        row[max(0, a):max(0, b)] = True
+            region = cv.px[top:bottom]
+            rgba = np.asarray(self._color, dtype=np.float32)
+            region[mask] = region[mask] * (1.0 - rgba[3]) + rgba
+            return
+        for y, ivs in spans.items():
+            if not 0 <= y < cv.height_px:
+                continue
+            if not merged:
+                ivs.sort()
+                out = []
+                for a, b in ivs:
+                    if out and a <= out[-1][1]:
+                        out[-1] = (out[-1][0], max(out[-1][1], b))
+                    else:
+                        out.append((a, b))
+                ivs = out
+            for a, b in ivs:
+                cv.blend_rect(a, y, b, y + 1, self._color)
+
+class SVGImage:
+    """Recorded SVG elements of one ``SVGBackend.image_context``."""
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.elements = []
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+class SVGBackend(DrawBackend):
+    """Writes SVG elements; arcs stay arcs, so file size doesn't grow with scale."""
+    file_ext = 'svg'
+
+    def __init__(self):
+        self._targets = []
+        self._xforms = []  # kept for image contexts; transforms are written into the output
+        self._color = (0.0, 0.0, 0.0, 1.0)
+
+    @property
+    def _out(self):
+        if not self._targets:
+            raise RuntimeError('SVGBackend draws inside image_context() only')
+        return self._targets[-1].elements
+
+    @staticmethod
+    def _paint(color, attr):
+        r, g, b = (int(round(min(1.0, max(0.0, c)) * 255)) for c in color[:3])
+        a = color[3] if len(color) > 3 else 1.0
+        paint = f'{attr}="#{r:02x}{g:02x}{b:02x}"'
+        return paint if a >= 1.0 else f'{paint} {attr}-opacity="{a:.3g}"'
+
+    def set_color(self, color):
+        self._color = tuple(color)
+
+    def fill_rect(self, x, y, w, h):
+        self._out.append(f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" '
+                         f'{self._paint(self._color, "fill")}/>')
+
+    def stroke_rect(self, x, y, w, h, line_width=1.0):
+        self._out.append(f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" '
+                         f'fill="none" {self._paint(self._color, "stroke")} '
+                         f'stroke-width="{line_width:.2f}"/>')
+
+    def path(self):
+        return RecordedPath(self)
+
+    def measure_string(self, text, font):
+        return len(text) * font[1] * 0.6, font[1] * 1.2
+
+    def draw_string(self, text, rect, font, color, alignment=ALIGN_LEFT):
+        x, y, w, h = rect
+        anchor = {ALIGN_CENTER: ('middle', x + w / 2.0), ALIGN_RIGHT: ('end', x + w)}
+        anchor, tx = anchor.get(alignment, ('start', x))
+        weight = ' font-weight="bold"' if 'Bold' in font[0] else ''
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        self._out.append(f'<text x="{tx:.2f}" y="{y + font[1]:.2f}" font-family="Helvetica, Arial, '
+                         f'sans-serif" font-size="{font[1]}"{weight} text-anchor="{anchor}" '
+                         f'{self._paint(color, "fill")}>{text}</text>')
+
+    def image_context(self, width, height, scale=1.0):
+        return _ImageContext(self, SVGImage(width, height))
+
+    def draw_image(self, image, x, y, w, h, alpha=1.0):
+        sx, sy = w / (image.width or 1), h / (image.height or 1)
+        opacity = f' opacity="{alpha:.3f}"' if alpha < 1.0 else ''
+        self._out.append(f'<g transform="translate({x:.2f} {y:.2f}) scale({sx:.4g} {sy:.4g})"{opacity}>')
+        self._out.extend(image.elements)
+        self._out.append('</g>')
+
+    @contextmanager
+    def transformed(self, tx, ty, scale):
+        self._out.append(f'<g transform="matrix({scale:.6g} 0 0 {scale:.6g} {tx:.2f} {ty:.2f})">')
+        try:
+            yield
+        finally:
+            self._out.append('</g>')
+
+    def encode(self, image):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{image.width:.2f}" '
+                f'height="{image.height:.2f}" viewBox="0 0 {image.width:.2f} {image.height:.2f}">\n'
+                + '\n'.join(image.elements) + '\n</svg>\n').encode('utf-8')
+
+    @staticmethod
+    def path_data(path):
+        """SVG ``d`` attribute for a recorded path; arcs become ``A`` commands."""
+        d, cur = [], None
+        for op in path.ops:
+            kind = op[0]
+            if kind in 'ML':
+                d.append(f'{kind}{op[1]:.2f} {op[2]:.2f}')
+                cur = (op[1], op[2])
+            elif kind == 'A':
+                _, cx, cy, r, a0, a1, cw = op
+                a0, a1 = RecordedPath.arc_angles(a0, a1, cw)
+                x0, y0 = cx + r * math.cos(a0), cy + r * math.sin(a0)
+                d.append(f'{"L" if cur else "M"}{x0:.2f} {y0:.2f}')
+                n = max(1, int(math.ceil(abs(a1 - a0) / math.pi - 1e-9)))
+                for j in range(1, n + 1):
+                    t = a0 + (a1 - a0) * j / n
+                    x, y = cx + r * math.cos(t), cy + r * math.sin(t)
+                    d.append(f'A{r:.2f} {r:.2f} 0 0 {1 if a1 > a0 else 0} {x:.2f} {y:.2f}')
+                cur = (x, y)
+            elif kind == 'C':
+                _, x, y, c1x, c1y, c2x, c2y = op
+                d.append(f'C{c1x:.2f} {c1y:.2f} {c2x:.2f} {c2y:.2f} {x:.2f} {y:.2f}')
+                cur = (x, y)
+            elif kind == 'Z':
+                d.append('Z')
+        return ' '.join(d)
+
+    def _stroke(self, path):
+        cap = ' stroke-linecap="round" stroke-linejoin="round"' if path.line_cap_style else ''
+        self._out.append(f'<path d="{self.path_data(path)}" fill="none" '
+                         f'{self._paint(self._color, "stroke")} '
+                         f'stroke-width="{path.line_width:.2f}"{cap}/>')
+
+    def _fill(self, path):
+        self._out.append(f'<path d="{self.path_data(path)}" fill-rule="evenodd" '
+                         f'{self._paint(self._color, "fill")}/>')
+
+class PDFImage:
+    """Content-stream operators and alpha states of one ``PDFBackend.image_context``."""
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.ops = []
+        self.alphas = set()
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+# Helvetica advance widths (1/1000 em) for the characters the board draws;
+# anything else is measured as an average glyph.
+_HELVETICA_WIDTHS = dict.fromkeys('0123456789', 556)
+_HELVETICA_WIDTHS.update({' ': 278, ',': 278, '.': 278, ':': 278, '-': 333, '(': 333,
+                          ')': 333, '×': 584, '=': 584, '+': 584, '/': 278, 'I': 278,
+                          'i': 222, 'l': 222, 'j': 222, 'f': 278, 't': 278, 'r': 333})
+
+class PDFBackend(DrawBackend):
+    """Writes a one-page PDF; arcs become Bézier curves and text uses Helvetica."""
+    file_ext = 'pdf'
+
+    def __init__(self):
+        self._targets = []
+        self._xforms = []  # kept for image contexts; transforms are written into the output
+        self._color = (0.0, 0.0, 0.0, 1.0)
+
+    @property
+    def _image(self):
+        if not self._targets:
+            raise RuntimeError('PDFBackend draws inside image_context() only')
+        return self._targets[-1]
+
+    def _paint(self, color, op):
+        """Colour operator (``rg`` fill / ``RG`` stroke) plus an alpha state if needed."""
+        r, g, b = (min(1.0, max(0.0, c)) for c in color[:3])
+        a = round(color[3], 3) if len(color) > 3 else 1.0
+        paint = f'{r:.3f} {g:.3f} {b:.3f} {op}'
+        if a >= 1.0:
+            return f'/GS1000 gs {paint}'
+        self._image.alphas.add(int(a * 1000))
+        return f'/GS{int(a * 1000)} gs {paint}'
+
+    def set_color(self, color):
+        self._color = tuple(color)
+
+    def fill_rect(self, x, y, w, h):
+        self._image.ops.append(f'{self._paint(self._color, "rg")} '
+                               f'{x:.2f} {y:.2f} {w:.2f} {h:.2f} re f')
+
+    def stroke_rect(self, x, y, w, h, line_width=1.0):
+        self._image.ops.append(f'{self._paint(self._color, "RG")} {line_width:.2f} w '
+                               f'{x:.2f} {y:.2f} {w:.2f} {h:.2f} re S')
+
+    def path(self):
+        return RecordedPath(self)
+
+    def measure_string(self, text, font):
+        return sum(_HELVETICA_WIDTHS.get(ch, 600) for ch in text) * font[1] / 1000.0, font[1] * 1.2
+
+    def draw_string(self, text, rect, font, color, alignment=ALIGN_LEFT):
+        x, y, w, h = rect
+        tw, _ = self.measure_string(text, font)
+        if alignment == ALIGN_CENTER:
+            x += (w - tw) / 2.0
+        elif alignment == ALIGN_RIGHT:
+            x += w - tw
+        face = '/F2' if 'Bold' in font[0] else '/F1'
+        raw = text.encode('cp1252', 'replace')
+        raw = raw.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+        # The page is flipped to y-down, so flip the text matrix back
+        self._image.ops.append(f'{self._paint(color, "rg")} BT {face} {font[1]} Tf '
+                               f'1 0 0 -1 {x:.2f} {y + font[1] * 0.9:.2f} Tm '
+                               f'({raw.decode("latin-1")}) Tj ET')
+
+    def image_context(self, width, height, scale=1.0):
+        return _ImageContext(self, PDFImage(width, height))
+
+    def draw_image(self, image, x, y, w, h, alpha=1.0):
+        # Group opacity would need a transparency-group XObject; the image's
+        # own paint sets absolute alphas, so a faded image is drawn from half way
+        if alpha < 0.5:
+            return
+        sx, sy = w / (image.width or 1), h / (image.height or 1)
+        self._image.ops.append(f'q {sx:.4g} 0 0 {sy:.4g} {x:.2f} {y:.2f} cm')
+        self._image.ops.extend(image.ops)
+        self._image.ops.append('Q')
+        self._image.alphas |= image.alphas
+
+    @contextmanager
+    def transformed(self, tx, ty, scale):
+        self._image.ops.append(f'q {scale:.6g} 0 0 {scale:.6g} {tx:.2f} {ty:.2f} cm')
+        try:
+            yield
+        finally:
+            self._image.ops.append('Q')
+
+    def encode(self, image):
+        stream = zlib.compress(('1 0 0 -1 0 %.2f cm\n' % image.height
+                                + '\n'.join(image.ops) + '\n').encode('latin-1'))
+        states = ' '.join(f'/GS{a} << /ca {a / 1000:.3f} /CA {a / 1000:.3f} >>'
+                          for a in sorted(image.alphas | {1000}))
+        objects = [
+            b'<< /Type /Catalog /Pages 2 0 R >>',
+            b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+            (f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {image.width:.2f} {image.height:.2f}] '
+             f'/Resources << /Font << /F1 5 0 R /F2 6 0 R >> /ExtGState << {states} >> >> '
+             f'/Contents 4 0 R >>').encode('latin-1'),
+            b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(stream) + stream
+            + b'\nendstream',
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold '
+            b'/Encoding /WinAnsiEncoding >>',
+        ]
+        out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for num, body in enumerate(objects, 1):
+            offsets.append(len(out))
+            out += b'%d 0 obj\n' % num + body + b'\nendobj\n'
+        xref = len(out)
+        out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        out += b''.join(b'%010d 00000 n \n' % off for off in offsets)
+        out += (b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                % (len(objects) + 1, xref))
+        return bytes(out)
+
+    @staticmethod
+    def path_data(path):
+        """Content-stream operators for a recorded path; arcs become ≤90° cubics."""
+        d, cur = [], False
+        for op in path.ops:
+            kind = op[0]
+            if kind in 'ML':
+                d.append(f'{op[1]:.2f} {op[2]:.2f} {"m" if kind == "M" else "l"}')
+                cur = True
+            elif kind == 'A':
+                _, cx, cy, r, a0, a1, cw = op
+                a0, a1 = RecordedPath.arc_angles(a0, a1, cw)
+                n = max(1, int(math.ceil(abs(a1 - a0) / (math.pi / 2) - 1e-9)))
+                d.append(f'{cx + r * math.cos(a0):.2f} {cy + r * math.sin(a0):.2f} '
+                         f'{"l" if cur else "m"}')
+                for j in range(n):
+                    t0 = a0 + (a1 - a0) * j / n
+                    t1 = a0 + (a1 - a0) * (j + 1) / n
+                    h = 4.0 / 3.0 * math.tan((t1 - t0) / 4.0) * r
+                    c0, s0, c1, s1 = math.cos(t0), math.sin(t0), math.cos(t1), math.sin(t1)
+                    d.append(f'{cx + r * c0 - h * s0:.2f} {cy + r * s0 + h * c0:.2f} '
+                             f'{cx + r * c1 + h * s1:.2f} {cy + r * s1 - h * c1:.2f} '
+                             f'{cx + r * c1:.2f} {cy + r * s1:.2f} c')
+                cur = True
+            elif kind == 'C':
+                _, x, y, c1x, c1y, c2x, c2y = op
+                d.append(f'{c1x:.2f} {c1y:.2f} {c2x:.2f} {c2y:.2f} {x:.2f} {y:.2f} c')
+            elif kind == 'Z':
+                d.append('h')
+        return ' '.join(d)
+
+    def _stroke(self, path):
+        cap = '1 J 1 j' if path.line_cap_style else '0 J 0 j'
+        self._image.ops.append(f'{self._paint(self._color, "RG")} {path.line_width:.2f} w '
+                               f'{cap} {self.path_data(path)} S')
+
+    def _fill(self, path):
+        self._image.ops.append(f'{self._paint(self._color, "rg")} {self.path_data(path)} f*')
+
+# ===== Text layout cache =====
+TEXT_CACHE_ENTRIES = 256   # measured (text, font) sizes
+LABEL_LAYOUT_ENTRIES = 8   # per-square label layouts, one per (terms, font, k)
+
+class TextLayoutCache:
+    """Bounded LRU of measured string sizes and per-square label layouts.
+
+    Sizes are keyed by ``(text, font)``; label layouts by ``(terms, font,
+    k)`` and hold each labelled square's text rect relative to the board's
+    top-left, so pans reuse them and the LOD zoom levels hit the same few
+    entries.  :meth:`clear` drops both (palette or layout changes).  Sizes in
+    ``known`` (from the geometry cache) are used before asking the backend.
+    """
+    def __init__(self, backend, max_entries=TEXT_CACHE_ENTRIES, max_layouts=LABEL_LAYOUT_ENTRIES):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_layouts = max_layouts
+        self.known = {}
+        self._sizes = OrderedDict()
+        self._layouts = OrderedDict()
+
+    def clear(self):
+        self._sizes.clear()
+        self._layouts.clear()
+
+    def measure(self, text, font):
+        key = (text, font)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            return size
+        size = self.known.get(key)
+        if size is None:
+            size = tuple(self.backend.measure_string(text, font))
+        self._sizes[key] = size
+        if len(self._sizes) > self.max_entries:
+            self._sizes.popitem(last=False)
+        return size
+
+    def sizes(self):
+        """``{(text, font): (w, h)}`` for every size measured or known."""
+        return {**self.known, **self._sizes}
+
+    def label_layout(self, tiling, font, k):
+        """``(s, x, y, text, rect)`` per square that gets a label at ``k`` points per unit.
+
+        ``rect`` is ``(dx, dy, w, h)`` from the board's top-left corner.
+        """
+        key = (tiling.terms, font, k)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+        layout, H = [], tiling.height
+        for i, (s, x, y) in enumerate(zip(tiling.size, tiling.x, tiling.y)):
+            rw = s * k
+            if (SHOW_TINY_1x1_LABELS or s != 1) and rw >= LABEL_MIN_SQUARE_PT:
+                txt = fib_label(i + 1)  # square i is F(i + 1) units wide
+                tw, th = self.measure(txt, font)
+                layout.append((s, x, y, txt, (x * k + rw / 2 - tw / 2,
+                                              (H - y - s) * k + rw / 2 - th / 2, tw, th)))
+        self._layouts[key] = layout
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return layout
+
+# ===== Static board layer cache =====
+LAYER_CACHE_ENTRIES = 6
+LAYER_CACHE_MAX_PIXELS = 24_000_000  # device pixels across all cached layers
+LAYER_PAD_PT = 2.0                   # room for the frame stroke outside the card
+
+class BoardLayerCache:
+    """Bounded LRU of rasterized static boards keyed by (palette, k, scale).
+
+    Pan only moves where a layer is blitted, so it never invalidates; palette
+    and zoom changes add entries until the count or pixel budget evicts the
+    least recently used ones.
+    """
+    def __init__(self, backend, max_entries=LAYER_CACHE_ENTRIES, max_pixels=LAYER_CACHE_MAX_PIXELS):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_pixels = max_pixels
+        self._layers = OrderedDict()
+        self._pixels = 0
+
+    def clear(self):
+        self._layers.clear()
+        self._pixels = 0
+
+    def image(self, key, width, height, scale, render):
+        """Return the cached layer for ``key``, rendering it with ``render()`` on a miss.
+
+        Returns ``None`` when a single layer would exceed the pixel budget
+        (deep zoom); the caller then draws the board directly.
+        """
+        img = self._layers.get(key)
+        if img is not None:
+            self._layers.move_to_end(key)
+            return img[0]
+        pixels = int(width * height * scale * scale)
+        if pixels > self.max_pixels:
+            return None
+        with self.backend.image_context(width, height, scale) as ctx:
+            render()
+            img = ctx.get_image()
+        self._layers[key] = (img, pixels)
+        self._pixels += pixels
+        while len(self._layers) > self.max_entries or self._pixels > self.max_pixels:
+            _, (_, evicted) = self._layers.popitem(last=False)
+            self._pixels -= evicted
+        return img
+
+# ===== Palette transitions =====
+PALETTE_FADE_S = 0.45        # crossfade duration when cycling palettes
+PALETTE_RAMP_STEPS = 32      # precomputed blends per transition
+PALETTE_KEYS = ('background', 'spiral', 'label', 'title', 'border')
+
+def _mix(a, b, t):
+    """``a`` blended ``t`` of the way to ``b``; a missing alpha counts as opaque."""
+    if len(a) != len(b):
+        a, b = tuple(a) + (1.0,) * (4 - len(a)), tuple(b) + (1.0,) * (4 - len(b))
+    return tuple(x + (y - x) * t for x, y in zip(a, b))
+
+def palette_ramp(start, end, steps=PALETTE_RAMP_STEPS):
+    """``steps`` palettes blending ``start`` into ``end`` (both ends included).
+
+    Every colour and every ``tints`` entry is interpolated; a size only one
+    palette tints takes the other's :func:`square_tint` for it.  Each step is
+    named apart so it can never alias either palette's cached layers.
+    """
+    steps = max(2, steps)
+    sizes = list(dict.fromkeys(list(start['tints']) + list(end['tints'])))
+    pairs = [(size, square_tint(start, size, i), square_tint(end, size, i))
+             for i, size in enumerate(sizes)]
+    ramp = []
+    for n in range(steps):
+        t = n / (steps - 1)
+        pal = {key: _mix(start[key], end[key], t) for key in PALETTE_KEYS}
+        pal['name'] = f"{start['name']} → {end['name']} {n}/{steps - 1}"
+        pal['tints'] = {size: _mix(a, b, t) for size, a, b in pairs}
+        ramp.append(pal)
+    return ramp
+
+class PaletteTransition:
+    """An animated crossfade from ``start`` to ``end``.
+
+    The colour ramp is built once, so a frame only looks up ``palette`` for
+    its progress ``t``.  Where the static board comes from the layer cache the
+    renderer composites the two palettes' own layers (``end`` at ``t``) rather
+    than repainting squares in the blended colours.
+    """
+    def __init__(self, start, end, now=0.0, duration=PALETTE_FADE_S, steps=PALETTE_RAMP_STEPS):
+        self.start, self.end = start, end
+        self.t0 = now
+        self.duration = duration
+        self.ramp = palette_ramp(start, end, steps)
+        self.t = 0.0 if duration > 0 else 1.0
+
+    def advance(self, now):
+        """Move to time ``now``; ``False`` once the fade has finished."""
+        if self.duration > 0:
+            self.t = min(1.0, max(0.0, (now - self.t0) / self.duration))
+        return self.t < 1.0
+
+    @property
+    def palette(self):
+        """Blended palette for the current progress (the nearest ramp step)."""
+        return self.ramp[int(round(self.t * (len(self.ramp) - 1)))]
+
+# ===== Board renderer =====
+class BoardRenderer:
+    """Draws the poster board for one palette through a :class:`DrawBackend`.
+
+    Each stage (card, squares, labels, grid, frame, spiral) is its own method
+    so callers can time or skip them.  ``FibPoster`` drives one of these over
+    a ``UIBackend``; headless exports use ``RasterBackend`` or ``SVGBackend``.
+    """
+    def __init__(self, backend, palette, layers=None, timer=None, text=None):
+        self.backend = backend
+        self.palette = palette
+        self.layers = layers
+        self.text = text or TextLayoutCache(backend)
+        self.timer = timer  # a FrameStats (or None) collecting per-stage times
+
+    def _timed(self, name, fn, *args):
+        timer = self.timer
+        if timer is None:
+            return fn(*args)
+        t0 = timer.clock()
+        try:
+            return fn(*args)
+        finally:
+            timer.add_stage(name, timer.clock() - t0)
+
+    def draw_board(self, m, spiral_progress=1.0, cached=False, fade=None):
+        """Draw ONLY the poster board (used on-screen and for export).
+
+        With ``cached`` the static board comes from the layer cache and only
+        the spiral is stroked on top of it.  During a :class:`PaletteTransition`
+        (``fade``) the start and end palettes' layers are composited; boards
+        too large to cache are painted in the ramp's blended palette instead.
+        """
+        if fade is None:
+            if not (cached and self.layers is not None and self._timed('blit', self.blit_static, m)):
+                self.draw_static(m)
+            self._timed('spiral', self.draw_spiral, m, spiral_progress)
+            return
+        with self.using_palette(fade.palette):
+            if not (cached and self.layers is not None
+                    and self._timed('blit', self.blit_static, m, fade.start)
+                    and self._timed('blit', self.blit_static, m, fade.end, fade.t)):
+                self.draw_static(m)
+            self._timed('spiral', self.draw_spiral, m, spiral_progress)
+
+    def blit_static(self, m, palette=None, alpha=1.0):
+        palette = palette or self.palette
+        pad = LAYER_PAD_PT
+        w, h = m.W * m.k + 2 * pad, m.H * m.k + 2 * pad
+
+        def render():
+            with self.using_palette(palette):
+                self.draw_static(m.with_origin(pad, pad))
+
+        img = self.layers.image((palette['name'], m.tiling.terms, m.k, m.scale), w, h, m.scale, render)
+        if img is None:
+            return False
+        if alpha > 0.0:
+            self.backend.draw_image(img, m.ox - pad, m.oy - pad, w, h, alpha)
+        return True
+
+    @contextmanager
+    def using_palette(self, palette):
+        """Temporarily draw with ``palette`` (a transition's blend or one end of it)."""
+        saved, self.palette = self.palette, palette
+        try:
+            yield
+        finally:
+            self.palette = saved
+
+    def draw_static(self, m):
+        """Card, squares, labels, grid and frame — everything but the spiral."""
+        vis = self.visible_window(m)
+        timed = self._timed
+        timed('card', self.draw_card, m)
+        timed('squares', self.draw_squares, m, vis)
+        timed('labels', self.draw_labels, m, vis)
+        timed('grid', self.draw_grid, m, vis)
+        timed('frame', self.draw_frame, m)
+
+    @staticmethod
+    def visible_window(m):
+        """Visible part of the board in grid units (whole board when not clipped)."""
+        vis = m.visible_grid_rect(pad_pt=2.0) or (0, 0, m.W, m.H)
+        return max(0, vis[0]), max(0, vis[1]), min(m.W, vis[2]), min(m.H, vis[3])
+
+    def draw_card(self, m):
+        self.backend.set_color(self.palette['background'])
+        self.backend.fill_rect(m.ox, m.oy, m.W * m.k, m.H * m.k)
+
+    def draw_squares(self, m, vis):
+        """Tinted squares; offscreen ones are culled."""
+        be, palette, t = self.backend, self.palette, m.tiling
+        vx0, vy0, vx1, vy1 = vis
+        k, left, top = m.k, m.ox, m.oy + m.H * m.k
+        for i, s, x, y in zip(range(t.terms), t.size, t.x, t.y):
+            if x > vx1 or y > vy1 or x + s < vx0 or y + s < vy0:
+                continue
+            rw = s * k
+            rx, ry = left + x * k, top - (y + s) * k
+            be.set_color(square_tint(palette, s, i))
+            be.fill_rect(rx, ry, rw, rw)
+            be.set_color((0, 0, 0, 0.08))
+            be.stroke_rect(rx, ry, rw, rw)
+
+    def draw_labels(self, m, vis):
+        """Centered term labels, only on visible squares big enough to read."""
+        be, color = self.backend, self.palette['label']
+        vx0, vy0, vx1, vy1 = vis
+        ox, oy = m.ox, m.oy
+        for s, x, y, txt, (dx, dy, tw, th) in self.text.label_layout(m.tiling, FONT_LABEL, m.k):
+            if x > vx1 or y > vy1 or x + s < vx0 or y + s < vy0:
+                continue
+            be.draw_string(txt, (ox + dx, oy + dy, tw, th), FONT_LABEL, color)
+
+    def draw_grid(self, m, vis):
+        """Visible grid lines only; skipped once cells are too dense to read."""
+        vx0, vy0, vx1, vy1 = vis
+        if not (SHOW_GRID and m.k * m.scale >= GRID_MIN_SPACING_PX and vx0 < vx1 and vy0 < vy1):
+            return
+        self.backend.set_color((0.3, 0.5, 0.8, GRID_ALPHA))
+        line = self.backend.path()
+        line.line_width = 0.5
+        py0, py1 = m.y_to_py(vy1), m.y_to_py(vy0)
+        for gx in range(int(math.ceil(vx0)), int(math.floor(vx1)) + 1):
+            x = m.crisp(m.x_to_px(gx), line.line_width)
+            line.move_to(x, py0)
+            line.line_to(x, py1)
+        px0, px1 = m.x_to_px(vx0), m.x_to_px(vx1)
+        for gy in range(int(math.ceil(vy0)), int(math.floor(vy1)) + 1):
+            y = m.crisp(m.y_to_py(gy), line.line_width)
+            line.move_to(px0, y)
+            line.line_to(px1, y)
+        line.stroke()
+
+    def draw_frame(self, m):
+        """Frame + divider between the largest square and the rest."""
+        be = self.backend
+        be.set_color(self.palette['border'] + (0.3,))
+        be.stroke_rect(m.ox, m.oy, m.W * m.k, m.H * m.k, 1.5)
+        if m.tiling.divider:
+            (x0, y0), (x1, y1) = m.tiling.divider
+            d = be.path()
+            d.move_to(m.crisp(m.x_to_px(x0), 1.0), m.crisp(m.y_to_py(y0), 1.0))
+            d.line_to(m.crisp(m.x_to_px(x1), 1.0), m.crisp(m.y_to_py(y1), 1.0))
+            d.line_width = 1.0
+            d.stroke()
+
+    @staticmethod
+    def spiral_width(m):
+        return max(2.0, SPIRAL_WIDTH_PT * (m.k / 20.0))
+
+    def draw_spiral(self, m, spiral_progress=1.0, start=0.0):
+        """Spiral (no arrow) up to ``spiral_progress`` of its length.
+
+        A ``start`` > 0 strokes only the section after that progress, for
+        frames drawn over the previous one.
+        """
+        spiral_progress = max(0.0, min(1.0, spiral_progress))
+        if start >= spiral_progress:
+            return
+        stroke = self.spiral_width(m)
+        rect = m.visible_grid_rect(pad_pt=stroke)
+        if rect is not None and rect[0] <= 0 and rect[1] <= 0 and rect[2] >= m.W and rect[3] >= m.H:
+            rect = None  # whole board on screen: nothing to cull
+        path = self.backend.path()
+        if isinstance(path, RecordedPath):
+            path.tolerance = m.tolerance  # CoreGraphics flattens ui.Path arcs itself
+        if SPIRAL_USE_ARCS:
+            add_spiral_arcs(path, m, spiral_progress, rect, start)
+        elif rect is not None or start > 0:
+            add_spiral_polyline(path, m, spiral_progress, rect, start=start)
+        else:
+            geo = spiral_geometry(m)
+            if not geo.points:
+                return
+            n, tail = geo.cut(spiral_progress)
+            pts = geo.points
+            path.move_to(*pts[0])
+            for i in range(1, n):
+                path.line_to(*pts[i])
+            path.line_to(*tail)
+        path.line_width = stroke
+        self.backend.set_color(self.palette['spiral'])
+        path.stroke()
+
+    def draw_deep(self, view, tiles, rect):
+        """Deep-zoom mode: the part of the infinite golden tiling inside ``rect``."""
+        visible = tiles.visible(view, rect)
+        self._timed('squares', self.draw_deep_squares, visible)
+        self._timed('labels', self.draw_deep_labels, visible)
+        self._timed('spiral', self.draw_deep_spiral, view, visible)
+
+    def draw_deep_squares(self, visible):
+        be, palette = self.backend, self.palette
+        for j, x, y, side, _ in visible:
+            be.set_color(square_tint(palette, fib(j + 1) if j >= 0 else 0, j))
+            be.fill_rect(x, y, side, side)
+            be.set_color((0, 0, 0, 0.08))
+            be.stroke_rect(x, y, side, side)
+
+    def draw_deep_labels(self, visible):
+        be, color, measure = self.backend, self.palette['label'], self.text.measure
+        for j, x, y, side, tile in visible:
+            if side < LABEL_MIN_SQUARE_PT:
+                continue
+            tw, th = measure(tile[4], FONT_LABEL)
+            if tw < side * 0.9:
+                be.draw_string(tile[4], (x + (side - tw) / 2, y + (side - th) / 2, tw, th),
+                               FONT_LABEL, color)
+
+    def draw_deep_spiral(self, view, visible):
+        """One quarter arc per visible square; gaps in the run start a new subpath."""
+        path = self.backend.path()
+        native = hasattr(path, 'add_arc')
+        prev = None
+        for j, _, _, _, (_, f, arc, a0, _) in visible:
+            px, py = view.to_view(arc)
+            r = f * view.k
+            a1 = a0 + math.pi / 2
+            if native:
+                if prev != j - 1:
+                    path.move_to(px + r * math.cos(a0), py - r * math.sin(a0))
+                path.add_arc(px, py, r, -a0, -a1, False)
+            else:
+                _add_arc_bezier(path, px, py, r, -a0, -a1, prev != j - 1)
+            prev = j
+        path.line_width = view.stroke
+        self.backend.set_color(self.palette['spiral'])
+        path.stroke()
+
+def render_board_image(backend, palette, m, spiral_progress=1.0, background=(1, 1, 1, 1)):
+    """Render the board alone (``m`` should be zero-origin) into a backend image."""
+    bw, bh = m.W * m.k, m.H * m.k
+    with backend.image_context(bw, bh, m.scale) as ctx:
+        backend.set_color(background)
+        backend.fill_rect(0, 0, bw, bh)
+        BoardRenderer(backend, palette).draw_board(m, spiral_progress)
+        return ctx.get_image()
+
+# ===== Deep zoom (golden tiling) =====
+PHI = (1 + 5 ** 0.5) / 2
+DEEP_MIN_SQUARE_PT = 0.75  # smaller squares (and their arcs) are not generated
+DEEP_MAX_POLE_PT = 1e5     # zooming in never pushes the pole further than this off screen
+
+# Squares of side φ^j laid out by FibTiling's placement cycle tile the plane
+# exactly: square j + 1 is square j scaled by φ and turned 90° CCW about the
+# spiral's pole.  Square 0 relative to the pole (complex, y up) follows from
+# square 1 sitting east of it, bottom-aligned; everything else is a rotation.
+_GOLDEN_C0 = ((1 + PHI) / 2 + 0.5j * (PHI - 1)) / (PHI * 1j - 1)  # centre of square 0
+_GOLDEN_ARC0 = _GOLDEN_C0 + (0.5 + 0.5j)                             # its arc's centre
+_GOLDEN_RHO = (math.hypot(max(0.0, abs(_GOLDEN_C0.real) - 0.5), max(0.0, abs(_GOLDEN_C0.imag) - 0.5)),
+               abs(_GOLDEN_C0) + 0.5 ** 0.5)  # nearest/farthest point of square 0 from the pole
+_QUARTER_TURNS = (1, 1j, -1, -1j)
+
+class DeepView:
+    """Viewport over the infinite golden tiling: a level, a scale and the pole's position.
+
+    Geometry is relative to the pole in units of φ^``level``, with ``k``
+    points per unit kept in [1, φ) by shifting the level, so the numbers
+    drawn stay near 1 at any depth and float precision never runs out.
+    ``px, py`` is the pole in view coordinates and ``stroke`` the spiral's
+    line width, carried over from the board.  Immutable: gestures build new
+    views.
+    """
+    __slots__ = ('level', 'k', 'px', 'py', 'stroke')
+
+    def __init__(self, level, k, px, py, stroke=SPIRAL_WIDTH_PT):
+        shift = math.floor(math.log(k, PHI))
+        self.level, self.k = level - shift, k / PHI ** shift
+        self.px, self.py = px, py
+        self.stroke = stroke
+
+    @classmethod
+    def for_map(cls, m, at=None):
+        """View continuing ``m``'s board: one golden square keeps its board square's size and place.
+
+        That is the square under view point ``at``, else the largest.  Board
+        squares only approach the golden ratio, so the others shift slightly.
+        """
+        t = m.tiling
+        i = m.square_at(*at) if at is not None else None
+        if i is None:
+            i = t.terms - 1
+        s = t.size[i]
+        sx, sy = m.pt(t.x[i] + s / 2.0, t.y[i] + s / 2.0)
+        k = s * m.k
+        q = _QUARTER_TURNS[i % 4] * _GOLDEN_C0
+        return cls(i, k, sx - k * q.real, sy + k * q.imag, BoardRenderer.spiral_width(m))
+
+    def to_view(self, q):
+        return self.px + self.k * q.real, self.py - self.k * q.imag
+
+    def panned(self, dx, dy):
+        return DeepView(self.level, self.k, self.px + dx, self.py + dy, self.stroke)
+
+    def zoomed(self, f, anchor, to=None):
+        """Scale by ``f`` about view point ``anchor``, which then sits at ``to``."""
+        ax, ay = anchor
+        tx, ty = to or anchor
+        dx, dy = (self.px - ax) * f, (self.py - ay) * f
+        d = math.hypot(dx, dy)
+        if f > 1 and d > DEEP_MAX_POLE_PT:
+            # Away from the pole there is nothing left to resolve: keep it within reach
+            c = max(DEEP_MAX_POLE_PT, d / f) / d
+            dx, dy = dx * c, dy * c
+        return DeepView(self.level, self.k * f, tx + dx, ty + dy, self.stroke)
+
+    def square_range(self, rect):
+        """Indices ``(j0, j1)`` of the squares that can reach ``rect`` at a drawable size."""
+        x, y, w, h = rect
+        dx0, dx1 = x - self.px, x + w - self.px
+        dy0, dy1 = y - self.py, y + h - self.py
+        far = math.hypot(max(abs(dx0), abs(dx1)), max(abs(dy0), abs(dy1)))
+        near = math.hypot(max(0.0, dx0, -dx1), max(0.0, dy0, -dy1))
+        lg, k = math.log(PHI), self.k
+        lo = math.ceil(math.log(DEEP_MIN_SQUARE_PT / k) / lg)
+        if near > 0:
+            lo = max(lo, math.floor(math.log(near / (k * _GOLDEN_RHO[1])) / lg))
+        hi = math.ceil(math.log(max(far, 1e-9) / (k * _GOLDEN_RHO[0])) / lg)
+        return self.level + lo, self.level + max(lo, hi)
+
+def deep_label(j):
+    """Label for golden square ``j``: the Fibonacci term it continues, or φ^j inside square 0."""
+    return fib_label(j + 1) if j >= 0 else f'φ^{j}'
+
+class DeepTiles:
+    """Lazily generated squares of the golden tiling around a :class:`DeepView`.
+
+    A tile is one square's geometry relative to the pole at the view's level
+    (centre, side, arc centre, start angle) plus its label.  Tiles are built
+    the first frame they are in range and dropped the first frame they are
+    not, so memory and per-frame work follow what is on screen whatever the
+    depth.
+    """
+    def __init__(self):
+        self._tiles = {}
+        self.largest = None  # index of the largest square drawn last frame
+
+    def clear(self):
+        self._tiles.clear()
+        self.largest = None
+
+    def __len__(self):
+        return len(self._tiles)
+
+    @staticmethod
+    def _build(j, level):
+        f, turn = PHI ** (j - level), _QUARTER_TURNS[j % 4]
+        return (f * turn * _GOLDEN_C0, f, f * turn * _GOLDEN_ARC0,
+                math.pi * (1 + (j % 4) / 2.0), deep_label(j))
+
+    def visible(self, view, rect):
+        """``(j, x, y, side, tile)`` in view points for each square overlapping ``rect``, smallest first."""
+        j0, j1 = view.square_range(rect)
+        level, k = view.level, view.k
+        rx0, ry0, rx1, ry1 = rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3]
+        tiles, keep, largest = self._tiles, {}, None
+        out = []
+        for j in range(j0, j1 + 1):
+            key = (j, level)
+            tile = tiles.get(key)
+            if tile is None:
+                tile = self._build(j, level)
+            keep[key] = tile
+            cx, cy = view.to_view(tile[0])
+            side = tile[1] * k
+            x, y = cx - side / 2.0, cy - side / 2.0
+            if x > rx1 or y > ry1 or x + side < rx0 or y + side < ry0:
+                continue
+            out.append((j, x, y, side, tile))
+            largest = j
+        self._tiles = keep
+        self.largest = largest
+        return out
+
+# ===== Export =====
+VECTOR_BACKENDS = {'svg': SVGBackend, 'pdf': PDFBackend}  # resolution-independent formats
+EXPORT_BAND_PIXELS = 4_000_000     # device pixels rendered per horizontal band
+TILED_EXPORT_MIN_PIXELS = 8_000_000  # larger PNGs are rendered in bands
+
+def board_bands(backend, palette, m, band_pixels=EXPORT_BAND_PIXELS, background=(1, 1, 1, 1)):
+    """Yield the board's device-pixel rows one horizontal band at a time.
+
+    Each band draws the board with its origin shifted up by the band's top
+    and a clip of the band, so culling skips everything outside it.  Yields
+    an iterator over the band's rows, valid until the next band is drawn.
+    """
+    bw, bh = m.W * m.k, m.H * m.k
+    width_px, height_px = pixel_extent(bw, m.scale), pixel_extent(bh, m.scale)
+    band_px = max(1, min(height_px, band_pixels // width_px))
+    renderer = BoardRenderer(backend, palette)
+    for y0 in range(0, height_px, band_px):
+        rows = min(band_px, height_px - y0)
+        band_h = rows / m.scale
+        mb = m.with_origin(m.ox, m.oy - y0 / m.scale, clip=(0.0, 0.0, bw, band_h))
+        with backend.image_context(bw, band_h, m.scale) as ctx:
+            backend.set_color(background)
+            backend.fill_rect(0, 0, bw, band_h)
+            renderer.draw_board(mb, 1.0)
+            img = ctx.get_image()
+        yield itertools.islice(backend.image_rows(img), rows)
+        del img
+
+def export_board_tiled(path, backend, palette, m, band_pixels=EXPORT_BAND_PIXELS,
+                       background=(1, 1, 1, 1), progress=None):
+    """Render the board in horizontal bands and stream them into a PNG at ``path``.
+
+    Bands come from :func:`board_bands` and go straight to
+    :class:`PNGStreamWriter`.  Peak memory is one band plus the zlib state,
+    whatever the poster size.  ``progress(done, total)`` is called after
+    each band.
+    """
+    width_px = pixel_extent(m.W * m.k, m.scale)
+    height_px = pixel_extent(m.H * m.k, m.scale)
+    band_px = max(1, min(height_px, band_pixels // width_px))
+    bands = (height_px + band_px - 1) // band_px
+    with open(path, 'wb') as f:
+        writer = PNGStreamWriter(f, width_px, height_px)
+        for band, rows in enumerate(board_bands(backend, palette, m, band_pixels, background)):
+            writer.write_rows(rows)
+            if progress is not None:
+                progress(band + 1, bands)
+        writer.close()
+    return path
+
+def export_board(path, palette=None, terms=BOARD_TERMS, k=20.0, scale=2.0, backend=None,
+                 tiled=None):
+    """Headless export: write the board to ``path`` (``.svg``/``.pdf`` → vector, else PNG).
+
+    ``k`` is points per grid unit and ``scale`` device pixels per point, so a
+    PNG is ``width * k * scale`` pixels wide; vector files ignore ``scale``.  PNGs above
+    ``TILED_EXPORT_MIN_PIXELS`` are streamed in bands unless ``tiled`` says
+    otherwise.
+    """
+    vector = VECTOR_BACKENDS.get(os.path.splitext(path)[1].lower().lstrip('.'))
+    if backend is None:
+        backend = vector() if vector else RasterBackend()
+    m = Map.for_board(get_tiling(terms), k, scale)
+    palette = palette or PALETTES[0]
+    if tiled is None:
+        tiled = not vector and (m.W * m.k * scale) * (m.H * m.k * scale) > TILED_EXPORT_MIN_PIXELS
+    if tiled:
+        return export_board_tiled(path, backend, palette, m)
+    img = render_board_image(backend, palette, m)
+    with open(path, 'wb') as f:
+        f.write(backend.encode(img))
+    return path
+
+# ===== Animation export =====
+ANIM_EXPORT_FPS = 30
+ANIM_EXPORT_DURATION = 3.0  # seconds; matches the on-screen draw-in
+
+def animation_progresses(fps=ANIM_EXPORT_FPS, duration=ANIM_EXPORT_DURATION):
+    """Spiral progress of every frame, 0 → 1 inclusive, for ``duration`` s at ``fps``."""
+    n = max(2, int(round(fps * duration)) + 1)
+    return [i / (n - 1) for i in range(n)]
+
+def spiral_frame_box(m, drawn, progress):
+    """Device-pixel box ``(x0, y0, x1, y1)`` a frame repaints going from ``drawn`` to ``progress``.
+
+    It starts at the last whole quarter turn before ``drawn``, because the
+    arc cut there is flattened anew once it grows, and is padded by the
+    stroke half-width, rasterizer rounding and the unit arc table's error.
+    """
+    tiling, s = m.tiling, m.scale
+    bw, bh = m.W * m.k, m.H * m.k
+    i, _ = tiling.arc_cut(drawn)
+    box = spiral_section_bounds(m, tiling.arc_cum[i] / tiling.arc_cum[-1], progress)
+    pad = BoardRenderer.spiral_width(m) / 2 + 2.0 / s + 1e-5 * max(bw, bh)
+    return (max(0, math.floor((box[0] - pad) * s)), max(0, math.floor((box[1] - pad) * s)),
+            min(pixel_extent(bw, s), math.ceil((box[2] + pad) * s)),
+            min(pixel_extent(bh, s), math.ceil((box[3] + pad) * s)))
+
+def render_spiral_frames(backend, palette, m, progresses, background=(1, 1, 1, 1)):
+    """Yield ``(progress, image)`` per frame of the spiral draw-in, drawn incrementally.
+
+    The static board is painted once and kept as an image.  Each frame then
+    repaints only its :func:`spiral_frame_box`: the board under it is
+    restored from that image and the arcs crossing it are stroked afresh,
+    so seams never blend twice.
+    The yielded image is the live canvas: encode it before advancing.
+    """
+    bw, bh = m.W * m.k, m.H * m.k
+    renderer = BoardRenderer(backend, palette)
+    with backend.image_context(bw, bh, m.scale) as ctx:
+        backend.set_color(background)
+        backend.fill_rect(0, 0, bw, bh)
+        renderer.draw_static(m)
+        board = ctx.get_image()
+    s = m.scale
+    with backend.image_context(bw, bh, s) as ctx:
+        backend.draw_image(board, 0, 0, *board.size)
+        drawn = 0.0
+        for progress in progresses:
+            if progress > drawn:
+                x0, y0, x1, y1 = (v / s for v in spiral_frame_box(m, drawn, progress))
+                with backend.image_context(x1 - x0, y1 - y0, s) as patch:
+                    with backend.transformed(-x0, -y0, 1.0):
+                        backend.draw_image(board, 0, 0, *board.size)
+                        renderer.draw_spiral(m.with_origin(m.ox, m.oy, (x0, y0, x1 - x0, y1 - y0)),
+                                             progress)
+                    img = patch.get_image()
+                backend.paste_image(img, x0, y0, *img.size)
+                drawn = progress
+            yield progress, ctx.get_image()
+
+def _common_prefix(a, b):
+    """Length of the common prefix of two equal-length byte strings (binary search)."""
+    a, b = memoryview(a), memoryview(b)  # slices compare in place, without copies
+    lo, hi = 0, len(a)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _common_suffix(a, b):
+    a, b = memoryview(a), memoryview(b)
+    lo, hi = 0, len(a)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _changed_bytes(a, b):
+    """``(start, end)`` byte offsets spanning every difference between two unequal rows."""
+    if _numpy() is not None:
+        diff = np.flatnonzero(np.frombuffer(a, np.uint8) != np.frombuffer(b, np.uint8))
+        return int(diff[0]), int(diff[-1]) + 1
+    return _common_prefix(a, b), len(a) - _common_suffix(a, b)
+
+def changed_box(prev, rows):
+    """Pixel box ``(x0, y0, x1, y1)`` where two RGBA8 frames differ, or ``None``."""
+    changed = [y for y, (a, b) in enumerate(zip(prev, rows)) if a != b]
+    if not changed:
+        return None
+    x0, x1 = len(rows[0]) // 4, 0
+    for y in changed:
+        start, end = _changed_bytes(prev[y], rows[y])
+        x0 = min(x0, start // 4)
+        x1 = max(x1, (end + 3) // 4)
+    return x0, changed[0], x1, changed[-1] + 1
+
+class APNGWriter:
+    """Animated PNG: a full first frame, then each frame's changed box only.
+
+    Frames use ``APNG_DISPOSE_OP_NONE``, so a sub-rectangle replaces just the
+    pixels that changed and everything else carries over from the last frame.
+    """
+    def __init__(self, f, width, height, frames, fps, loops=0, level=6):
+        self.f, self.width, self.height = f, width, height
+        self.level = level
+        self._seq = 0
+        self._delay = struct.pack('>HH', 1, max(1, int(round(fps))))
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+        f.write(_png_chunk(b'acTL', struct.pack('>II', frames, loops)))
+
+    def write_frame(self, rows, box=None):
+        """Write a frame; ``rows`` cover the ``(x0, y0, x1, y1)`` box (default: whole image)."""
+        x0, y0, x1, y1 = box or (0, 0, self.width, self.height)
+        self.f.write(_png_chunk(b'fcTL', struct.pack('>IIIII', self._seq, x1 - x0, y1 - y0, x0, y0)
+                                + self._delay + b'\x00\x00'))
+        self._seq += 1
+        data = zlib.compress(b''.join(b'\x00' + row for row in rows), self.level)
+        if self._seq == 1:
+            self.f.write(_png_chunk(b'IDAT', data))
+        else:
+            self.f.write(_png_chunk(b'fdAT', struct.pack('>I', self._seq) + data))
+            self._seq += 1
+
+    def close(self):
+        self.f.write(_png_chunk(b'IEND', b''))
+
+def _lzw_encode(indices, min_size):
+    """GIF-flavoured LZW (variable code width, clear on a full table) of palette indices."""
+    clear = 1 << min_size
+    out, acc, nbits = bytearray(), 0, 0
+    table, next_code, size = {}, clear + 2, min_size + 1
+
+    def emit(code):
+        nonlocal acc, nbits
+        acc |= code << nbits
+        nbits += size
+        while nbits >= 8:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            nbits -= 8
+
+    emit(clear)
+    prefix = indices[0]
+    for ch in indices[1:]:
+        key = prefix << 8 | ch
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > 1 << size and size < 12:
+                size += 1
+        else:
+            emit(clear)
+            table, next_code, size = {}, clear + 2, min_size + 1
+        prefix = ch
+    emit(prefix)
+    emit(clear + 1)
+    if nbits:
+        out.append(acc & 0xFF)
+    return bytes(out)
+
+class GIFWriter:
+    """Animated GIF with a local colour table per frame.
+
+    Each frame is the changed box only and is left in place (disposal 1).  A
+    box with more than 256 colours (anti-aliased ``ui`` output) falls back to
+    a 6×7×6 colour cube.
+    """
+    def __init__(self, f, width, height, fps, loops=0):
+        self.f, self.width, self.height = f, width, height
+        self._delay = max(2, int(round(100.0 / fps)))  # centiseconds; browsers clamp < 2
+        f.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0, 0, 0))
+        f.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loops) + b'\x00')
+
+    @staticmethod
+    def _quantize(rows, x0, x1):
+        colors, idx = {}, bytearray()
+        for row in rows:
+            for j in range(4 * x0, 4 * x1, 4):
+                rgb = row[j:j + 3]
+                i = colors.get(rgb)
+                if i is None:
+                    if len(colors) == 256:
+                        return GIFWriter._cube(rows, x0, x1)
+                    i = colors[rgb] = len(colors)
+                idx.append(i)
+        return b''.join(colors), idx
+
+    @staticmethod
+    def _cube(rows, x0, x1):
+        table = bytes(c for r in range(6) for g in range(7) for b in range(6)
+                      for c in (r * 51, g * 255 // 6, b * 51))
+        idx = bytearray(row[j] * 6 // 256 * 42 + row[j + 1] * 7 // 256 * 6 + row[j + 2] * 6 // 256
+                        for row in rows for j in range(4 * x0, 4 * x1, 4))
+        return table, idx
+
+    def write_frame(self, rows, box=None):
+        """Write a frame; ``rows`` are full-width RGBA8 rows of the box's y range."""
+        x0, y0, x1, y1 = box or (0, 0, self.width, self.height)
+        table, idx = self._quantize(rows, x0, x1)
+        bits = max(1, (len(table) // 3 - 1).bit_length())
+        table += bytes(3 * (1 << bits) - len(table))
+        self.f.write(b'\x21\xf9\x04\x04' + struct.pack('<H', self._delay) + b'\x00\x00')
+        self.f.write(b'\x2c' + struct.pack('<HHHHB', x0, y0, x1 - x0, y1 - y0, 0x80 | (bits - 1)))
+        self.f.write(table)
+        min_size = max(2, bits)
+        data = _lzw_encode(idx, min_size)
+        self.f.write(bytes((min_size,)))
+        for i in range(0, len(data), 255):
+            block = data[i:i + 255]
+            self.f.write(bytes((len(block),)) + block)
+        self.f.write(b'\x00')
+
+    def close(self):
+        self.f.write(b'\x3b')
+
+ANIM_FORMATS = {'.png': 'apng', '.apng': 'apng', '.gif': 'gif'}  # anything else: frame directory
+
+def export_animation(path, palette=None, terms=BOARD_TERMS, k=20.0, scale=1.0, fps=ANIM_EXPORT_FPS,
+                     duration=ANIM_EXPORT_DURATION, backend=None, background=(1, 1, 1, 1),
+                     progress=None):
+    """Export the spiral draw-in as an APNG (``.png``/``.apng``), a GIF, or a PNG directory.
+
+    Frames come from :func:`render_spiral_frames`; the animated formats store
+    only the box that changed since the previous frame.  A ``path`` without a
+    known extension is a directory that receives ``frame_0000.png`` onwards.
+    ``progress(done, total)`` is called after each frame.
+    """
+    fmt = ANIM_FORMATS.get(os.path.splitext(path)[1].lower(), 'frames')
+    backend = backend or RasterBackend()
+    m = Map.for_board(get_tiling(terms), k, scale)
+    progresses = animation_progresses(fps, duration)
+    width, height = pixel_extent(m.W * m.k, scale), pixel_extent(m.H * m.k, scale)
+    frames = render_spiral_frames(backend, palette or PALETTES[0], m, progresses, background)
+    if fmt == 'frames':
+        os.makedirs(path, exist_ok=True)
+        for i, (_, img) in enumerate(frames):
+            with open(os.path.join(path, f'frame_{i:04d}.png'), 'wb') as f:
+                f.write(encode_png(width, height, backend.image_rows(img)))
+            if progress is not None:
+                progress(i + 1, len(progresses))
+        return path
+    with open(path, 'wb') as f:
+        if fmt == 'gif':
+            writer = GIFWriter(f, width, height, fps)
+        else:
+            writer = APNGWriter(f, width, height, len(progresses), fps)
+        for i, (rows, box) in enumerate(animation_deltas(backend, m, frames, fmt)):
+            if box is None:
+                writer.write_frame(rows)
+            else:
+                writer.write_frame(rows, box)
+            if progress is not None:
+                progress(i + 1, len(progresses))
+        writer.close()
+    return path
+
+def animation_deltas(backend, m, frames, fmt='apng'):
+    """Turn ``(progress, image)`` frames into what an animation writer stores.
+
+    Yields ``(rows, None)`` for the full first frame, then ``(rows, box)``
+    with the box that changed since the previous frame; only the rows of
+    the frame's :func:`spiral_frame_box` are read back.  ``fmt`` is
+    ``'gif'`` (full-width rows) or ``'apng'`` (rows cropped to the box).
+    """
+    height = pixel_extent(m.H * m.k, m.scale)
+    prev, drawn = None, 0.0
+    for p, img in frames:
+        if prev is None:
+            prev = list(itertools.islice(backend.image_rows(img), height))
+            yield list(prev), None
+        else:
+            # Only the rows render_spiral_frames repainted can have changed
+            box = None
+            if p > drawn:
+                _, y0, _, y1 = spiral_frame_box(m, drawn, p)
+                band = list(itertools.islice(backend.image_rows(img, y0, y1), y1 - y0))
+                box = changed_box(prev[y0:y1], band)
+                prev[y0:y1] = band
+                if box is not None:
+                    box = (box[0], box[1] + y0, box[2], box[3] + y0)
+            # An unchanged frame still needs a (1×1, identical) box to hold its delay
+            x0, y0, x1, y1 = box or (0, 0, 1, 1)
+            if fmt == 'gif':
+                yield prev[y0:y1], (x0, y0, x1, y1)
+            else:
+                yield [r[4 * x0:4 * x1] for r in prev[y0:y1]], (x0, y0, x1, y1)
+        drawn = max(drawn, p)
+
+# ===== Export pipeline =====
+class _Drain(io.BytesIO):
+    """In-memory file the encode stage writes to; ``drain()`` hands the bytes on."""
+    def drain(self):
+        data = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return data
+
+class ExportJob:
+    """One export for :class:`ExportPipeline`.
+
+    ``steps`` is an iterable consumed on the render thread, one payload per
+    step (an image, a band of rows, an animation frame).  ``make_encoder(f)``
+    is called on the encode thread with a file-like sink and returns
+    ``(encode, close)``: ``encode(payload)`` and ``close()`` write to ``f``.
+    ``done``/``total`` track written steps; ``state`` is one of
+    ``queued``, ``running``, ``done``, ``cancelled`` or ``failed``.
+    """
+    def __init__(self, path, label, steps, make_encoder, total=1):
+        import threading
+        self.path, self.label = path, label
+        self.steps, self.make_encoder = steps, make_encoder
+        self.total, self.done = max(1, total), 0
+        self.state, self.error = 'queued', None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def progress(self):
+        return min(1.0, self.done / self.total)
+
+def board_export_job(path, palette, m, backend, band_pixels=EXPORT_BAND_PIXELS,
+                     background=(1, 1, 1, 1)):
+    """Job writing the board for ``m`` to ``path`` (PNG, SVG or PDF, by extension).
+
+    Large PNGs stream as bands through :class:`PNGStreamWriter`, the rest
+    render as one image and encode with the backend.
+    """
+    kind = os.path.splitext(path)[1].lower().lstrip('.')
+    width_px, height_px = pixel_extent(m.W * m.k, m.scale), pixel_extent(m.H * m.k, m.scale)
+    if kind == 'png' and width_px * height_px > TILED_EXPORT_MIN_PIXELS:
+        band_px = max(1, min(height_px, band_pixels // width_px))
+
+        def make_encoder(f):
+            writer = PNGStreamWriter(f, width_px, height_px)
+            return writer.write_rows, writer.close
+        # Rows are read back on the render thread: a band is only valid until the next one
+        steps = (list(rows) for rows in board_bands(backend, palette, m, band_pixels, background))
+        return ExportJob(path, f'Board {kind.upper()}', steps, make_encoder,
+                         (height_px + band_px - 1) // band_px)
+
+    def make_encoder(f):
+        return (lambda img: f.write(backend.encode(img))), (lambda: None)
+    steps = (render_board_image(backend, palette, m, background=background) for _ in range(1))
+    return ExportJob(path, f'Board {kind.upper()}', steps, make_encoder)
+
+def animation_export_job(path, palette, terms, k, scale, fps=ANIM_EXPORT_FPS,
+                         duration=ANIM_EXPORT_DURATION, backend=None, background=(1, 1, 1, 1)):
+    """Job writing the spiral draw-in to ``path`` as an APNG (``.png``/``.apng``) or GIF."""
+    fmt = ANIM_FORMATS.get(os.path.splitext(path)[1].lower(), 'apng')
+    backend = backend or RasterBackend()
+    m = Map.for_board(get_tiling(terms), k, scale)
+    progresses = animation_progresses(fps, duration)
+    width, height = pixel_extent(m.W * m.k, scale), pixel_extent(m.H * m.k, scale)
+    frames = render_spiral_frames(backend, palette or PALETTES[0], m, progresses, background)
+
+    def make_encoder(f):
+        if fmt == 'gif':
+            writer = GIFWriter(f, width, height, fps)
+        else:
+            writer = APNGWriter(f, width, height, len(progresses), fps)
+
+        def encode(delta):
+            rows, box = delta
+            if box is None:
+                writer.write_frame(rows)
+            else:
+                writer.write_frame(rows, box)
+        return encode, writer.close
+    label = 'Spiral GIF' if fmt == 'gif' else 'Spiral APNG'
+    return ExportJob(path, label, animation_deltas(backend, m, frames, fmt), make_encoder,
+                     len(progresses))
+
+_STAGE_END = object()  # marks the end of a job's payloads between stages
+
+class ExportPipeline:
+    """Runs :class:`ExportJob` s on three worker threads: render → encode → write.
+
+    Stages hand payloads on through bounded queues, so one step encodes
+    while the next renders and the previous one is written, and only a few
+    are held in memory.  Jobs run in submission order.  Output goes to a
+    hidden temporary file that is moved into place when the job completes,
+    so cancelled or failed jobs leave nothing behind.  Finished jobs wait in
+    ``finished`` for the UI thread to collect.
+    """
+    def __init__(self, depth=2):
+        import queue
+        self._jobs = queue.Queue()
+        self._encode = queue.Queue(depth)
+        self._write = queue.Queue(depth)
+        self.pending = []   # submitted and not yet finished, oldest first
+        self.finished = []
+        self._threads = None
+
+    def _start(self):
+        import threading
+        self._threads = [threading.Thread(target=loop, name=f'export-{name}', daemon=True)
+                         for name, loop in (('render', self._render_loop),
+                                            ('encode', self._encode_loop),
+                                            ('write', self._write_loop))]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, job):
+        if self._threads is None:
+            self._start()
+        self.pending.append(job)
+        self._jobs.put(job)
+        return job
+
+    @property
+    def busy(self):
+        return bool(self.pending)
+
+    @property
+    def active(self):
+        """The oldest unfinished job, or None."""
+        pending = self.pending
+        return pending[0] if pending else None
+
+    def cancel(self, job=None):
+        """Cancel ``job``, or every pending job."""
+        for j in ([job] if job is not None else list(self.pending)):
+            j.cancel()
+
+    def collect(self):
+        """Return and forget the jobs finished since the last call."""
+        done, self.finished = self.finished, []
+        return done
+
+    def wait(self, timeout=None):
+        """Block until every submitted job has finished; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _render_loop(self):
+        while True:
+            job = self._jobs.get()
+            job.state = 'running'
+            steps = iter(job.steps)
+            try:
+                for payload in steps:
+                    if job.cancelled:
+                        break
+                    self._encode.put((job, payload))
+            except Exception as e:
+                job.error = e
+            finally:
+                close = getattr(steps, 'close', None)
+                if close is not None:
+                    close()  # releases the image context of a cancelled job
+            self._encode.put((job, _STAGE_END))
+
+    def _encode_loop(self):
+        job = sink = encode = close = None
+        while True:
+            item, payload = self._encode.get()
+            if item is not job:
+                job, sink, encode, close = item, _Drain(), None, None
+            if not (job.cancelled or job.error):
+                try:
+                    if encode is None:
+                        encode, close = job.make_encoder(sink)
+                    if payload is _STAGE_END:
+                        close()
+                    else:
+                        encode(payload)
+                except Exception as e:
+                    job.error = e
+            if payload is _STAGE_END:
+                self._write.put((job, sink.drain()))
+                self._write.put((job, _STAGE_END))
+            else:
+                self._write.put((job, sink.drain()))
+
+    def _write_loop(self):
+        job = f = tmp = None
+        while True:
+            item, data = self._write.get()
+            if item is not job:
+                job = item
+                folder, name = os.path.split(job.path)
+                tmp = os.path.join(folder, '.' + name)
+                try:
+                    f = open(tmp, 'wb')
+                except OSError as e:
+                    job.error, f = e, None
+            if data is _STAGE_END:
+                if f is not None:
+                    f.close()
+                if job.error is None and not job.cancelled:
+                    try:
+                        os.replace(tmp, job.path)
+                    except OSError as e:
+                        job.error = e
+                if job.error is None and not job.cancelled:
+                    job.state, job.done = 'done', job.total
+                else:
+                    if f is not None:
+                        try:
+                            os.remove(tmp)
+                        except OSError:
+                            pass
+                    job.state = 'failed' if job.error is not None else 'cancelled'
+                self.pending.remove(job)
+                self.finished.append(job)
+                job = f = None
+                continue
+            if f is not None and not (job.cancelled or job.error):
+                try:
+                    f.write(data)
+                except OSError as e:
+                    job.error = e
+            job.done = min(job.total - 1, job.done + 1)  # the last step completes on rename
+
+# ===== Batch export (CLI) =====
+CATALOGUE_SCALES = (1.0, 2.0, 4.0)   # the PNG scales offered by the export button
+CATALOGUE_TERMS = (8, 10, 12)
+CATALOGUE_FORMATS = ('png', 'svg', 'pdf')
+CATALOGUE_MANIFEST = 'manifest.json'
+
+def _slug(name):
+    return ''.join(c if c.isalnum() else '-' for c in name.lower()).strip('-')
+
+def _renderer_fingerprint():
+    """Hash of this module's source: any change to the drawing code re-renders everything."""
+    import hashlib
+    try:
+        with open(__file__, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (NameError, OSError):
+        return 'unknown'
+
+def catalogue_jobs(palettes=None, scales=CATALOGUE_SCALES, formats=CATALOGUE_FORMATS,
+                   terms=CATALOGUE_TERMS, k=20.0):
+    """One job dict per output; vector formats ignore the scale, so they get one job each."""
+    jobs = []
+    for palette in palettes or PALETTES:
+        for n in terms:
+            for fmt in formats:
+                for scale in (scales if fmt not in VECTOR_BACKENDS else (1.0,)):
+                    suffix = f'_{scale:g}x' if fmt not in VECTOR_BACKENDS else ''
+                    jobs.append({'name': f'{_slug(palette["name"])}_{n}t{suffix}.{fmt}', 'format': fmt,
+                                 'palette': palette, 'terms': n, 'k': k, 'scale': scale})
+    return jobs
+
+def job_hash(job, fingerprint):
+    """Content hash of everything that determines a job's output bytes."""
+    import hashlib, json
+    blob = json.dumps([job, fingerprint], sort_keys=True)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+def _job_cost(job):
+    """Rough relative cost (device pixels for PNG) so the biggest jobs start first."""
+    t = get_tiling(job['terms'])
+    area = t.width * t.height * job['k'] ** 2
+    return area if job['format'] in VECTOR_BACKENDS else area * job['scale'] ** 2
+
+def _run_job(out_dir, job):
+    """Worker entry point: render one job to a temporary file, then move it into place."""
+    t0 = time.perf_counter()
+    path = os.path.join(out_dir, job['name'])
+    tmp = os.path.join(out_dir, '.' + job['name'])  # keeps the extension export_board keys on
+    export_board(tmp, job['palette'], job['terms'], job['k'], job['scale'])
+    os.replace(tmp, path)
+    return job['name'], time.perf_counter() - t0
+
+def batch_export(out_dir, jobs=None, workers=None, force=False, log=print):
+    """Render ``jobs`` (default: the full catalogue) into ``out_dir`` on a process pool.
+
+    Outputs whose content hash matches ``manifest.json`` and still exist are
+    skipped unless ``force``.  Falls back to rendering in-process where
+    worker processes aren't available (Pythonista).  Returns ``(rendered,
+    skipped)`` counts.
+    """
+    import json
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = catalogue_jobs() if jobs is None else jobs
+    manifest_path = os.path.join(out_dir, CATALOGUE_MANIFEST)
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    fingerprint = _renderer_fingerprint()
+    hashes = {job['name']: job_hash(job, fingerprint) for job in jobs}
+    todo = [job for job in jobs if force or manifest.get(job['name']) != hashes[job['name']]
+            or not os.path.exists(os.path.join(out_dir, job['name']))]
+    todo.sort(key=_job_cost, reverse=True)
+
+    def save_manifest():
+        tmp = manifest_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, manifest_path)
+
+    def done(name, seconds):
+        manifest[name] = hashes[name]
+        save_manifest()  # after every job, so an interrupted run keeps its progress
+        log(f'{name}  {seconds:.2f}s')
+
+    try:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        pool = ProcessPoolExecutor(workers) if workers != 1 and len(todo) > 1 else None
+    except (ImportError, NotImplementedError, OSError):
+        pool = None
+    if pool is None:
+        for job in todo:
+            done(*_run_job(out_dir, job))
+    else:
+        with pool:
+            for fut in as_completed([pool.submit(_run_job, out_dir, job) for job in todo]):
+                done(*fut.result())
+    log(f'{len(todo)} rendered, {len(jobs) - len(todo)} unchanged')
+    return len(todo), len(jobs) - len(todo)
+
+# ===== Frame instrumentation =====
+FRAME_BUDGET_S = 1 / 60.0
+FRAME_STATS_SIZE = 240          # frames kept (~4 s at 60 fps)
+FONT_HUD = ('Menlo', 11)
+
+class RingBuffer:
+    """Fixed-capacity float samples in an ``array('d')``; the oldest are overwritten."""
+    __slots__ = ('data', 'count', '_next')
+
+    def __init__(self, size):
+        self.data = array('d', bytes(8 * size))
+        self.count = self._next = 0
 
-SHOW_GRID = True
-SHOW_TINY_1x1_LABELS = True
+    def append(self, value):
+        self.data[self._next] = value
+        self._next = (self._next + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
 
-PALETTES = [
-    {
-        'name': 'Sunrise Fields',
-        'background': (0.98, 0.98, 1.0),
-        'spiral': (1.00, 0.45, 0.10),
-        'label': (1.00, 0.45, 0.10),
-        'title': (0.05, 0.20, 0.45),
-        'border': (0.14, 0.18, 0.45),
-        'tints': {
-            1:  (0.98, 0.90, 0.60, 0.75),
-            2:  (0.95, 0.70, 0.50, 0.75),
-            3:  (0.70, 0.85, 0.98, 0.75),
-            5:  (0.80, 0.95, 0.80, 0.75),
-            8:  (0.95, 0.85, 0.95, 0.75),
-            13: (0.90, 0.95, 0.99, 0.75),
-            21: (0.99, 0.98, 0.80, 0.70),
-        }
-    },
-    {
-        'name': 'Ocean Shell',
-        'background': (0.95, 0.98, 1.0),
-        'spiral': (0.00, 0.46, 0.54),
-        'label': (0.00, 0.46, 0.54),
-        'title': (0.02, 0.24, 0.34),
-        'border': (0.08, 0.18, 0.36),
-        'tints': {
-            1:  (0.88, 0.96, 0.99, 0.78),
-            2:  (0.76, 0.90, 0.95, 0.78),
-            3:  (0.70, 0.84, 0.92, 0.78),
-            5:  (0.82, 0.93, 0.95, 0.78),
-            8:  (0.94, 0.98, 0.99, 0.78),
-            13: (0.80, 0.92, 0.92, 0.78),
-            21: (0.90, 0.97, 0.97, 0.78),
-        }
-    },
-    {
-        'name': 'Forest Canopy',
-        'background': (0.97, 0.99, 0.96),
-        'spiral': (0.25, 0.55, 0.18),
-        'label': (0.25, 0.45, 0.15),
-        'title': (0.10, 0.30, 0.12),
-        'border': (0.20, 0.42, 0.24),
-        'tints': {
-            1:  (0.90, 0.98, 0.87, 0.75),
-            2:  (0.84, 0.95, 0.82, 0.75),
-            3:  (0.80, 0.93, 0.76, 0.75),
-            5:  (0.86, 0.96, 0.85, 0.75),
-            8:  (0.92, 0.98, 0.90, 0.75),
-            13: (0.88, 0.96, 0.86, 0.75),
-            21: (0.94, 0.98, 0.92, 0.75),
-        }
-    },
-]
+    def values(self):
+        """Samples oldest → newest."""
+        if self.count < len(self.data):
+            return self.data[:self.count].tolist()
+        return (self.data[self._next:] + self.data[:self._next]).tolist()
 
-# ===== Exact tiling on a 34×21 grid (y-up) =====
-SQUARES = [
-    ('21', 21,  0,  0),
-    ('13', 13, 21,  8),
-    ('8',   8, 26,  0),
-    ('5',   5, 21,  0),
-    ('3',   3, 21,  5),
-    ('2',   2, 24,  6),
-    ('1a',  1, 24,  5),
-    ('1b',  1, 25,  5),
-]
-W, H = 34, 21  # board width/height in grid units
+    def __len__(self):
+        return self.count
 
-# ===== Safe-area =====
-@on_main_thread
-def _ios_safe_insets():
-    """Return (top, left, bottom, right) safe-area in points."""
-    try:
-        UIApplication = ObjCClass('UIApplication')
-        app = UIApplication.sharedApplication()
-        win = app.keyWindow() or (app.windows() and app.windows()[0])
-        if win:
-            ins = win.safeAreaInsets()
-            return float(ins.top), float(ins.left), float(ins.bottom), float(ins.right)
-    except Exception:
-        pass
-    return 0.0, 0.0, 0.0, 0.0
+def percentile(values, q):
+    """Nearest-rank percentile (``q`` in 0..100) of ``values``; NaN if empty."""
+    vals = sorted(v for v in values if v == v)
+    if not vals:
+        return math.nan
+    return vals[min(len(vals) - 1, max(0, int(math.ceil(q / 100.0 * len(vals))) - 1))]
 
-def _fallback_insets(w, h):
-    return (44.0, 0.0, 34.0, 0.0) if h > w else (20.0, 0.0, 20.0, 0.0)
+class FrameStats:
+    """Opt-in frame timing for ``FibPoster``: draw durations, intervals, drops, stages.
 
-# ===== Grid→screen mapper =====
-class Map:
-    """Maps grid coords (x right, y up) to iOS view coords (y down)."""
-    def __init__(self, frame, safe_top=0.0, safe_bottom=0.0):
-        vw, vh = frame.width, frame.height
-        top_pad = MARGIN + safe_top + 12
-        bottom_pad = MARGIN + safe_bottom + 6
-        avail_w = vw - 2 * MARGIN
-        avail_h = vh - top_pad - bottom_pad
-        self.k = min(avail_w / W, avail_h / H)  # uniform scale
-        self.ox = MARGIN + (avail_w - W * self.k) * 0.5
-        self.oy = top_pad + (avail_h - H * self.k) * 0.5
-        try:
-            UIScreen = ObjCClass('UIScreen')
-            self.scale = float(UIScreen.mainScreen().scale())
-        except Exception:
-            self.scale = 2.0
+    ``begin_frame()``/``end_frame()`` bracket ``draw()``; ``BoardRenderer``
+    reports its stages through :meth:`add_stage` while a ``FrameStats`` is
+    its ``timer``.  A frame counts as dropped when it arrives more than half
+    a budget late during continuous redraws (animation or dragging).
+    """
+    def __init__(self, size=FRAME_STATS_SIZE, budget=FRAME_BUDGET_S, clock=time.perf_counter):
+        self.size, self.budget, self.clock = size, budget, clock
+        self.draw_times = RingBuffer(size)
+        self.intervals = RingBuffer(size)
+        self.stage_times = {}
+        self.records = []          # (start_s, interval_s, draw_s, {stage: s}) per frame, ring
+        self.frames = self.dropped = 0
+        self._last = self._start = None
+        self._interval = math.nan
+        self._stages = {}
 
-    def rect_ll(self, x, y, s):
-        """Return rect in points for square at (x,y) size s (lower-left origin in grid)."""
-        return (self.ox + x * self.k,
-                self.oy + (H - (y + s)) * self.k,
-                s * self.k, s * self.k)
+    def begin_frame(self, continuous=True):
+        now = self.clock()
+        interval = math.nan
+        if self._last is not None and continuous:
+            interval = now - self._last
+            self.intervals.append(interval)
+            if interval > 1.5 * self.budget:
+                self.dropped += int(round(interval / self.budget)) - 1
+        self._last = self._start = now
+        self._interval = interval
+        self._stages = {}
 
-    def pt(self, gx, gy):
-        """Map a grid point (gx, gy) to view coords (px, py)."""
-        return self.ox + gx * self.k, self.oy + (H - gy) * self.k
+    def add_stage(self, name, seconds):
+        self._stages[name] = self._stages.get(name, 0.0) + seconds
 
-    def x_to_px(self, gx): return self.ox + gx * self.k
-    def y_to_py(self, gy): return self.oy + (H - gy) * self.k
+    def end_frame(self):
+        if self._start is None:
+            return
+        draw = self.clock() - self._start
+        self.draw_times.append(draw)
+        for name, seconds in self._stages.items():
+            buf = self.stage_times.get(name)
+            if buf is None:
+                buf = self.stage_times[name] = RingBuffer(self.size)
+            buf.append(seconds)
+        record = (self._start, self._interval, draw, self._stages)
+        if len(self.records) < self.size:
+            self.records.append(record)
+        else:
+            self.records[self.frames % self.size] = record
+        self.frames += 1
+        self._start = None
 
-    def crisp(self, v, line_width_pt=1.0):
-        """Snap a coordinate to pixel centers for sharp strokes."""
-        px = v * self.scale
-        px = round(px) + (0.5 if (line_width_pt * self.scale) % 2 else 0.0)
-        return px / self.scale
+    def summary(self):
+        """FPS over continuous frames, p50/p95 draw time (ms) and drop count."""
+        p50 = percentile(self.intervals.values(), 50)
+        draws = self.draw_times.values()
+        return {'fps': 1.0 / p50 if p50 == p50 and p50 > 0 else math.nan,
+                'p50_ms': percentile(draws, 50) * 1000.0,
+                'p95_ms': percentile(draws, 95) * 1000.0,
+                'dropped': self.dropped, 'frames': self.frames,
+                'stages_p50_ms': {name: percentile(buf.values(), 50) * 1000.0
+                                  for name, buf in sorted(self.stage_times.items())}}
 
-# ===== Point helpers =====
-def _to_point_tuple(pt):
-    """Return ``(x, y)`` as floats for various point-like objects.
-
-    Pythonista sometimes hands back weakref proxies for Objective-C point
-    structs.  Converting them here keeps the rest of the drawing code agnostic
-    about the concrete point type.
-    """
-    if isinstance(pt, weakref.ReferenceType):
-        pt = pt()
-    if pt is None:
-        raise ValueError('Point reference no longer valid')
-
-    if isinstance(pt, Sequence) and not isinstance(pt, (str, bytes)):
-        if len(pt) < 2:
-            raise ValueError('Point-like sequence must have at least two items')
-        return float(pt[0]), float(pt[1])
-
-    x = getattr(pt, 'x', None)
-    y = getattr(pt, 'y', None)
-    if x is not None and y is not None:
-        x = x() if callable(x) else x
-        y = y() if callable(y) else y
-        return float(x), float(y)
-
-    if hasattr(pt, '__getitem__'):
-        try:
-            return float(pt[0]), float(pt[1])
-        except Exception:
-            pass
+    def hud_text(self):
+        s = self.summary()
+        fps = f'{s["fps"]:.0f}' if s['fps'] == s['fps'] else '--'
+        return f'FPS {fps}  p50 {s["p50_ms"]:.1f}  p95 {s["p95_ms"]:.1f} ms  drop {s["dropped"]}'
 
-    raise TypeError(f'Unsupported point type: {type(pt)!r}')
+    def to_csv(self, f):
+        """Write the retained frames (oldest first) as CSV to a path or text file."""
+        import csv
+        if isinstance(f, str):
+            with open(f, 'w', newline='') as fh:
+                return self.to_csv(fh)
+        stages = sorted({name for *_, st in self.records for name in st})
+        out = csv.writer(f)
+        out.writerow(['frame', 'start_s', 'interval_ms', 'draw_ms'] + [n + '_ms' for n in stages])
+        n = len(self.records)
+        start = self.frames - n  # frame number of the oldest retained record
+        for j in range(n):
+            t, interval, draw, st = self.records[(start + j) % n]
+            out.writerow([start + j, f'{t:.6f}', f'{interval * 1000:.3f}' if interval == interval else '',
+                          f'{draw * 1000:.3f}']
+                         + [f'{st[name] * 1000:.3f}' if name in st else '' for name in stages])
 
-# ===== Golden spiral geometry (y-up) =====
-C1, C2, C3, C5, C8, C13, C21 = (25,6), (24,6), (24,5), (26,5), (26,8), (21,8), (21,0)
-SPIRAL_ARCS = [
-    (C1, (24,6), +90),
-    (C1, (25,5), +90),
-    (C2, (26,6), +90),
-    (C3, (24,8), +90),
-    (C5, (21,5), +90),
-    (C8, (26,0), +90),
-    (C13, (34,8), +90),
-    (C21, (21,21), +90),
-]
+# ===== Animation scheduling =====
+_LINK_TARGET_CLASS = None
+_LINK_SCHEDULERS = {}  # display-link target pointer -> AnimationScheduler
 
-def arc_poly(mapper, center, start, sweep_deg, px_per_seg=6.0):
-    """Sample a circular arc as a polyline with approx segment length in device pixels."""
-    cx, cy = center
-    sx, sy = start
-    r = math.hypot(sx - cx, sy - cy)
-    if r == 0 or sweep_deg == 0:
-        return []
-    a0 = math.atan2(sy - cy, sx - cx)
-    a1 = a0 + math.radians(sweep_deg)
-    segs = max(24, int(abs(r * mapper.k * math.radians(sweep_deg)) / (px_per_seg / mapper.scale)))
-    pts = []
-    for i in range(segs + 1):
-        t = a0 + (a1 - a0) * (i / segs)
-        gx = cx + r * math.cos(t)
-        gy = cy + r * math.sin(t)
-        pts.append(_to_point_tuple(mapper.pt(gx, gy)))
-    return pts
+def _display_link_target_class():
+    """NSObject subclass whose ``tick:`` forwards CADisplayLink callbacks (created once)."""
+    global _LINK_TARGET_CLASS
+    if _LINK_TARGET_CLASS is None:
+        objc_util = _objc_util()
 
-def build_spiral(mapper):
-    """Create a single ui.Path made of chained quarter-arc polylines (round caps/joins)."""
-    path = ui.Path()
-    path.line_cap_style = getattr(ui, 'LINE_CAP_ROUND', 1)
-    path.line_join_style = getattr(ui, 'LINE_JOIN_ROUND', 1)
-    first = True
-    for center, start, sweep in SPIRAL_ARCS:
-        seg = arc_poly(mapper, center, start, sweep)
-        if not seg:
-            continue
-        if first:
-            path.move_to(*seg[0])
-            first = False
-        for x, y in seg[1:]:
-            path.line_to(x, y)
-    return path
+        def tick_(_self, _cmd, _link):
+            scheduler = _LINK_SCHEDULERS.get(_self)
+            if scheduler is not None:
+                scheduler.tick()
 
-def build_spiral_points(mapper):
-    pts = []
-    for center, start, sweep in SPIRAL_ARCS:
-        seg = arc_poly(mapper, center, start, sweep)
-        if not seg:
-            continue
-        if not pts:
-            pts.extend(seg)
+        _LINK_TARGET_CLASS = objc_util.create_objc_class('FibPosterDisplayLinkTarget',
+                                                         methods=[tick_])
+    return _LINK_TARGET_CLASS
+
+class AnimationScheduler:
+    """Per-frame callbacks driven by the display refresh.
+
+    ``add(name, fn)`` registers ``fn(now)``, which returns ``False`` once its
+    animation is finished; any number run side by side and re-adding a name
+    replaces it.  Ticks come from a ``CADisplayLink`` at the screen's native
+    rate (60 or 120 Hz) through ``objc_util``; where that isn't available they
+    fall back to chained ``ui.delay`` calls every ``fallback_interval``.  The
+    link only exists while something is animating.
+    """
+    def __init__(self, fallback_interval=1 / 60.0, clock=time.perf_counter):
+        self.fallback_interval = fallback_interval
+        self.clock = clock
+        self.callbacks = OrderedDict()
+        self._link = self._target = None
+        self._timer_running = False
+
+    def add(self, name, fn):
+        self.callbacks[name] = fn
+        self._start()
+
+    def remove(self, name):
+        self.callbacks.pop(name, None)
+        if not self.callbacks:
+            self.stop()
+
+    def __contains__(self, name):
+        return name in self.callbacks
+
+    def tick(self, now=None):
+        """Run every callback once; drop the finished ones."""
+        now = self.clock() if now is None else now
+        for name, fn in list(self.callbacks.items()):
+            if self.callbacks.get(name) is fn and not fn(now):
+                if self.callbacks.get(name) is fn:
+                    del self.callbacks[name]
+        if not self.callbacks:
+            self.stop()
+
+    def _start(self):
+        if self._link is not None or self._timer_running:
+            return
+        try:
+            objc_util = _objc_util()
+            self._target = _display_link_target_class().new()
+            _LINK_SCHEDULERS[self._target.ptr.value] = self
+            link = objc_util.ObjCClass('CADisplayLink').displayLinkWithTarget_selector_(
+                self._target, 'tick:')
+            link.setPreferredFramesPerSecond_(0)  # 0 = the display's native maximum
+            link.addToRunLoop_forMode_(objc_util.ObjCClass('NSRunLoop').mainRunLoop(),
+                                       'kCFRunLoopCommonModes')
+            self._link = link
+        except Exception:
+            self._release_target()
+            if ui is not None:
+                self._timer_running = True
+                ui.delay(self._timer_tick, 0.0)
+
+    def _timer_tick(self):
+        if not self._timer_running:
+            return
+        self.tick()
+        if self.callbacks:
+            ui.delay(self._timer_tick, self.fallback_interval)
         else:
-            pts.extend(seg[1:])
-    return pts
+            self._timer_running = False
+
+    def _release_target(self):
+        if self._target is not None:
+            _LINK_SCHEDULERS.pop(self._target.ptr.value, None)
+            self._target = None
+
+    def stop(self):
+        """Invalidate the display link (or end the timer chain); callbacks are kept."""
+        if self._link is not None:
+            self._link.invalidate()
+            self._link = None
+        self._release_target()
+        self._timer_running = False
 
 # ===== Main View =====
-class FibPoster(ui.View):
-    def __init__(self):
+LONG_PRESS_S = 0.5   # a touch held this long without moving selects the square under it
+TAP_SLOP_PT = 10.0   # movement that still counts as holding still
+
+class FibPoster(ui.View if ui is not None else object):
+    def __init__(self, instrument=False):
         super().__init__()
         self.palette_index = 0
         self.current_palette = PALETTES[self.palette_index]
         self.background_color = self.current_palette['background']
+        self.tiling = get_tiling(BOARD_TERMS)
         self.flex = 'WH'
         self._safe_top = self._safe_bottom = 0.0
         self.zoom = 1.0
@@ -252,12 +3489,37 @@ class FibPoster(ui.View):
         self.pan_y = 0.0
         self._active_touch_id = None
         self._touch_prev = None
+        self._pending_pan = (0.0, 0.0)
+        self._touches = {}           # touch_id -> last location
+        self._pinch = None           # (spread, midpoint, board centre, zoom, pan_x, pan_y, deep) at start
+        self._pinched = False        # until all fingers lift after a pinch
+        self._pending_view = None    # (zoom, pan_x, pan_y) or a DeepView, applied per tick
+        self.deep = None             # DeepView while in deep zoom, else None
+        self._selected = None        # index of the long-pressed square, highlighted with its term
+        self._press = None           # (touch_id, location, time) of a still single touch
+        self._fade = None            # PaletteTransition while palettes crossfade
+        self.deep_tiles = DeepTiles()
         self.anim_duration = 3.0
         self.anim_progress = 0.0
         self._animating = False
+        self.scheduler = AnimationScheduler()
+        self._last_map = None        # mapper of the last draw(), for dirty rects
+        self._shown_progress = None  # spiral progress already invalidated
+        backend = UIBackend()
+        self.renderer = BoardRenderer(backend, self.current_palette, BoardLayerCache(backend))
+        geometry = geometry_cache()
+        if geometry is not None and geometry.backend == type(backend).__name__:
+            self.renderer.text.known.update(geometry.text_sizes())
+        self._geometry_saved = geometry is not None and geometry.backend == type(backend).__name__
+        self.exports = ExportPipeline()
+        self._export_text = None     # overlay text while exports are in flight
+        self._export_rect = None
+        self.stats = None
+        self._hud_rect = None
+        self.set_instrumented(instrument)
         self.update_safe_insets()
         self.button_spacing = 6
-        self._start_spiral_animation()
+        self._anim_pending = True    # the draw-in starts with the first frame on screen
 
         # Close (×) button
         self.close_btn = ui.Button(
@@ -297,65 +3559,121 @@ class FibPoster(ui.View):
         self.close()
 
     def _export_board_png(self, sender):
-        """Export ONLY the 34×21 board as a PNG (no transforms needed)."""
+        """Export ONLY the board as a PNG, or as an SVG/PDF vector file."""
         self.update_safe_insets()
 
         # Make a mapper for screen metrics
-        m_screen = Map(self.bounds, safe_top=self._safe_top, safe_bottom=self._safe_bottom)
-        board_w, board_h = W * m_screen.k, H * m_screen.k
+        m_screen = Map(self.bounds, safe_top=self._safe_top, safe_bottom=self._safe_bottom,
+                       tiling=self.tiling)
 
-        scale_options = [('1× (Screen)', 1.0), ('2× (Retina)', 2.0), ('4× (Print)', 4.0)]
+        scale_options = [('1× (Screen)', 1.0), ('2× (Retina)', 2.0), ('4× (Print)', 4.0),
+                         ('8× (Poster)', 8.0), ('16× (Large format)', 16.0),
+                         ('SVG (Vector)', 'svg'), ('PDF (Vector)', 'pdf'),
+                         ('APNG (Animation)', 'apng'), ('GIF (Animation)', 'gif')]
         button_titles = [opt[0] for opt in scale_options]
+        console = _console()
         try:
-            choice = console.alert('Export Resolution', 'Choose a scale for the PNG.',
-                                   button_titles[0], button_titles[1], button_titles[2])
+            choice = _dialogs().list_dialog('Export Resolution', button_titles)
         except KeyboardInterrupt:
             return
         except Exception:
-            choice = 1
-        factor = scale_options[min(max(choice, 1), len(scale_options)) - 1][1]
-        board_w *= factor
-        board_h *= factor
-
-        # Make a zero-origin mapper that draws the same board at (0,0)
-        class ZeroMap(Map): pass
-        m_zero = ZeroMap(self.bounds, safe_top=0, safe_bottom=0)
-        m_zero.k = m_screen.k * factor
-        m_zero.scale = m_screen.scale * factor
-        m_zero.ox = 0.0
-        m_zero.oy = 0.0
-
-        with ui.ImageContext(board_w, board_h) as ctx:
-            # White background
-            ui.set_color((1, 1, 1, 1))
-            ui.Path.rect(0, 0, board_w, board_h).fill()
-
-            # Draw only the board using the zero-origin mapper
-            self._draw_board(m_zero, spiral_progress=1.0)
+            choice = button_titles[0]
+        if choice is None:
+            return
+        factor = dict(scale_options)[choice]
+        ts = _timestamp()
 
-            img = ctx.get_image()
+        # Jobs render on the export pipeline's threads: the view keeps animating,
+        # progress shows in an overlay (tap it to cancel) and further exports queue.
+        # ``ui`` only draws on the main thread, so the pipeline renders headless.
+        if factor in ('apng', 'gif'):
+            # Spiral draw-in at the on-screen duration, one incremental frame at a time
+            ext = 'png' if factor == 'apng' else 'gif'
+            path = os.path.join(os.getcwd(), f'FibonacciSpiral_{ts}.{ext}')
+            job = animation_export_job(path, self.current_palette, self.tiling.terms, m_screen.k,
+                                       m_screen.scale, duration=self.anim_duration,
+                                       backend=RasterBackend())
+        elif factor in VECTOR_BACKENDS:
+            # Vector files come straight from the tiling: same size at any print scale
+            path = os.path.join(os.getcwd(), f'FibonacciBoard_{ts}.{factor}')
+            job = board_export_job(path, self.current_palette,
+                                   Map.for_board(self.tiling, m_screen.k, 1.0),
+                                   VECTOR_BACKENDS[factor]())
+        else:
+            # Zero-origin mapper that draws the same board at (0,0)
+            m_zero = Map.for_board(self.tiling, m_screen.k * factor, m_screen.scale)
+            path = os.path.join(os.getcwd(), f'FibonacciBoard_{ts}.png')
+            if (pixel_extent(m_zero.W * m_zero.k, m_zero.scale)
+                    * pixel_extent(m_zero.H * m_zero.k, m_zero.scale) > TILED_EXPORT_MIN_PIXELS):
+                # Print sizes stream bands to disk instead of one giant image
+                job = board_export_job(path, self.current_palette, m_zero, RasterBackend())
+            else:
+                # Screen sizes keep ui's fonts and anti-aliasing: drawn and encoded
+                # here, the pipeline only writes the bytes
+                backend = UIBackend()
+                data = backend.encode(render_board_image(backend, self.current_palette, m_zero))
+                job = ExportJob(path, 'Board PNG', (data,), lambda f: (f.write, lambda: None))
+        self.exports.submit(job)
+        self.scheduler.add('export', self._poll_exports)
 
-        ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        fname = f'FibonacciBoard_{ts}.png'
-        path = os.path.join(os.getcwd(), fname)
-        with open(path, 'wb') as f:
-            f.write(img.to_png())
+    def _export_status_text(self):
+        job = self.exports.active
+        if job is None:
+            return None
+        queued = len(self.exports.pending) - 1
+        more = f'  (+{queued} queued)' if queued > 0 else ''
+        return f'Exporting {job.label} {job.progress * 100:.0f}%{more} · tap to cancel'
 
-        console.quicklook(path)
-        try:
-            console.open_in(path)
-        except Exception:
-            pass
-        console.hud_alert('Board PNG exported', 'success', 1.2)
+    def _poll_exports(self, now):
+        """Scheduler callback: refresh the export overlay and announce finished jobs."""
+        text = self._export_status_text()
+        if text != self._export_text:
+            self._export_text = text
+            self._export_rect = None
+            _set_needs_display_in_rect(self, self._export_strip())
+        console = _console()
+        for job in self.exports.collect():
+            if job.state == 'done':
+                console.hud_alert(f'{job.label} exported', 'success', 1.2)
+                if not self.exports.busy:
+                    console.quicklook(job.path)
+            elif job.state == 'failed':
+                console.hud_alert(f'{job.label} export failed', 'error', 1.5)
+            else:
+                console.hud_alert('Export cancelled', 'error', 1.0)
+        return self.exports.busy
+
+    def _export_strip(self):
+        """Full-width band (x, y, w, h) the export overlay is drawn in."""
+        h = self.renderer.text.measure('Ag', FONT_HUD)[1] + 10
+        return 0.0, self.height - max(0, self._safe_bottom) - 40 - h, self.width, h
+
+    def _draw_export_status(self, text):
+        be = self.renderer.backend
+        measure = self.renderer.text.measure
+        tw, th = measure(text, FONT_HUD)
+        _, y, _, h = self._export_strip()
+        w = tw + 16
+        x = (self.width - w) / 2.0
+        be.set_color((0, 0, 0, 0.6))
+        be.fill_rect(x, y, w, h)
+        job = self.exports.active
+        if job is not None:
+            be.set_color((1, 1, 1, 0.25))
+            be.fill_rect(x, y, w * job.progress, h)
+        be.draw_string(text, (x + 8, y + 5, tw, th), FONT_HUD, (1, 1, 1, 0.95))
+        self._export_rect = (x, y, w, h)
 
     # ---------- Layout & draw ----------
     def update_safe_insets(self):
-        t, _, b, _ = _ios_safe_insets()
+        t, _, b, _ = PLATFORM.insets
         if t == 0 and b == 0:
             t, _, b, _ = _fallback_insets(self.width, self.height)
         self._safe_top, self._safe_bottom = t, b
 
     def layout(self):
+        PLATFORM.invalidate()  # size, rotation or screen changed
+        self.renderer.text.clear()
         self.update_safe_insets()
         btn_size = 36
         compact_height = 26
@@ -378,110 +3696,51 @@ class FibPoster(ui.View):
         self.palette_btn.x = self.export_btn.x - self.palette_btn.width - spacing
         self.set_needs_display()
 
-    def _draw_board(self, m, spiral_progress=None):
+    def _draw_board(self, m, spiral_progress=None, cached=False):
         """Draw ONLY the poster board (used on-screen and for PNG export)."""
-        palette = self.current_palette
-        # Board background
-        card_path = ui.Path.rect(m.ox, m.oy, W * m.k, H * m.k)
-        ui.set_color(palette['background'])
-        card_path.fill()
-
-        # Squares
-        for name, s, x, y in SQUARES:
-            rx, ry, rw, rh = m.rect_ll(x, y, s)
-            tint = palette['tints'].get(1 if name in ('1a', '1b') else s, (0.85, 0.85, 0.85, 0.65))
-            ui.set_color(tint)
-            ui.Path.rect(rx, ry, rw, rh).fill()
-            ui.set_color((0, 0, 0, 0.08))
-            ui.Path.rect(rx, ry, rw, rh).stroke()
-            if SHOW_TINY_1x1_LABELS or s != 1:
-                txt = str(1 if name in ('1a', '1b') else s)
-                tw, th = ui.measure_string(txt, font=FONT_LABEL)
-                ui.draw_string(txt, (rx + rw/2 - tw/2, ry + rh/2 - th/2, tw, th),
-                               font=FONT_LABEL, color=palette['label'])
-
-        # Grid
-        if SHOW_GRID:
-            ui.set_color((0.3, 0.5, 0.8, GRID_ALPHA))
-            line = ui.Path()
-            line.line_width = 0.5
-            for gx in range(W + 1):
-                x = m.crisp(m.x_to_px(gx), line.line_width)
-                line.move_to(x, m.oy)
-                line.line_to(x, m.oy + H * m.k)
-            for gy in range(H + 1):
-                y = m.crisp(m.y_to_py(gy), line.line_width)
-                line.move_to(m.ox, y)
-                line.line_to(m.ox + W * m.k, y)
-            line.stroke()
-
-        # Frame + divider
-        border_color = palette['border']
-        ui.set_color(border_color + (0.3,))
-        frame_path = ui.Path.rect(m.ox, m.oy, W * m.k, H * m.k)
-        frame_path.line_width = 1.5
-        frame_path.stroke()
-        xdiv = m.crisp(m.x_to_px(21), 1.0)
-        d = ui.Path()
-        d.move_to(xdiv, m.oy)
-        d.line_to(xdiv, m.oy + H * m.k)
-        d.line_width = 1.0
-        d.stroke()
-
-        # Spiral (no arrow)
         if spiral_progress is None:
             spiral_progress = self.anim_progress
-        spiral_progress = max(0.0, min(1.0, spiral_progress))
-        pts = build_spiral_points(m)
-        if pts:
-            total = 0.0
-            seg_lens = []
-            for i in range(1, len(pts)):
-                l = math.hypot(pts[i][0] - pts[i-1][0], pts[i][1] - pts[i-1][1])
-                seg_lens.append(l)
-                total += l
-            path = ui.Path()
-            path.move_to(*pts[0])
-            if total == 0:
-                draw_to = 0
-            else:
-                draw_to = total * spiral_progress
-            acc = 0.0
-            for i in range(1, len(pts)):
-                seg = seg_lens[i-1] if i-1 < len(seg_lens) else 0.0
-                if acc + seg >= draw_to and seg > 0:
-                    t = (draw_to - acc) / seg
-                    x = pts[i-1][0] + (pts[i][0] - pts[i-1][0]) * t
-                    y = pts[i-1][1] + (pts[i][1] - pts[i-1][1]) * t
-                    path.line_to(x, y)
-                    break
-                path.line_to(*pts[i])
-                acc += seg
-            else:
-                pass
-            stroke = max(2.0, SPIRAL_WIDTH_PT * (m.k / 20.0))
-            path.line_width = stroke
-            ui.set_color(palette['spiral'])
-            path.stroke()
+        self.renderer.draw_board(m, spiral_progress, cached, self._fade)
 
     def draw(self):
+        if self._anim_pending:
+            self._anim_pending = False
+            self._start_spiral_animation()
+        stats = self.stats
+        if stats is not None:
+            stats.begin_frame(continuous=self._animating or self._active_touch_id is not None)
         self.update_safe_insets()
         t, b = self._safe_top, self._safe_bottom
-        m = Map(self.bounds, safe_top=t, safe_bottom=b)
+        base = Map(self.bounds, safe_top=t, safe_bottom=b, tiling=self.tiling)
+        # Cull against what UIKit asked to repaint (a dirty rect while animating)
+        clip = _current_clip_rect() or (0.0, 0.0, self.width, self.height)
+        m = base.zoomed(self.zoom, self.pan_x, self.pan_y, clip=clip)
+        self._last_map = m
 
-        base_cx = m.ox + W * m.k * 0.5
-        base_cy = m.oy + H * m.k * 0.5
-        m.k *= self.zoom
-        m.ox = base_cx - W * m.k * 0.5 + self.pan_x
-        m.oy = base_cy - H * m.k * 0.5 + self.pan_y
-
-        # Board (exactly what PNG exports)
-        self._draw_board(m)
+        # Board (exactly what PNG exports).  While a pinch changes the zoom it is
+        # built in the reference space of the zoom's LOD level and placed by a
+        # CTM, so every step within a level reuses the cached layer and
+        # geometry; at rest it is rasterized at the real zoom, so hairlines
+        # and text land on device pixels.  Deep zoom draws the golden tiling
+        # around the viewport instead.
+        if self.deep is not None:
+            with self.renderer.using_palette(self._palette_now()):
+                self.renderer.draw_deep(self.deep, self.deep_tiles, clip)
+        elif self._pinch is None:
+            self._draw_board(m, cached=True)
+        else:
+            ref = base.zoomed(lod_zoom(self.zoom))
+            tx, ty, s = ref.transform_to(m)
+            ref.clip = ((clip[0] - tx) / s, (clip[1] - ty) / s, clip[2] / s, clip[3] / s)
+            with self.renderer.backend.transformed(tx, ty, s):
+                self._draw_board(ref, cached=True)
 
         # Title & footer (on-screen only)
-        palette = self.current_palette
+        palette = self._palette_now()
+        be = self.renderer.backend
+        measure = self.renderer.text.measure
         title = 'Fibonacci Sequence'
-        _, th = ui.measure_string(title, font=FONT_TITLE)
+        _, th = measure(title, FONT_TITLE)
         button_top = min(getattr(self.close_btn, 'y', t + 10),
                          getattr(self.export_btn, 'y', t + 12),
                          getattr(self.palette_btn, 'y', t + 12))
@@ -498,53 +3757,154 @@ class FibPoster(ui.View):
             title_width = min(self.width - 2 * MARGIN, available_width)
         else:
             title_width = self.width - 2 * MARGIN
-        ui.draw_string(title,
+        be.draw_string(title,
                        (MARGIN, title_y, title_width, th),
-                       font=FONT_TITLE, color=palette['title'],
-                       alignment=ui.ALIGN_CENTER)
+                       FONT_TITLE, palette['title'],
+                       alignment=ALIGN_CENTER)
 
-        seq = '0, 1, 1, 2, 3, 5, 8, 13, 21, 34...'
-        sw, sh = ui.measure_string(seq, font=FONT_SERIES)
-        ui.draw_string(seq, (MARGIN, self.height - sh - 8 - max(0, b),
+        last = self.tiling.terms + 1  # up to the board's long side
+        if self.deep is not None and self.deep_tiles.largest is not None:
+            last = max(2, self.deep_tiles.largest + 1)
+        seq = fib_series(last)
+        sw, sh = measure(seq, FONT_SERIES)
+        be.draw_string(seq, (MARGIN, self.height - sh - 8 - max(0, b),
                              self.width - 2*MARGIN, sh),
-                       font=FONT_SERIES, color=palette['label'])
+                       FONT_SERIES, palette['label'])
 
         palette_name = self.current_palette['name']
-        pw, ph = ui.measure_string(palette_name, font=('<System>', 14))
-        ui.draw_string(palette_name,
+        pw, ph = measure(palette_name, ('<System>', 14))
+        be.draw_string(palette_name,
                        (self.width - pw - MARGIN, self.height - ph - 10 - max(0, b),
-                        pw, ph), font=('<System>', 14), color=palette['label'])
+                        pw, ph), ('<System>', 14), palette['label'])
+
+        if self._selected is not None and self.deep is None:
+            self._draw_selection(m, self._selected)
+
+        if self._export_text is not None:
+            self._draw_export_status(self._export_text)
+
+        if stats is not None:
+            stats.end_frame()
+            self._draw_hud(stats)
+
+    # ---------- Instrumentation ----------
+    def set_instrumented(self, on=True):
+        """Start (or stop) collecting frame times and showing the HUD overlay."""
+        self.stats = FrameStats() if on else None
+        self.renderer.timer = self.stats
+        self._hud_rect = None
+        self.set_needs_display()
+
+    def _draw_hud(self, stats):
+        """FPS, p50/p95 draw time and drops, plus per-stage medians; tap it for CSV."""
+        be = self.renderer.backend
+        measure = self.renderer.text.measure
+        stages = stats.summary()['stages_p50_ms']
+        lines = [stats.hud_text(),
+                 '  '.join(f'{name} {ms:.1f}' for name, ms in stages.items())]
+        sizes = [measure(line, FONT_HUD) for line in lines if line]
+        w = max(lw for lw, _ in sizes) + 12
+        h = sum(lh for _, lh in sizes) + 8
+        x, y = MARGIN, self._safe_top + 52
+        be.set_color((0, 0, 0, 0.55))
+        be.fill_rect(x, y, w, h)
+        ty = y + 4
+        for line, (lw, lh) in zip([l for l in lines if l], sizes):
+            be.draw_string(line, (x + 6, ty, lw, lh), FONT_HUD, (1, 1, 1, 0.95))
+            ty += lh
+        self._hud_rect = (x, y, w, h)
+
+    def _export_frame_stats(self):
+        ts = _timestamp()
+        path = os.path.join(os.getcwd(), f'FrameStats_{ts}.csv')
+        self.stats.to_csv(path)
+        _console().hud_alert('Frame stats saved', 'success', 1.0)
+        return path
 
     # ---------- Palette & animation helpers ----------
     def _cycle_palette(self, sender=None):
+        """Crossfade to the next palette; the spiral keeps its progress."""
+        start = self._palette_now()
         self.palette_index = (self.palette_index + 1) % len(PALETTES)
         self.current_palette = PALETTES[self.palette_index]
-        self.background_color = self.current_palette['background']
-        self._start_spiral_animation()
+        self.renderer.palette = self.current_palette
+        self.renderer.text.clear()
+        self._fade = PaletteTransition(start, self.current_palette, self.scheduler.clock())
+        self.scheduler.add('palette', self._step_fade)
+        self._step_fade(self._fade.t0)
+
+    def _palette_now(self):
+        """Colours to draw with: mid-crossfade the ramp's blend, else the palette."""
+        return self._fade.palette if self._fade is not None else self.current_palette
+
+    def _step_fade(self, now):
+        """Scheduler callback: advance the palette crossfade; ``False`` once it has finished."""
+        fade = self._fade
+        if fade is None:
+            return False
+        running = fade.advance(now)
+        if not running:
+            self._fade = None
+        self.background_color = self._palette_now()['background']
         self.set_needs_display()
+        return running
 
     def _start_spiral_animation(self):
         self.anim_progress = 0.0
         self._animating = True
-        self.anim_start = time.time()
-        ui.delay(self._step_animation, 0.0)
+        self.anim_start = self.scheduler.clock()
+        self._shown_progress = None  # first tick repaints the whole view
+        self.scheduler.add('spiral', self._step_animation)
 
-    def _step_animation(self):
+    def _step_animation(self, now):
+        """Scheduler callback: advance the draw-in; ``False`` once it has finished."""
         if not self._animating:
-            return
-        elapsed = time.time() - self.anim_start
+            return False
         if self.anim_duration <= 0:
-            self.anim_progress = 1.0
+            progress = 1.0
+        else:
+            progress = min(1.0, (now - self.anim_start) / self.anim_duration)
+        self.anim_progress = progress
+        self._invalidate_spiral(progress)
+        if progress >= 1.0:
             self._animating = False
+            self._save_geometry()
+        return self._animating
+
+    def _save_geometry(self):
+        """Write the geometry cache (with this device's text sizes) if the launch had none."""
+        if self._geometry_saved or self.tiling.terms != BOARD_TERMS:
+            return
+        self._geometry_saved = True
+        try:
+            write_geometry_cache(GEOMETRY_CACHE_PATH, self.tiling, self.renderer.text.sizes(),
+                                 type(self.renderer.backend).__name__)
+        except OSError:
+            pass  # read-only folder: every launch just computes the geometry
+
+    def _invalidate_spiral(self, progress):
+        """Request a redraw only once the spiral grew by a device pixel, and only of the new part."""
+        m, shown = self._last_map, self._shown_progress
+        if m is None or shown is None or progress < shown:
+            self._shown_progress = progress
             self.set_needs_display()
             return
-        progress = min(1.0, elapsed / self.anim_duration)
-        self.anim_progress = progress
-        self.set_needs_display()
-        if progress < 1.0:
-            ui.delay(self._step_animation, 1/60.0)
-        else:
-            self._animating = False
+        grown_px = (progress - shown) * m.tiling.spiral_length * m.k * m.scale
+        if grown_px < 1.0 and progress < 1.0:
+            return
+        box = spiral_section_bounds(m, shown, progress)
+        self._shown_progress = progress
+        if box is None:
+            return
+        pad = BoardRenderer.spiral_width(m) / 2.0 + 2.0
+        x0, y0, x1, y1 = box
+        _set_needs_display_in_rect(self, (x0 - pad, y0 - pad, x1 - x0 + 2 * pad, y1 - y0 + 2 * pad))
+        if self._hud_rect is not None:
+            _set_needs_display_in_rect(self, self._hud_rect)
+
+    def will_close(self):
+        self.scheduler.stop()
+        self.exports.cancel()
 
     @staticmethod
     def _point_to_tuple(point, view=None):
@@ -583,45 +3943,210 @@ class FibPoster(ui.View):
             return None
 
     # ---------- Gesture handling ----------
+    def _location(self, touch):
+        return fast_point(touch.location, self._point_to_tuple, self)
+
     def touch_began(self, touch):
-        self._active_touch_id = touch.touch_id
-        self._touch_prev = self._point_to_tuple(touch.location, self)
+        loc = self._location(touch)
+        if loc is not None:
+            self._touches[touch.touch_id] = loc
+        if len(self._touches) >= 2:
+            self._begin_pinch()
+        else:
+            self._active_touch_id = touch.touch_id
+            self._touch_prev = loc
+            self._press = (touch.touch_id, loc, time.perf_counter()) if loc is not None else None
+            return
+        self._press = None
 
     def touch_moved(self, touch):
-        if self._active_touch_id != touch.touch_id or self.zoom <= 0:
-            return
-        loc = self._point_to_tuple(touch.location, self)
+        loc = self._location(touch)
         if loc is None:
             return
-        x, y = loc
-        prev = self._point_to_tuple(self._touch_prev, self)
+        if touch.touch_id in self._touches:
+            self._touches[touch.touch_id] = loc
+        press = self._press
+        if press is not None and math.hypot(loc[0] - press[1][0], loc[1] - press[1][1]) > TAP_SLOP_PT:
+            self._press = None
+        if self._pinch is not None:
+            self._update_pinch()
+            return
+        if self._active_touch_id != touch.touch_id or self.zoom <= 0:
+            return
+        prev = self._touch_prev
+        self._touch_prev = loc
         if prev is None:
-            self._touch_prev = (x, y)
             return
-        px, py = prev
-        if px is None or py is None:
-            self._touch_prev = (x, y)
+        # Coalesce: sum the deltas and apply them once per display tick
+        px, py = self._pending_pan
+        self._pending_pan = (px + loc[0] - prev[0], py + loc[1] - prev[1])
+        if 'pan' not in self.scheduler:
+            self.scheduler.add('pan', self._apply_gesture)
+
+    def _begin_pinch(self):
+        (ax, ay), (bx, by) = list(self._touches.values())[:2]
+        base = Map(self.bounds, self._safe_top, self._safe_bottom, self.tiling)
+        center = (base.ox + base.W * base.k * 0.5, base.oy + base.H * base.k * 0.5)
+        self._pinch = (math.hypot(bx - ax, by - ay), ((ax + bx) / 2.0, (ay + by) / 2.0), center,
+                       self.zoom, self.pan_x, self.pan_y, self.deep)
+        self._pinched = True
+        self._active_touch_id = self._touch_prev = None
+        self._pending_pan = (0.0, 0.0)
+
+    def _update_pinch(self):
+        """Zoom by the finger spread, keeping the board point under the midpoint under it.
+
+        Pinching past ``ZOOM_MIN``/``ZOOM_MAX`` hands over to deep zoom,
+        which continues from what is on screen without limits.
+        """
+        d0, (mx0, my0), (cx, cy), zoom0, pan_x0, pan_y0, deep0 = self._pinch
+        (ax, ay), (bx, by) = list(self._touches.values())[:2]
+        d = math.hypot(bx - ax, by - ay)
+        if d0 <= 0 or d <= 0:
             return
-        self.pan_x += x - px
-        self.pan_y += y - py
-        self._touch_prev = (x, y)
-        self.set_needs_display()
+        mx, my = (ax + bx) / 2.0, (ay + by) / 2.0
+        if deep0 is not None:
+            self._pending_view = deep0.zoomed(d / d0, (mx0, my0), (mx, my))
+        else:
+            zoom = min(ZOOM_MAX, max(ZOOM_MIN, zoom0 * d / d0))
+            f = zoom / zoom0
+            view = (zoom, mx - cx - (mx0 - cx - pan_x0) * f, my - cy - (my0 - cy - pan_y0) * f)
+            if zoom != zoom0 * d / d0:
+                base = Map(self.bounds, self._safe_top, self._safe_bottom, self.tiling)
+                # Zooming in, the squares under the fingers keep their size
+                deep = DeepView.for_map(base.zoomed(*view), (mx, my) if zoom > 1 else None)
+                self._pinch = (d, (mx, my), (cx, cy), zoom, view[1], view[2], deep)
+                view = deep
+            self._pending_view = view
+        if 'pan' not in self.scheduler:
+            self.scheduler.add('pan', self._apply_gesture)
+
+    def _apply_gesture(self, now=None):
+        """Scheduler callback: apply the pan/pinch accumulated since the last tick.
+
+        Stays registered while fingers are down, so a drag keeps one
+        display link instead of creating one per burst of move events.
+        """
+        dirty = False
+        view = self._pending_view
+        if isinstance(view, DeepView):
+            if self.deep is None:
+                self._animating, self.anim_progress = False, 1.0
+            self.deep = view
+        elif view is not None:
+            self.zoom, self.pan_x, self.pan_y = view
+        if view is not None:
+            self._pending_view = None
+            dirty = True
+        dx, dy = self._pending_pan
+        self._pending_pan = (0.0, 0.0)
+        if dx or dy:
+            if self.deep is not None:
+                self.deep = self.deep.panned(dx, dy)
+            else:
+                self.pan_x += dx
+                self.pan_y += dy
+            dirty = True
+        if dirty:
+            self.set_needs_display()
+        return bool(self._touches)
 
     def touch_ended(self, touch):
+        self._touches.pop(touch.touch_id, None)
+        if self._pinched:
+            # Pinch over: a remaining finger pans on from where it is; no taps
+            self._pinch = None
+            self.set_needs_display()  # re-rasterize at the final zoom
+            self._active_touch_id = self._touch_prev = None
+            for tid, loc in self._touches.items():
+                self._active_touch_id, self._touch_prev = tid, loc
+            if not self._touches:
+                self._pinched = False
+            return
         if touch.touch_id == self._active_touch_id:
             self._active_touch_id = None
             self._touch_prev = None
+        press, self._press = self._press, None
+        if (press is not None and press[0] == touch.touch_id and self.deep is None
+                and time.perf_counter() - press[2] >= LONG_PRESS_S):
+            m = self._last_map
+            hit = m.square_at(*press[1]) if m is not None else None
+            self._select_square(None if hit == self._selected else hit)
+            return
         tap_count = getattr(touch, 'tap_count', 0)
+        if tap_count == 1 and self._export_rect is not None and self.exports.busy:
+            loc = self._location(touch)
+            ex, ey, ew, eh = self._export_rect
+            if loc is not None and ex <= loc[0] <= ex + ew and ey <= loc[1] <= ey + eh:
+                self.exports.cancel()
+                return
+        if tap_count == 1 and self._hud_rect is not None and self.stats is not None:
+            loc = self._location(touch)
+            hx, hy, hw, hh = self._hud_rect
+            if loc is not None and hx <= loc[0] <= hx + hw and hy <= loc[1] <= hy + hh:
+                self._export_frame_stats()
+                return
         if tap_count >= 2:
-            loc = self._point_to_tuple(touch.location, self)
+            loc = self._location(touch)
             if loc is not None:
                 self._handle_double_tap(loc)
-        elif tap_count == 1 and self.anim_progress >= 1.0:
+        elif tap_count == 1 and self.anim_progress >= 1.0 and self.deep is None:
             self._start_spiral_animation()
 
+    # ---------- Square selection ----------
+    def _selection_layout(self, m, i):
+        """Square rect, info bubble rect and its ``(line, size)`` pairs for square ``i``."""
+        t, measure = self.tiling, self.renderer.text.measure
+        s, n = t.size[i], i + 1  # square i is F(i + 1) wide
+        square = m.rect_ll(t.x[i], t.y[i], s)
+        lines = [f'F({n}) = {fib_label(n)}', f'square {n} of {t.terms}']
+        if n > 1:
+            lines[1] += f' · F({n})/F({n - 1}) ≈ {fib(n) / fib(n - 1):.6f}'
+        sizes = [measure(line, FONT_HUD) for line in lines]
+        w = max(lw for lw, _ in sizes) + 12
+        h = sum(lh for _, lh in sizes) + 8
+        x = min(max(MARGIN, square[0] + (square[2] - w) / 2.0), self.width - MARGIN - w)
+        y = square[1] + square[3] + 6
+        if y + h > self.height - self._safe_bottom:
+            y = max(self._safe_top, square[1] - h - 6)
+        return square, (x, y, w, h), list(zip(lines, sizes))
+
+    def _draw_selection(self, m, i):
+        be, palette = self.renderer.backend, self._palette_now()
+        (sx, sy, sw, sh), (x, y, w, h), lines = self._selection_layout(m, i)
+        be.set_color(palette['spiral'] + (0.18,))
+        be.fill_rect(sx, sy, sw, sh)
+        be.set_color(palette['spiral'])
+        be.stroke_rect(sx, sy, sw, sh, 2.5)
+        be.set_color((0, 0, 0, 0.7))
+        be.fill_rect(x, y, w, h)
+        ty = y + 4
+        for line, (lw, lh) in lines:
+            be.draw_string(line, (x + 6, ty, lw, lh), FONT_HUD, (1, 1, 1, 0.95))
+            ty += lh
+
+    def _invalidate_selection(self):
+        m, i = self._last_map, self._selected
+        if m is None or i is None:
+            return
+        (sx, sy, sw, sh), bubble, _ = self._selection_layout(m, i)
+        _set_needs_display_in_rect(self, (sx - 3, sy - 3, sw + 6, sh + 6))
+        _set_needs_display_in_rect(self, bubble)
+
+    def _select_square(self, i):
+        """Highlight square ``i`` (None clears), repainting only the old and new rects."""
+        self._invalidate_selection()
+        self._selected = i
+        self._invalidate_selection()
+
     def _handle_double_tap(self, location):
         lx, ly = location
-        if self.zoom >= 3.5:
+        if self.deep is not None:
+            # Leave deep zoom for the whole board
+            self.deep = None
+            self.deep_tiles.clear()
+            self.zoom, self.pan_x, self.pan_y = 1.0, 0.0, 0.0
+        elif self.zoom >= 3.5:
             self.zoom = 1.0
             self.pan_x = 0.0
             self.pan_y = 0.0
@@ -636,5 +4161,408 @@ class FibPoster(ui.View):
             self.zoom = new_zoom
         self.set_needs_display()
 
+# ===== Benchmarks =====
+BENCH_VIEW = (430.0, 932.0, 59.0, 34.0)  # iPhone 14 Pro Max: width, height, safe top/bottom
+BENCH_PROGRESS = (0.25, 0.5, 1.0)
+
+class _StubObjC:
+    """Answers any Objective-C call chain; numbers look like an iPhone 14 Pro Max."""
+    top, left, bottom, right = 59.0, 0.0, 34.0, 0.0
+
+    def __init__(self, calls):
+        self._calls = calls
+
+    def __getattr__(self, name):
+        def send(*args):
+            self._calls['objc.' + name] += 1
+            return _StubObjC(self._calls)
+        return send
+
+    def __float__(self):
+        return 3.0
+
+def stand_in_modules(calls=None):
+    """Stand-in ``ui``, ``console``, ``objc_util`` and ``dialogs`` modules that only count calls.
+
+    Returns ``(modules, calls)``: ``UIBackend(modules['ui'])`` then drives the
+    renderer's full Python-side work on Linux, with ``calls`` (a ``Counter``)
+    recording every draw call it would have made.
+    """
+    import types
+    calls = Counter() if calls is None else calls
+
+    def recorder(name, result=None):
+        def call(*args, **kwargs):
+            calls[name] += 1
+            return result
+        return call
+
+    class Path:
+        line_width, line_cap_style, line_join_style = 1.0, 0, 0
+        move_to, line_to = recorder('Path.move_to'), recorder('Path.line_to')
+        add_arc, add_curve = recorder('Path.add_arc'), recorder('Path.add_curve')
+        close, stroke, fill = recorder('Path.close'), recorder('Path.stroke'), recorder('Path.fill')
+
+        def __init__(self):
+            calls['Path'] += 1
+
+        @classmethod
+        def rect(cls, x, y, w, h):
+            return cls()
+
+    class Image:
+        def __init__(self, w, h):
+            self.size = (w, h)
+        draw = recorder('Image.draw')
+
+        def to_png(self):
+            calls['Image.to_png'] += 1
+            return b''
+
+    class ImageContext:
+        def __init__(self, w, h, scale=0):
+            calls['ImageContext'] += 1
+            self.size = (w, h)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        def get_image(self):
+            return Image(*self.size)
+
+    class GState:
+        def __enter__(self):
+            calls['GState'] += 1
+
+        def __exit__(self, *exc):
+            pass
+
+    class Transform:
+        @classmethod
+        def scale(cls, sx, sy):
+            return cls()
+
+        @classmethod
+        def translation(cls, tx, ty):
+            return cls()
+
+        def concat(self, other):
+            return self
+
+    class View:
+        """Enough of ``ui.View`` / ``ui.Button`` for a :class:`FibPoster` to lay out and draw."""
+        def __init__(self, **attrs):
+            self.x = self.y = 0.0
+            self.width, self.height = BENCH_VIEW[:2]
+            self.subviews = []
+            for name, value in attrs.items():
+                setattr(self, name, value)
+
+        @property
+        def bounds(self):
+            return types.SimpleNamespace(x=0.0, y=0.0, width=self.width, height=self.height)
+
+        def add_subview(self, view):
+            self.subviews.append(view)
+
+        set_needs_display = recorder('View.set_needs_display')
+        size_to_fit, close, present = recorder('View.size_to_fit'), recorder('close'), recorder('present')
+
+    def measure_string(text, max_width=0, font=('<System>', 12), alignment=0, line_break_mode=0):
+        calls['measure_string'] += 1
+        return len(text) * font[1] * 0.55, font[1] * 1.2
+
+    ui_mod = types.ModuleType('ui')
+    ui_mod.__dict__.update(
+        Path=Path, Image=Image, ImageContext=ImageContext, GState=GState, measure_string=measure_string,
+        Transform=Transform, View=View, Button=View, concat_ctm=recorder('concat_ctm'),
+        set_color=recorder('set_color'), draw_string=recorder('draw_string'),
+        delay=recorder('delay'), cancel_delays=recorder('cancel_delays'),
+        ALIGN_LEFT=ALIGN_LEFT, ALIGN_CENTER=ALIGN_CENTER, ALIGN_RIGHT=ALIGN_RIGHT,
+        LINE_CAP_ROUND=LINE_CAP_ROUND, LINE_JOIN_ROUND=LINE_JOIN_ROUND)
+    console_mod = types.ModuleType('console')
+    for name in ('quicklook', 'open_in', 'hud_alert', 'show_activity', 'hide_activity', 'alert'):
+        setattr(console_mod, name, recorder('console.' + name))
+    objc_mod = types.ModuleType('objc_util')
+    objc_mod.on_main_thread = lambda fn: fn
+    objc_mod.ObjCClass = lambda name: _StubObjC(calls)
+    dialogs_mod = types.ModuleType('dialogs')
+    dialogs_mod.list_dialog = lambda title, items, **kw: items[0]
+    return {'ui': ui_mod, 'console': console_mod, 'objc_util': objc_mod, 'dialogs': dialogs_mod}, calls
+
+def _time_call(fn, repeat):
+    """``(median_ms, min_ms)`` of ``repeat`` calls to ``fn``."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    times.sort()
+    return times[len(times) // 2], times[0]
+
+def run_benchmarks(terms=(8, 12, 16), zooms=(1.0, 4.0, 16.0), scales=(1.0, 2.0, 4.0),
+                   backends=('ui', 'raster', 'svg'), repeat=5, log=None):
+    """Time every board stage and export; returns a JSON-ready dict.
+
+    Stages are drawn into a view-sized image (``BENCH_VIEW``) at each term
+    count and zoom, once per backend: ``ui`` is ``UIBackend`` over the
+    stand-in modules (Python-side cost plus draw-call counts), ``raster`` and
+    ``svg`` are the headless backends.  Exports render the 8-term board at
+    each scale.  Each result carries the median and best of ``repeat`` runs.
+    """
+    import datetime, platform, sys, tempfile
+    mods, calls = stand_in_modules()
+    saved = {name: sys.modules.get(name) for name in mods}
+    sys.modules.update(mods)  # _console() / _objc_util() now resolve to the stand-ins
+    results = []
+
+    def record(stage, fn, **params):
+        calls.clear()
+        fn()
+        counts = dict(calls)
+        median, best = _time_call(fn, repeat)
+        results.append(dict(stage=stage, median_ms=round(median, 4), min_ms=round(best, 4),
+                            calls=counts, **params))
+        if log is not None:
+            log(f'{stage:<18} {json.dumps(params, sort_keys=True):<72} {median:9.3f} ms')
+
+    import json
+    try:
+        vw, vh, st, sb = BENCH_VIEW
+        frame = type('Frame', (), {'width': vw, 'height': vh})()
+        record('safe_insets', lambda: (_ios_safe_insets(), _screen_scale()))
+        metrics = PlatformMetrics()
+        metrics.scale, metrics.insets  # warm: frames must not touch the bridge
+        record('platform_metrics', lambda: (metrics.scale, metrics.insets))
+        record('palette_ramp', lambda: palette_ramp(PALETTES[0], PALETTES[1]))
+        for n in terms:
+            tiling = get_tiling(n)
+            base = Map(frame, st, sb, tiling, scale=2.0)
+            record('build_spiral_points', lambda: build_spiral_points(base), terms=n)
+            record('arc_poly', lambda: [arc_poly(base, c, p, sw) for c, p, sw in tiling.spiral_arcs()],
+                   terms=n)
+            for zoom in zooms:
+                m = base.zoomed(zoom, clip=(0.0, 0.0, vw, vh))
+                for name in backends:
+                    backend = UIBackend(mods['ui']) if name == 'ui' else \
+                        RasterBackend() if name == 'raster' else SVGBackend()
+                    renderer = BoardRenderer(backend, PALETTES[0], BoardLayerCache(backend))
+                    vis = renderer.visible_window(m)
+                    params = dict(backend=name, terms=n, zoom=zoom, scale=m.scale)
+                    with backend.image_context(vw, vh, m.scale):
+                        record('squares', lambda: renderer.draw_squares(m, vis), **params)
+                        record('labels', lambda: renderer.draw_labels(m, vis), **params)
+                        record('grid', lambda: renderer.draw_grid(m, vis), **params)
+                        record('frame', lambda: renderer.draw_frame(m), **params)
+                        for p in BENCH_PROGRESS:
+                            record('spiral', lambda: renderer.draw_spiral(m, p), progress=p, **params)
+                        record('draw_board', lambda: renderer.draw_board(m), **params)
+                        record('draw_board_cached', lambda: renderer.draw_board(m, cached=True),
+                               **params)
+                        fade = PaletteTransition(PALETTES[0], PALETTES[1])
+                        fade.t = 0.5
+                        record('draw_board_fade', lambda: renderer.draw_board(m, cached=True, fade=fade),
+                               **params)
+        with tempfile.TemporaryDirectory() as tmp:
+            for scale in scales:
+                m = Map.for_board(DEFAULT_TILING, 20.0, scale)
+                ui_backend = UIBackend(mods['ui'])
+                record('export', lambda: ui_backend.encode(
+                    render_board_image(ui_backend, PALETTES[0], m)), backend='ui', scale=scale)
+                record('export', lambda: export_board(os.path.join(tmp, 'b.png'), scale=scale),
+                       backend='raster', scale=scale)
+            for fmt in VECTOR_BACKENDS:
+                record('export', lambda: export_board(os.path.join(tmp, 'b.' + fmt)), backend=fmt)
+    finally:
+        for name, mod in saved.items():
+            if mod is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = mod
+    return {'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                     'numpy': getattr(_numpy(), '__version__', None), 'repeat': repeat,
+                     'time': datetime.datetime.now().isoformat(timespec='seconds')},
+            'results': results}
+
+def _bench_key(result):
+    return tuple(sorted((k, v) for k, v in result.items()
+                        if k not in ('median_ms', 'min_ms', 'calls')))
+
+def compare_benchmarks(current, baseline, tolerance=0.25, floor_ms=0.05):
+    """Results at least ``tolerance`` slower than ``baseline`` (both ``run_benchmarks`` dicts).
+
+    Best-of-``repeat`` times are compared, being the least noisy.  Returns
+    ``[(result, baseline_ms, ratio)]``; timings under ``floor_ms`` are noise
+    and ignored.  Draw-call count changes are reported too.
+    """
+    base = {_bench_key(r): r for r in baseline['results']}
+    out = []
+    for r in current['results']:
+        b = base.get(_bench_key(r))
+        if b is None:
+            continue
+        ratio = r['min_ms'] / max(b['min_ms'], 1e-9)
+        if (ratio > 1.0 + tolerance and r['min_ms'] > floor_ms) or r['calls'] != b['calls']:
+            out.append((r, b['min_ms'], ratio))
+    return out
+
+STARTUP_LAZY_MODULES = ('numpy', 'datetime', 'argparse', 'console', 'objc_util', 'dialogs')
+_TRIG_FUNCTIONS = ('sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'atan2')
+
+class _CountingMath:
+    """Stands in for ``math`` in a module, counting trigonometric calls into ``calls``."""
+    def __init__(self, calls):
+        self._counted = {}
+        for name in _TRIG_FUNCTIONS:
+            def counted(*args, _fn=getattr(math, name), _key='math.' + name):
+                calls[_key] += 1
+                return _fn(*args)
+            self._counted[name] = counted
+
+    def __getattr__(self, name):
+        return self._counted.get(name) or getattr(math, name)
+
+def _startup_probe(t0):
+    """Child side of :func:`measure_startup`: prints one JSON line of measurements."""
+    import importlib.util, json, sys
+    report = {'import_ms': (time.perf_counter() - t0) * 1e3,
+              'imported': [name for name in STARTUP_LAZY_MODULES if name in sys.modules]}
+    # A second copy of the module built against the stand-ins, so FibPoster is a view
+    mods, calls = stand_in_modules()
+    sys.modules.update(mods)
+    spec = importlib.util.spec_from_file_location('fibonacci_demo_view', __file__)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    mod.math = _CountingMath(calls)
+    report['cached'] = mod.geometry_cache() is not None
+    t = time.perf_counter()
+    view = mod.FibPoster()
+    view.layout()
+    report['view_ms'] = (time.perf_counter() - t) * 1e3
+    calls.clear()
+    t = time.perf_counter()
+    view.draw()
+    report['first_frame_ms'] = (time.perf_counter() - t) * 1e3
+    report['trig'] = sum(calls['math.' + name] for name in _TRIG_FUNCTIONS)
+    report['measure_string'] = calls['measure_string']
+    view._step_animation(view.anim_start + view.anim_duration)  # a cacheless launch now writes one
+    print(json.dumps(report))
+
+def measure_startup(runs=5, log=print):
+    """Time fresh interpreters from import to the first frame, without and with the geometry cache.
+
+    Each launch runs a copy of this file in a temporary folder: it imports
+    the module, then builds and lays out a :class:`FibPoster` over the
+    stand-in modules and draws its first frame.  The ``cold`` launches start
+    without a geometry cache (each writes one once its draw-in finishes); the
+    ``cached`` ones map it.  Returns ``{case: medians}`` including the
+    trigonometric and ``measure_string`` calls the first frame made and any
+    lazily imported module that import loaded anyway.
+    """
+    import json, shutil, statistics, subprocess, sys, tempfile
+    name = os.path.splitext(os.path.basename(__file__))[0]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copyfile(os.path.abspath(__file__), os.path.join(tmp, name + '.py'))
+        cache = os.path.join(tmp, GEOMETRY_CACHE_FILE)
+        code = (f'import sys, time; t0 = time.perf_counter(); sys.path.insert(0, {tmp!r}); '
+                f'import {name}; {name}._startup_probe(t0)')
+        for case in ('cold', 'cached'):
+            reports = []
+            for _ in range(runs):
+                if case == 'cold' and os.path.exists(cache):
+                    os.remove(cache)
+                out = subprocess.run([sys.executable, '-c', code], cwd=tmp, check=True,
+                                     capture_output=True, text=True).stdout
+                reports.append(json.loads(out.splitlines()[-1]))
+            summary = {key: round(statistics.median(r[key] for r in reports), 3)
+                       for key in ('import_ms', 'view_ms', 'first_frame_ms', 'trig', 'measure_string')}
+            summary['imported'] = sorted({m for r in reports for m in r['imported']})
+            summary['cached'] = all(r['cached'] for r in reports)
+            results[case] = summary
+            if log is not None:
+                log(f'{case:<7} import {summary["import_ms"]:7.2f} ms   view {summary["view_ms"]:6.2f} ms   '
+                    f'first frame {summary["first_frame_ms"]:6.2f} ms   trig {summary["trig"]:g}   '
+                    f'measure_string {summary["measure_string"]:g}   '
+                    f'eager: {", ".join(summary["imported"]) or "none"}')
+    return results
+
+def main(argv=None):
+    import sys
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:  # a plain launch (Pythonista's run button) needs no argument parsing
+        FibPoster().present('fullscreen', hide_title_bar=True)
+        return
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='fibonacci_demo.py',
+        description='Fibonacci poster: the Pythonista viewer, or headless exports.')
+    parser.add_argument('--bench-tiling', action='store_true',
+                        help='print tiling generation time per term count')
+    sub = parser.add_subparsers(dest='command')
+    cat = sub.add_parser('export', help='render a catalogue of boards on all cores')
+    cat.add_argument('out_dir')
+    cat.add_argument('--palettes', nargs='+', metavar='NAME',
+                     help='palette names (default: all of %s)' % ', '.join(p['name'] for p in PALETTES))
+    cat.add_argument('--scales', nargs='+', type=float, default=list(CATALOGUE_SCALES))
+    cat.add_argument('--formats', nargs='+', choices=CATALOGUE_FORMATS, default=list(CATALOGUE_FORMATS))
+    cat.add_argument('--terms', nargs='+', type=int, default=list(CATALOGUE_TERMS))
+    cat.add_argument('-k', type=float, default=20.0, help='points per grid unit')
+    cat.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPUs)')
+    cat.add_argument('--force', action='store_true', help='re-render even unchanged outputs')
+    bench = sub.add_parser('bench', help='time every render stage and export')
+    bench.add_argument('--json', metavar='PATH', help='write results as JSON ("-" for stdout)')
+    bench.add_argument('--compare', metavar='BASELINE', help='fail on regressions against a JSON run')
+    bench.add_argument('--tolerance', type=float, default=0.25,
+                       help='allowed slowdown before a stage counts as regressed (default 0.25)')
+    bench.add_argument('--repeat', type=int, default=5)
+    bench.add_argument('--quick', action='store_true', help='8 terms, two zoom levels only')
+    startup = sub.add_parser('startup', help='time fresh launches up to the first frame, '
+                                             'without and with the geometry cache')
+    startup.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--hud', action='store_true',
+                        help='show the frame-time overlay (tap it to save a CSV)')
+    args = parser.parse_args(argv)
+
+    if args.bench_tiling:
+        bench_tiling()
+    elif args.command == 'bench':
+        import json, sys
+        kw = dict(terms=(8,), zooms=(1.0, 4.0), scales=(1.0, 2.0)) if args.quick else {}
+        quiet = args.json == '-'
+        report = run_benchmarks(repeat=args.repeat, log=None if quiet else print, **kw)
+        if args.json:
+            text = json.dumps(report, indent=1, sort_keys=True)
+            if quiet:
+                print(text)
+            else:
+                with open(args.json, 'w') as f:
+                    f.write(text)
+        if args.compare:
+            with open(args.compare) as f:
+                regressions = compare_benchmarks(report, json.load(f), args.tolerance)
+            for r, was, ratio in regressions:
+                params = ' '.join(f'{k}={v}' for k, v in _bench_key(r) if k != 'stage')
+                print(f'REGRESSION {r["stage"]} [{params}]: {was:.3f} -> {r["min_ms"]:.3f} ms '
+                      f'(x{ratio:.2f})', file=sys.stderr)
+            sys.exit(1 if regressions else 0)
+    elif args.command == 'startup':
+        measure_startup(args.runs)
+    elif args.command == 'export':
+        by_name = {p['name'].lower(): p for p in PALETTES}
+        palettes = None
+        if args.palettes:
+            unknown = [n for n in args.palettes if n.lower() not in by_name]
+            if unknown:
+                parser.error('unknown palette: ' + ', '.join(unknown))
+            palettes = [by_name[n.lower()] for n in args.palettes]
+        jobs = catalogue_jobs(palettes, args.scales, args.formats, args.terms, args.k)
+        batch_export(args.out_dir, jobs, workers=args.jobs, force=args.force)
+    else:
+        FibPoster(instrument=args.hud).present('fullscreen', hide_title_bar=True)
+
 if __name__ == '__main__':
-    FibPoster().present('fullscreen', hide_title_bar=True)
+    main()
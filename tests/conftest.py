@@ -0,0 +1,20 @@
+"""Shared fixtures: make ``fibonacci_demo`` importable and run tests with and without NumPy."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import fibonacci_demo as fd  # noqa: E402
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def numpy_mode(request, monkeypatch):
+    """Run a test once on the pure-Python paths and once on the NumPy ones."""
+    if request.param == 'numpy':
+        if fd._numpy() is None:
+            pytest.skip('NumPy not installed')
+    else:
+        monkeypatch.setattr(fd, '_NUMPY_LOOKED_UP', True)
+        monkeypatch.setattr(fd, 'np', None)
+    return request.param
@@ -0,0 +1,57 @@
+"""Animation frames, drawn incrementally and as encoded APNG/GIF files, match full renders."""
+import pytest
+
+import fibonacci_demo as fd
+
+
+def full_render(m, palette, progress):
+    return list(fd.render_board_image(fd.RasterBackend(), palette, m, progress).rows())
+
+
+@pytest.mark.parametrize('terms, k, scale', [(6, 6.0, 1.0), (7, 3.3, 1.5)])
+def test_frames_match_full_render(numpy_mode, terms, k, scale):
+    m = fd.Map.for_board(fd.get_tiling(terms), k, scale)
+    palette = fd.PALETTES[0]
+    frames = fd.render_spiral_frames(fd.RasterBackend(), palette, m, fd.animation_progresses(4, 2.0))
+    for progress, img in frames:
+        assert list(img.rows()) == full_render(m, palette, progress), progress
+
+
+def test_frames_match_full_render_deep_spiral():
+    if fd._numpy() is None:
+        pytest.skip('NumPy not installed')
+    m = fd.Map.for_board(fd.get_tiling(8), 20.0, 1.0)
+    palette = fd.PALETTES[1]
+    frames = fd.render_spiral_frames(fd.RasterBackend(), palette, m, fd.animation_progresses(10, 3.0))
+    for progress, img in frames:
+        assert list(img.rows()) == full_render(m, palette, progress), progress
+
+
+@pytest.mark.parametrize('ext, mode', [('png', 'RGBA'), ('gif', 'RGB')])
+@pytest.mark.parametrize('terms, k, scale', [(8, 20.0, 1.0), (7, 3.3, 1.5)])
+def test_encoded_frames_match_full_render(tmp_path, ext, mode, terms, k, scale):
+    Image = pytest.importorskip('PIL.Image')
+    if fd._numpy() is None:
+        pytest.skip('NumPy not installed')
+    path = str(tmp_path / f'spiral.{ext}')
+    fd.export_animation(path, terms=terms, k=k, scale=scale, fps=10, duration=1.0)
+    m = fd.Map.for_board(fd.get_tiling(terms), k, scale)
+    progresses = fd.animation_progresses(10, 1.0)
+    with Image.open(path) as im:
+        assert im.n_frames == len(progresses)
+        for i, progress in enumerate(progresses):
+            im.seek(i)
+            got = im.convert(mode).tobytes()
+            want = b''.join(full_render(m, fd.PALETTES[0], progress))
+            if mode == 'RGB':
+                want = bytes(b for j, b in enumerate(want) if j % 4 != 3)
+            assert got == want, i
+
+
+def test_changed_box(numpy_mode):
+    prev = [bytes(40)] * 5
+    rows = list(prev)
+    assert fd.changed_box(prev, rows) is None
+    rows[1] = bytes(8) + b'\x01' + bytes(31)
+    rows[3] = bytes(35) + b'\x02' + bytes(4)
+    assert fd.changed_box(prev, rows) == (2, 1, 9, 4)
@@ -0,0 +1,84 @@
+"""Sampled spiral chords stay within each output's arc tolerance (``ARC_TOLERANCE_PX``)."""
+import math
+
+import pytest
+
+import fibonacci_demo as fd
+
+TERMS = (1, 8, 20)
+SCALES = (1.0, 2.0, 4.0, 8.0)
+K = 20.0
+
+
+def mapper(terms, scale, eps):
+    m = fd.Map.for_board(fd.get_tiling(terms), K, scale)
+    m.tolerance = eps
+    return m
+
+
+def chord_errors(m, polylines):
+    """Worst chord error in device pixels, against the tiling's arcs in order."""
+    arcs = [(m.pt(cx, cy), r * m.k) for cx, cy, r, _, _ in m.tiling.arc_params]
+    worst, i = 0.0, 0
+    for pts in polylines:
+        for (x0, y0), (x1, y1) in zip(pts, pts[1:]):
+            # Advance to the arc both ends of this chord lie on
+            while True:
+                (px, py), r = arcs[i]
+                if all(abs(math.hypot(x - px, y - py) - r) < 1e-6 * max(1.0, r)
+                       for x, y in ((x0, y0), (x1, y1))):
+                    break
+                i += 1
+            mid = math.hypot((x0 + x1) / 2 - px, (y0 + y1) / 2 - py)
+            worst = max(worst, (r - mid) * m.scale)
+    return worst
+
+
+def subpaths(path):
+    out = []
+    for op in path.ops:
+        if op[0] == 'M':
+            out.append([op[1:]])
+        else:
+            out[-1].append(op[1:])
+    return out
+
+
+@pytest.mark.parametrize('output', sorted(fd.ARC_TOLERANCE_PX))
+@pytest.mark.parametrize('terms', TERMS)
+@pytest.mark.parametrize('scale', SCALES)
+def test_spiral_polyline_within_tolerance(numpy_mode, output, terms, scale):
+    eps = fd.ARC_TOLERANCE_PX[output]
+    m = mapper(terms, scale, eps)
+    path = fd.RasterBackend().path()
+    fd.add_spiral_polyline(path, m)
+    assert chord_errors(m, subpaths(path)) <= eps + 1e-9
+
+
+@pytest.mark.parametrize('output', sorted(fd.ARC_TOLERANCE_PX))
+@pytest.mark.parametrize('terms', TERMS)
+@pytest.mark.parametrize('scale', SCALES)
+def test_spiral_points_within_tolerance(numpy_mode, output, terms, scale):
+    eps = fd.ARC_TOLERANCE_PX[output]
+    m = mapper(terms, scale, eps)
+    if numpy_mode == 'numpy':
+        pts = fd.spiral_points_np(m).tolist()
+    else:
+        pts = fd.build_spiral_points(m)
+    assert chord_errors(m, [pts]) <= eps + 1e-9
+
+
+@pytest.mark.parametrize('output', sorted(fd.ARC_TOLERANCE_PX))
+@pytest.mark.parametrize('scale', SCALES)
+def test_native_arcs_flattened_to_tolerance(output, scale):
+    """Headless backends flatten the default (native arc) spiral to the map's tolerance."""
+    eps = fd.ARC_TOLERANCE_PX[output]
+    m = mapper(8, scale, eps)
+    backend = fd.RasterBackend()
+    strokes = []
+    backend._stroke = strokes.append
+    fd.BoardRenderer(backend, fd.PALETTES[0]).draw_spiral(m)
+    (path,) = strokes
+    assert path.tolerance == eps
+    polylines = path.subpaths(tolerance=path.tolerance / m.scale)
+    assert chord_errors(m, polylines) <= eps + 1e-9